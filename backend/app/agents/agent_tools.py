@@ -13,6 +13,8 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 import logging
 
+from .base import ADDRESS_RE
+
 logger = logging.getLogger(__name__)
 
 
@@ -139,7 +141,7 @@ class ValidateAddressTool(BaseTool):
         """Synchronous execution"""
         try:
             # Basic validation
-            if address.startswith("0x") and len(address) == 42:
+            if ADDRESS_RE.fullmatch(address):
                 return f"Valid Ethereum address: {address}"
             return f"Invalid Ethereum address: {address}"
         except Exception as e:
@@ -16,12 +16,25 @@ from langchain_core.messages.ai import AIMessage
 from langchain_core.messages.system import SystemMessage
 from langchain_core.prompts.chat import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.tools.base import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+from functools import lru_cache
 import logging
+import re
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Hex EVM address; use with fullmatch (match would accept a trailing newline)
+ADDRESS_RE = re.compile(r"0x[0-9a-fA-F]{40}")
+
+
+@lru_cache(maxsize=32)
+def _format_system_prompt(system_prompt: str, tool_names: str) -> str:
+    """Fill the {tool_names} placeholder; agents with the same config share the result"""
+    if "{tool_names}" in system_prompt:
+        return system_prompt.replace("{tool_names}", tool_names)
+    return system_prompt
+
 
 class AgentConfig(BaseModel):
     """Configuration for agent initialization"""
@@ -34,7 +47,14 @@ class AgentConfig(BaseModel):
 
 
 class DecisionContext(BaseModel):
-    """Context for agent decision-making"""
+    """
+    Context for agent decision-making.
+    
+    Frozen: one instance is shared by every step of a workflow, and
+    variants are derived with model_copy(update=...).
+    """
+    model_config = ConfigDict(frozen=True)
+    
     user_id: str
     wallet_address: Optional[str] = None
     request: str
@@ -111,8 +131,7 @@ class BaseAgent(ABC):
         system_prompt = self.get_system_prompt()
         
         # Format the system prompt with tool names if it has the placeholder
-        if "{tool_names}" in system_prompt:
-            system_prompt = system_prompt.replace("{tool_names}", tool_names)
+        system_prompt = _format_system_prompt(system_prompt, tool_names)
         
         # Create prompt template
         self.prompt = ChatPromptTemplate.from_messages([
@@ -273,7 +292,7 @@ Format your response with proper markdown for readability."""
                 success=True,
                 result={
                     "response": final_output,
-                    "context": context.dict(),
+                    "context": context.model_dump(),
                     "tool_calls": tool_calls_made
                 },
                 reasoning=reasoning,
@@ -16,6 +16,8 @@ from langchain_core.tools import BaseTool
 from pydantic import BaseModel, Field
 from enum import Enum
 import logging
+import time
+from contextlib import asynccontextmanager
 from datetime import datetime
 import aiohttp
 
@@ -24,94 +26,7 @@ from .base import BaseAgent, AgentConfig, DecisionContext, AgentResponse
 logger = logging.getLogger(__name__)
 
 
-class APIProvider(str, Enum):
-    """Supported external API providers"""
-    GROQ = "groq"
-    GOOGLE_AI_STUDIO = "google_ai_studio"
-    CHAINLINK = "chainlink"
-    CUSTOM = "custom"
-    IPFS = "ipfs"
-
-
-class CommunicationType(str, Enum):
-    """Types of communications"""
-    API_CALL = "api_call"
-    DATA_PURCHASE = "data_purchase"
-    ORACLE_QUERY = "oracle_query"
-    AGENT_TO_AGENT = "agent_to_agent"
-    SERVICE_DISCOVERY = "service_discovery"
-
-
-class APIRequest(BaseModel):
-    """External API request specification"""
-    provider: APIProvider
-    endpoint: str
-    method: str = Field(default="GET", description="HTTP method")
-    headers: Dict[str, str] = Field(default_factory=dict)
-    params: Dict[str, Any] = Field(default_factory=dict)
-    body: Optional[Dict[str, Any]] = None
-    requires_payment: bool = Field(default=False)
-    payment_amount: Optional[float] = None
-    timeout: int = Field(default=30)
-
-
-class APIResponse(BaseModel):
-    """External API response"""
-    success: bool
-    status_code: Optional[int] = None
-    data: Any = None
-    error: Optional[str] = None
-    cost: Optional[float] = None
-    response_time: Optional[float] = None
-    quality_score: Optional[float] = None  # 0-1 score of data quality
-
-
-class InterAgentMessage(BaseModel):
-    """Message for agent-to-agent communication"""
-    from_agent: str
-    to_agent: str
-    message_type: str
-    payload: Dict[str, Any]
-    requires_response: bool = Field(default=False)
-    payment_required: Optional[float] = None
-    timestamp: datetime = Field(default_factory=datetime.utcnow)
-
-
-class CommunicatorAgent(BaseAgent):
-    """
-    Communicator Agent for external API and inter-agent interactions.
-    
-    Uses LangChain and HTTP clients to:
-    1. Call external APIs (Groq, Google, custom)
-    2. Handle API payment automation
-    3. Query blockchain oracles
-    4. Facilitate agent-to-agent communication
-    5. Verify data quality
-    6. Manage authentication
-    """
-    
-    def __init__(
-        self,
-        llm: BaseChatModel,
-        tools: List[BaseTool],
-        config: Optional[AgentConfig] = None,
-        memory_service: Optional[Any] = None,
-        payment_service: Optional[Any] = None
-    ):
-        if config is None:
-            config = AgentConfig(
-                agent_type="communicator",
-                temperature=0.5,
-                max_iterations=8
-            )
-        
-        super().__init__(llm, tools, config, memory_service)
-        self.payment_service = payment_service
-        self.session: Optional[aiohttp.ClientSession] = None
-    
-    def get_system_prompt(self) -> str:
-        """System prompt for the Communicator agent"""
-        return """You are the Communicator Agent in the WalletMind AI Autonomous Wallet System.
+_COMMUNICATOR_SYSTEM_PROMPT = """You are the Communicator Agent in the WalletMind AI Autonomous Wallet System.
 
 Your role is to MANAGE ALL EXTERNAL COMMUNICATIONS and API interactions.
 
@@ -219,6 +134,97 @@ Always return APIResponse with:
 - error: Error message if failed
 
 Be efficient, secure, and cost-conscious in all API interactions."""
+
+
+class APIProvider(str, Enum):
+    """Supported external API providers"""
+    GROQ = "groq"
+    GOOGLE_AI_STUDIO = "google_ai_studio"
+    CHAINLINK = "chainlink"
+    CUSTOM = "custom"
+    IPFS = "ipfs"
+
+
+class CommunicationType(str, Enum):
+    """Types of communications"""
+    API_CALL = "api_call"
+    DATA_PURCHASE = "data_purchase"
+    ORACLE_QUERY = "oracle_query"
+    AGENT_TO_AGENT = "agent_to_agent"
+    SERVICE_DISCOVERY = "service_discovery"
+
+
+class APIRequest(BaseModel):
+    """External API request specification"""
+    provider: APIProvider
+    endpoint: str
+    method: str = Field(default="GET", description="HTTP method")
+    headers: Dict[str, str] = Field(default_factory=dict)
+    params: Dict[str, Any] = Field(default_factory=dict)
+    body: Optional[Dict[str, Any]] = None
+    requires_payment: bool = Field(default=False)
+    payment_amount: Optional[float] = None
+    timeout: int = Field(default=30)
+
+
+class APIResponse(BaseModel):
+    """External API response"""
+    success: bool
+    status_code: Optional[int] = None
+    data: Any = None
+    error: Optional[str] = None
+    cost: Optional[float] = None
+    response_time: Optional[float] = None
+    quality_score: Optional[float] = None  # 0-1 score of data quality
+
+
+class InterAgentMessage(BaseModel):
+    """Message for agent-to-agent communication"""
+    from_agent: str
+    to_agent: str
+    message_type: str
+    payload: Dict[str, Any]
+    requires_response: bool = Field(default=False)
+    payment_required: Optional[float] = None
+    timestamp: datetime = Field(default_factory=datetime.utcnow)
+
+
+class CommunicatorAgent(BaseAgent):
+    """
+    Communicator Agent for external API and inter-agent interactions.
+    
+    Uses LangChain and HTTP clients to:
+    1. Call external APIs (Groq, Google, custom)
+    2. Handle API payment automation
+    3. Query blockchain oracles
+    4. Facilitate agent-to-agent communication
+    5. Verify data quality
+    6. Manage authentication
+    """
+    
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        tools: List[BaseTool],
+        config: Optional[AgentConfig] = None,
+        memory_service: Optional[Any] = None,
+        payment_service: Optional[Any] = None
+    ):
+        if config is None:
+            config = AgentConfig(
+                agent_type="communicator",
+                temperature=0.5,
+                max_iterations=8
+            )
+        
+        super().__init__(llm, tools, config, memory_service)
+        self.payment_service = payment_service
+        self.session: Optional[aiohttp.ClientSession] = None
+        self._owns_session = False
+    
+    def get_system_prompt(self) -> str:
+        """System prompt for the Communicator agent"""
+        return _COMMUNICATOR_SYSTEM_PROMPT
     
     async def formulate_clarifying_question(
         self,
@@ -319,15 +325,33 @@ The question should be concise and easy to understand.
         is_clear = len(missing) == 0
         return is_clear, missing
     
+    def set_session(self, session: Optional[aiohttp.ClientSession]):
+        """Use a shared HTTP session owned by the caller (None to detach)"""
+        self.session = session
+        self._owns_session = False
+    
+    @asynccontextmanager
+    async def _session_scope(self):
+        """Yield the shared session if one is open, else a throwaway one"""
+        if self.session is not None and not self.session.closed:
+            yield self.session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
+    
     async def __aenter__(self):
         """Setup async HTTP session"""
-        self.session = aiohttp.ClientSession()
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession()
+            self._owns_session = True
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Cleanup async HTTP session"""
-        if self.session:
+        """Cleanup async HTTP session (only if this agent created it)"""
+        if self.session and self._owns_session:
             await self.session.close()
+            self.session = None
+            self._owns_session = False
     
     async def call_api(
         self,
@@ -348,7 +372,7 @@ The question should be concise and easy to understand.
         """
         logger.info(f"Calling API: {request.provider.value}/{request.endpoint}")
         
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         
         try:
             # Step 1: Handle payment if required
@@ -376,7 +400,7 @@ The question should be concise and easy to understand.
             # Step 3: Verify response quality
             quality_score = self._assess_quality(response_data, request)
             
-            response_time = (datetime.utcnow() - start_time).total_seconds()
+            response_time = time.monotonic() - start_time
             
             return APIResponse(
                 success=True,
@@ -392,7 +416,7 @@ The question should be concise and easy to understand.
             return APIResponse(
                 success=False,
                 error=str(e),
-                response_time=(datetime.utcnow() - start_time).total_seconds()
+                response_time=time.monotonic() - start_time
             )
     
     async def purchase_data(
@@ -487,7 +511,7 @@ The question should be concise and easy to understand.
             if payment_result.get("status") != "success":
                 return APIResponse(success=False, error="Payment failed")
         # Send message (simulate HTTP POST)
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             async with session.post(endpoint, json=message.payload) as resp:
                 data = await resp.json()
         return APIResponse(success=True, data=data)
@@ -544,7 +568,7 @@ The question should be concise and easy to understand.
     async def _make_http_request(self, request: APIRequest) -> Dict[str, Any]:
         """Execute HTTP request"""
         try:
-            async with aiohttp.ClientSession() as session:
+            async with self._session_scope() as session:
                 async with session.request(
                     method=request.method,
                     url=request.endpoint,
@@ -10,18 +10,134 @@ Responsibilities:
 - Multi-network support
 """
 
-from typing import List, Dict, Any, Optional
+from typing import AsyncContextManager, Awaitable, Callable, List, Dict, Any, Optional, Tuple
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from eth_utils import is_checksum_address
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from enum import Enum
+from dataclasses import dataclass, field
+from contextlib import asynccontextmanager
+import asyncio
+import functools
 import logging
+import random
+import time
 from datetime import datetime
+from decimal import Decimal
 
-from .base import BaseAgent, AgentConfig, DecisionContext, AgentResponse
+from .base import ADDRESS_RE, BaseAgent, AgentConfig, DecisionContext, AgentResponse
 
 logger = logging.getLogger(__name__)
 
+# Retry backoff: base delay per error class adapts between retries.
+# Each entry is (alpha_commit, alpha_abort); contention-prone classes
+# grow faster on abort. Nonce and underpriced errors retry immediately
+# with a fix applied, so they have no entry.
+_BACKOFF_POLICY: Dict[str, tuple[float, float]] = {
+    "rate_limit": (0.1, 0.5),
+    "transient": (0.1, 0.3),
+}
+_BACKOFF_BASE_DELAY = 1.0  # Seconds
+_BACKOFF_MIN_DELAY = 0.1
+_BACKOFF_MAX_DELAY = 30.0
+
+# Backoff ceiling per attempt (seconds, at the default base delay); the
+# actual wait is drawn uniformly from [0, ceiling] ("full jitter")
+_BACKOFF_SCHEDULE = (1.0, 2.0, 4.0, 8.0, 16.0, 30.0)
+
+# Retry error classes (lowercase substrings), first match wins; anything
+# unmatched is transient
+_ERROR_TABLE = (
+    (("insufficient funds", "gas required exceeds", "intrinsic gas too low",
+      "invalid address", "revert"), "unrecoverable"),
+    (("nonce too low",), "nonce"),
+    (("underpriced", "replacement fee too low"), "underpriced"),
+    (("429", "rate limit"), "rate_limit"),
+)
+
+
+def _classify_error(error: str) -> str:
+    """Map an execution error message to a retry class"""
+    error = error.lower()
+    for markers, error_class in _ERROR_TABLE:
+        if any(marker in error for marker in markers):
+            return error_class
+    return "transient"
+
+
+# Decision logging is batched: flush after this many seconds or decisions
+_DECISION_FLUSH_INTERVAL = 0.25
+_DECISION_BATCH_SIZE = 32
+
+_WEI_PER_ETH = Decimal(10**18)
+_ONE_WEI = Decimal(1)
+
+# Nonces handed out locally before resyncing with the chain
+_NONCE_CONTINGENT_SIZE = 32
+
+
+_EXECUTOR_SYSTEM_PROMPT = """You are the Executor Agent in the WalletMind AI Autonomous Wallet System.
+
+Your role is to EXECUTE BLOCKCHAIN TRANSACTIONS safely and efficiently using real blockchain operations.
+
+CRITICAL: You have access to the 'execute_blockchain_transaction' tool which performs REAL transactions on the blockchain. You MUST use this tool to execute transactions - never return mock or placeholder data.
+
+RESPONSIBILITIES:
+1. Execute approved transaction plans from the Planner Agent using the execute_blockchain_transaction tool
+2. Parse transaction requests to extract: recipient address, amount in ETH, and network
+3. Call execute_blockchain_transaction with the correct parameters
+4. Return the ACTUAL transaction hash, gas used, and receipt from the blockchain
+5. Handle any errors returned by the tool
+
+EXECUTION WORKFLOW:
+1. Receive approved transaction plan from Planner
+2. Extract recipient address (must be valid Ethereum address starting with 0x)
+3. Extract amount in ETH (e.g., 0.005)
+4. Determine network (sepolia, polygon_amoy, or base_goerli)
+5. Call execute_blockchain_transaction tool with these parameters
+6. Tool will handle: gas estimation, signing, submission, and confirmation
+7. Return the tool's response which contains REAL blockchain data
+
+IMPORTANT - NEVER FABRICATE DATA:
+- DO NOT return placeholder transaction hashes like "0x1234567890abcdef..."
+- DO NOT make up block numbers like "12345"
+- DO NOT return mock gas values like "20000"
+- ALWAYS use the execute_blockchain_transaction tool for real transactions
+- Return the EXACT response from the tool, which contains real blockchain data
+
+EXAMPLE FLOW:
+User request: "send 0.005 ETH to 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb27"
+1. Extract: to_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb27", amount_eth=0.005, network="sepolia"
+2. Call: execute_blockchain_transaction(to_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb27", amount_eth=0.005, network="sepolia")
+3. Wait for tool response with REAL transaction data
+4. Return the tool's response verbatim
+
+ERROR HANDLING:
+- If tool returns error: Report it clearly to the user
+- If address is invalid: Tool will reject it - explain to user
+- If insufficient balance: Tool will report it - suggest checking balance
+- If network error: Tool will timeout - suggest retrying
+
+TRANSACTION VERIFICATION:
+- Tool returns actual tx hash that can be verified on blockchain explorer
+- Tool returns real block number from blockchain
+- Tool returns actual gas used from receipt
+- Tool returns real contract addresses (or null for simple transfers)
+
+OUTPUT FORMAT:
+Return the JSON response from the execute_blockchain_transaction tool, which includes:
+- success: boolean
+- transaction_hash: Real blockchain transaction hash
+- gas_used: Actual gas consumed
+- status: CONFIRMED, SUBMITTED, or FAILED
+- receipt: Full blockchain receipt with real data
+- from_address: Agent wallet address
+- to_address: Recipient address
+- amount_eth: Amount sent
+- network: Network used
+
+Be precise, secure, and use ONLY real blockchain data from the tools."""
 
 class NetworkType(str, Enum):
     """Supported blockchain networks"""
@@ -39,22 +155,140 @@ class TransactionStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+# Gas prices move per block; reuse a fetched price for about half a block
+_GAS_PRICE_TTLS: Dict[NetworkType, float] = {
+    NetworkType.SEPOLIA: 6.0,
+    NetworkType.POLYGON_AMOY: 1.0,
+    NetworkType.BASE_GOERLI: 1.0,
+}
+_GAS_PRICE_DEFAULT_TTL = 2.0
+
+# Average block times (seconds); confirmation polling settles at one poll per block
+_BLOCK_TIMES: Dict[NetworkType, float] = {
+    NetworkType.SEPOLIA: 12.0,
+    NetworkType.POLYGON_AMOY: 2.0,
+    NetworkType.BASE_GOERLI: 2.0,
+}
+_DEFAULT_BLOCK_TIME = 12.0
+
+# EIP-1559 fees: networks that accept type-2 transactions, and the
+# eth_feeHistory window (blocks, reward percentiles) the tip is derived from
+_EIP1559_NETWORKS = frozenset({NetworkType.SEPOLIA, NetworkType.POLYGON_AMOY, NetworkType.BASE_GOERLI})
+_FEE_HISTORY_BLOCKS = 20
+_FEE_HISTORY_PERCENTILES = (25, 75)
+_DEFAULT_PRIORITY_FEE = 1_500_000_000  # 1.5 gwei, when the history has no rewards
+
+
+def _fees_from_history(history: Dict[str, Any]) -> tuple[int, int]:
+    """
+    (maxFeePerGas, maxPriorityFeePerGas) from an eth_feeHistory response.
+    
+    The tip is the median over the window of each block's 25th/75th
+    percentile midpoint; the max fee leaves room for the next block's base
+    fee to double. Accepts raw (hex) and decoded (int) responses.
+    """
+    def to_int(value: Any) -> int:
+        return int(value, 16) if isinstance(value, str) else int(value)
+    
+    base_fee = to_int(history["baseFeePerGas"][-1])  # next block's base fee
+    rewards = sorted(
+        (to_int(block[0]) + to_int(block[-1])) // 2 for block in history.get("reward") or [] if block
+    )
+    tip = max(rewards[len(rewards) // 2], 1) if rewards else _DEFAULT_PRIORITY_FEE
+    return base_fee * 2 + tip, tip
+
+
+# Receipt polls before reaching block time: fast first, then back off
+_CONFIRMATION_POLL_SCHEDULE = (0.5, 1.0, 2.0, 4.0)
+
+# EIP-155 chain IDs keyed by executor network, built on first agent init
+_CHAIN_IDS: Optional[Dict[NetworkType, int]] = None
+
+
+def _chain_id_table() -> Dict[NetworkType, int]:
+    """EIP-155 chain ID per network, from the blockchain network registry"""
+    global _CHAIN_IDS
+    if _CHAIN_IDS is None:
+        from app.blockchain.networks import NETWORKS
+        _CHAIN_IDS = {NetworkType(net.value): config.chain_id for net, config in NETWORKS.items()}
+    return _CHAIN_IDS
+
+
+@dataclass
+class NonceContingent:
+    """
+    Block of nonces reserved for one sender.
+    
+    Nonces in [next, end) are handed out locally; next == end means the
+    contingent must be refilled from the pending transaction count.
+    """
+    next: int = 0
+    end: int = 0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    
+    def refill(self, chain_nonce: int):
+        """Start a new contingent, never going back below local state"""
+        self.next = max(chain_nonce, self.next)
+        self.end = self.next + _NONCE_CONTINGENT_SIZE
+
+
 class ExecutionPlan(BaseModel):
-    """Plan for executing a transaction"""
+    """
+    Plan for executing a transaction.
+    
+    Frozen (and therefore hashable): the executor derives filled-in
+    copies with model_copy(update=...) instead of mutating the caller's plan.
+    """
+    model_config = ConfigDict(frozen=True)
+    
     transaction_type: str = Field(..., description="Type of transaction")
     to_address: str = Field(..., description="Recipient address")
     amount: float = Field(..., description="Amount in ETH")
+    amount_wei: Optional[int] = Field(None, description="Exact amount in wei (takes precedence over amount)")
     network: NetworkType = Field(default=NetworkType.SEPOLIA)
     gas_limit: Optional[int] = Field(None, description="Gas limit")
     gas_price: Optional[int] = Field(None, description="Gas price in gwei")
+    max_fee_per_gas: Optional[int] = Field(None, description="EIP-1559 max fee per gas in wei (takes precedence over gas_price)")
+    max_priority_fee_per_gas: Optional[int] = Field(None, description="EIP-1559 priority fee per gas in wei")
     nonce: Optional[int] = Field(None, description="Transaction nonce")
     data: Optional[str] = Field(None, description="Transaction data for contract calls")
     max_retries: int = Field(default=3, description="Maximum retry attempts")
     timeout: int = Field(default=120, description="Timeout in seconds")
+    required_confirmations: int = Field(default=1, description="Blocks to wait for after inclusion")
+    
+    # Unsigned transaction body from the last construction, reused when a
+    # retry only changes the fee
+    _tx_body: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    # Retry-invariant part of the transaction (from, to, value, data,
+    # chainId); shared by the copies derived from this plan
+    _tx_base: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    # Hashes broadcast for this plan, oldest first; shared by the copies
+    # derived from it, so a caller that gives up can still report them
+    _submitted_hashes: List[str] = PrivateAttr(default_factory=list)
+    
+    # Wire-format value and calldata, converted once at construction
+    _value_wei: int = PrivateAttr(default=0)
+    _data_bytes: bytes = PrivateAttr(default=b"")
+    
+    def model_post_init(self, __context: Any) -> None:
+        # Decimal avoids float rounding in the ETH -> Wei conversion
+        if self.amount_wei is not None:
+            self._value_wei = self.amount_wei
+        else:
+            self._value_wei = int((Decimal(str(self.amount)) * _WEI_PER_ETH).quantize(_ONE_WEI))
+        data = self.data or "0x"
+        self._data_bytes = bytes.fromhex(data[2:] if data.startswith("0x") else data)
 
 
 class ExecutionResult(BaseModel):
-    """Result of transaction execution"""
+    """
+    Result of transaction execution.
+    
+    Built internally with model_construct (values come from trusted code,
+    so validation is skipped); model_dump() still works for serialization.
+    """
     success: bool
     transaction_hash: Optional[str] = None
     block_number: Optional[int] = None
@@ -65,6 +299,25 @@ class ExecutionResult(BaseModel):
     receipt: Optional[Dict[str, Any]] = None
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     execution_time: Optional[float] = None  # Seconds
+    
+    @classmethod
+    def failure(
+        cls,
+        error: str,
+        *,
+        tx_hash: Optional[str] = None,
+        receipt: Optional[Dict[str, Any]] = None,
+        execution_time: Optional[float] = None
+    ) -> "ExecutionResult":
+        """Build a FAILED result without validation (inputs are internal)"""
+        return cls.model_construct(
+            success=False,
+            transaction_hash=tx_hash,
+            status=TransactionStatus.FAILED,
+            error=error,
+            receipt=receipt,
+            execution_time=execution_time
+        )
 
 
 class ExecutorAgent(BaseAgent):
@@ -86,7 +339,8 @@ class ExecutorAgent(BaseAgent):
         tools: List[BaseTool],
         config: Optional[AgentConfig] = None,
         memory_service: Optional[Any] = None,
-        blockchain_service: Optional[Any] = None
+        blockchain_service: Optional[Any] = None,
+        distributed_lock: Optional[Callable[[str], AsyncContextManager]] = None
     ):
         if config is None:
             config = AgentConfig(
@@ -97,70 +351,48 @@ class ExecutorAgent(BaseAgent):
         
         super().__init__(llm, tools, config, memory_service)
         self.blockchain_service = blockchain_service
+        
+        # Optional cross-process lock factory: key -> async context manager
+        # (e.g. Redis SET NX EX), held together with the in-process sender lock
+        self.distributed_lock = distributed_lock
+        self._sender_locks: Dict[tuple[str, NetworkType], asyncio.Lock] = {}
+        
+        # Current base backoff delay per error class (see _BACKOFF_POLICY)
+        self._backoff_state: Dict[str, float] = {}
+        
+        # Gas price cache: network -> (price, monotonic expiry). While
+        # transactions keep arriving a background task refreshes it
+        self._gas_price_cache: Dict[NetworkType, tuple[int, float]] = {}
+        self._gas_refresh_tasks: Dict[NetworkType, asyncio.Task] = {}
+        self._recent_tx_count: Dict[NetworkType, int] = {}
+        self._gas_price_blocks: Dict[NetworkType, int] = {}
+        
+        # EIP-1559 fee cache: network -> ((max_fee, tip), monotonic expiry)
+        self._fee_cache: Dict[NetworkType, tuple[tuple[int, int], float]] = {}
+        
+        # Nonce contingents per (address, network), see NonceContingent
+        self._nonce_pools: Dict[tuple[str, NetworkType], NonceContingent] = {}
+        
+        # EIP-155 chain IDs for every network, so lookups are a plain dict index
+        self._chain_ids: Dict[NetworkType, int] = _chain_id_table()
+        
+        # Execute pipeline specialized per network (chain ID pre-bound)
+        self._pipeline: Dict[NetworkType, Callable[[ExecutionPlan, str, float], Awaitable[ExecutionResult]]] = {
+            network: functools.partial(self._run_pipeline, chain_id)
+            for network, chain_id in self._chain_ids.items()
+        }
+        
+        # Pending decision logs; the flush task is started on first use
+        self._decision_buffer: List[tuple[Dict[str, Any], str, NetworkType, asyncio.Future]] = []
+        self._decision_buffer_full = asyncio.Event()
+        self._decision_flush_task: Optional[asyncio.Task] = None
+        # Batches being uploaded/logged; each runs as its own task so a slow
+        # pin or on-chain call never holds up the next batch
+        self._decision_flushes: set[asyncio.Task] = set()
     
     def get_system_prompt(self) -> str:
         """System prompt for the Executor agent"""
-        return """You are the Executor Agent in the WalletMind AI Autonomous Wallet System.
-
-Your role is to EXECUTE BLOCKCHAIN TRANSACTIONS safely and efficiently using real blockchain operations.
-
-CRITICAL: You have access to the 'execute_blockchain_transaction' tool which performs REAL transactions on the blockchain. You MUST use this tool to execute transactions - never return mock or placeholder data.
-
-RESPONSIBILITIES:
-1. Execute approved transaction plans from the Planner Agent using the execute_blockchain_transaction tool
-2. Parse transaction requests to extract: recipient address, amount in ETH, and network
-3. Call execute_blockchain_transaction with the correct parameters
-4. Return the ACTUAL transaction hash, gas used, and receipt from the blockchain
-5. Handle any errors returned by the tool
-
-EXECUTION WORKFLOW:
-1. Receive approved transaction plan from Planner
-2. Extract recipient address (must be valid Ethereum address starting with 0x)
-3. Extract amount in ETH (e.g., 0.005)
-4. Determine network (sepolia, polygon_amoy, or base_goerli)
-5. Call execute_blockchain_transaction tool with these parameters
-6. Tool will handle: gas estimation, signing, submission, and confirmation
-7. Return the tool's response which contains REAL blockchain data
-
-IMPORTANT - NEVER FABRICATE DATA:
-- DO NOT return placeholder transaction hashes like "0x1234567890abcdef..."
-- DO NOT make up block numbers like "12345"
-- DO NOT return mock gas values like "20000"
-- ALWAYS use the execute_blockchain_transaction tool for real transactions
-- Return the EXACT response from the tool, which contains real blockchain data
-
-EXAMPLE FLOW:
-User request: "send 0.005 ETH to 0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb27"
-1. Extract: to_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb27", amount_eth=0.005, network="sepolia"
-2. Call: execute_blockchain_transaction(to_address="0x742d35Cc6634C0532925a3b844Bc9e7595f0bEb27", amount_eth=0.005, network="sepolia")
-3. Wait for tool response with REAL transaction data
-4. Return the tool's response verbatim
-
-ERROR HANDLING:
-- If tool returns error: Report it clearly to the user
-- If address is invalid: Tool will reject it - explain to user
-- If insufficient balance: Tool will report it - suggest checking balance
-- If network error: Tool will timeout - suggest retrying
-
-TRANSACTION VERIFICATION:
-- Tool returns actual tx hash that can be verified on blockchain explorer
-- Tool returns real block number from blockchain
-- Tool returns actual gas used from receipt
-- Tool returns real contract addresses (or null for simple transfers)
-
-OUTPUT FORMAT:
-Return the JSON response from the execute_blockchain_transaction tool, which includes:
-- success: boolean
-- transaction_hash: Real blockchain transaction hash
-- gas_used: Actual gas consumed
-- status: CONFIRMED, SUBMITTED, or FAILED
-- receipt: Full blockchain receipt with real data
-- from_address: Agent wallet address
-- to_address: Recipient address
-- amount_eth: Amount sent
-- network: Network used
-
-Be precise, secure, and use ONLY real blockchain data from the tools."""
+        return _EXECUTOR_SYSTEM_PROMPT
     
     async def log_decision_on_chain(
         self,
@@ -176,6 +408,10 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
         the risk analysis, and a timestamp. It then computes a Keccak-256 hash of this data
         and uploads the JSON object to IPFS, receiving a unique content identifier (CID) in return."
         
+        Decisions are buffered and flushed in batches (every
+        _DECISION_FLUSH_INTERVAL seconds or _DECISION_BATCH_SIZE decisions):
+        one IPFS upload per batch and one on-chain call per wallet/network.
+        
         Args:
             decision_data: Dictionary with transaction plan, risk analysis, timestamp
             agent_wallet_address: Address of the AgentWallet contract
@@ -186,40 +422,206 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
         """
         logger.info("Logging decision to IPFS and blockchain...")
         
+        if self._decision_flush_task is None or self._decision_flush_task.done():
+            self._decision_flush_task = asyncio.create_task(self._flush_decisions_loop())
+        
+        future = asyncio.get_running_loop().create_future()
+        self._decision_buffer.append((decision_data, agent_wallet_address, network, future))
+        if len(self._decision_buffer) >= _DECISION_BATCH_SIZE:
+            self._decision_buffer_full.set()
+        
+        return await future
+    
+    async def _flush_decisions_loop(self):
+        """Background task: flush buffered decisions on interval or when full"""
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._decision_buffer_full.wait(),
+                    timeout=_DECISION_FLUSH_INTERVAL
+                )
+            except asyncio.TimeoutError:
+                pass
+            
+            self._decision_buffer_full.clear()
+            self._start_decision_flush()
+    
+    def _start_decision_flush(self):
+        """Hand the buffered decisions to a tracked flush task"""
+        if not self._decision_buffer:
+            return
+        batch, self._decision_buffer = self._decision_buffer, []
+        task = asyncio.create_task(self._flush_decisions(batch))
+        self._decision_flushes.add(task)
+        task.add_done_callback(self._decision_flushes.discard)
+    
+    async def close(self):
+        """Stop background tasks, flushing any buffered decisions"""
+        for task in self._gas_refresh_tasks.values():
+            task.cancel()
+        self._gas_refresh_tasks.clear()
+        
+        if self._decision_flush_task is not None:
+            self._decision_flush_task.cancel()
+            try:
+                await self._decision_flush_task
+            except asyncio.CancelledError:
+                pass
+            self._decision_flush_task = None
+        
+        # Let in-flight batches finish instead of dropping them
+        self._start_decision_flush()
+        if self._decision_flushes:
+            await asyncio.gather(*self._decision_flushes)
+    
+    @staticmethod
+    def _encode_decisions(
+        ipfs_service: Any,
+        batch: List[tuple[Dict[str, Any], str, NetworkType, asyncio.Future]]
+    ) -> tuple[list, List[tuple[bytes, str, str]]]:
+        """The encodable part of a batch and its encodings; the rest fail now"""
+        kept, encoded = [], []
+        for item in batch:
+            try:
+                (entry,) = ipfs_service.encode_decisions([item[0]])
+            except Exception as e:
+                logger.error("Could not encode decision: %s", e)
+                if not item[3].done():
+                    item[3].set_result(("", "", False))
+                continue
+            kept.append(item)
+            encoded.append(entry)
+        return kept, encoded
+    
+    async def _flush_decisions(
+        self,
+        batch: List[tuple[Dict[str, Any], str, NetworkType, asyncio.Future]]
+    ):
+        """Upload a batch of decisions to IPFS and log them on-chain"""
         try:
-            # Step 1: Upload to IPFS
-            from app.storage.ipfs import get_ipfs_service
+            from app.storage.ipfs import get_ipfs_service, MAX_RAW_BLOCK_SIZE
             ipfs_service = get_ipfs_service()
             
-            ipfs_cid, decision_hash = await ipfs_service.upload_decision(decision_data)
-            logger.info(f"Decision uploaded to IPFS: CID={ipfs_cid}, Hash={decision_hash}")
+            # CIDs and hashes are derived locally from the canonical JSON, so
+            # the IPFS pin (Step 1) and logDecision (Step 2) run concurrently.
+            # Each decision is encoded on its own: one that cannot be encoded
+            # fails only its own caller
+            batch, encoded = self._encode_decisions(ipfs_service, batch)
+            if not batch:
+                return
+            payloads = [payload for payload, _, _ in encoded]
+            uploaded = [(ipfs_cid, decision_hash) for _, ipfs_cid, decision_hash in encoded]
+            
+            if any(len(payload) > MAX_RAW_BLOCK_SIZE for payload in payloads):
+                # Multi-block files have no locally computable CID: pin first
+                uploaded = await ipfs_service.upload_decisions([item[0] for item in batch])
+                pin = None
+            else:
+                pin = ipfs_service.pin_decisions(
+                    payloads,
+                    [decision_hash for _, decision_hash in uploaded]
+                )
+            
+            # Step 2: Call logDecision on AgentWallet contract, per wallet/network
+            groups: Dict[tuple[str, NetworkType], List[int]] = {}
+            for i, (_, wallet_address, network, _) in enumerate(batch):
+                groups.setdefault((wallet_address, network), []).append(i)
+            
+            chain_tasks = [
+                self._log_decisions_on_chain(
+                    wallet_address,
+                    [uploaded[i][1] for i in indices],
+                    [uploaded[i][0] for i in indices],
+                    network
+                )
+                for (wallet_address, network), indices in groups.items()
+            ]
+            
+            if pin is not None:
+                pinned, *chain_results = await asyncio.gather(
+                    pin, *chain_tasks, return_exceptions=True
+                )
+            else:
+                pinned = True
+                chain_results = await asyncio.gather(*chain_tasks, return_exceptions=True)
             
-            # Step 2: Call logDecision on AgentWallet contract
-            if self.blockchain_service:
-                tx_success = await self.blockchain_service.log_decision(
+            # Reconcile: the on-chain records reference CIDs that must be pinned
+            if pinned is not True:
+                logger.warning("IPFS pin failed (%s), retrying once", pinned)
+                pinned = await ipfs_service.pin_decisions(
+                    payloads,
+                    [decision_hash for _, decision_hash in uploaded]
+                )
+                if not pinned:
+                    logger.error(
+                        "Decisions logged on-chain but not pinned to IPFS: %s",
+                        [decision_hash for _, decision_hash in uploaded]
+                    )
+            
+            for indices, results in zip(groups.values(), chain_results):
+                if isinstance(results, Exception):
+                    logger.error("Error logging decisions on-chain: %s", results)
+                    # Keep the (pinned) hash and CID so the caller can record or retry them
+                    results = [False] * len(indices)
+                for i, tx_success in zip(indices, results):
+                    ipfs_cid, decision_hash = uploaded[i]
+                    future = batch[i][3]
+                    if not future.done():
+                        future.set_result((decision_hash, ipfs_cid, tx_success))
+                
+        except Exception as e:
+            logger.error("Error logging decisions: %s", e, exc_info=True)
+        
+        finally:
+            for item in batch:
+                if not item[3].done():
+                    item[3].set_result(("", "", False))
+    
+    async def _log_decisions_on_chain(
+        self,
+        agent_wallet_address: str,
+        decision_hashes: List[str],
+        ipfs_cids: List[str],
+        network: NetworkType
+    ) -> List[bool]:
+        """
+        Log decisions on-chain, with one call when the blockchain service
+        provides log_decision_batch(). Returns per-decision success.
+        """
+        if not self.blockchain_service:
+            logger.warning("Blockchain service not available, skipping on-chain logging")
+            return [False] * len(decision_hashes)
+        
+        log_decision_batch = getattr(self.blockchain_service, "log_decision_batch", None)
+        if log_decision_batch is not None:
+            tx_success = await log_decision_batch(
+                agent_wallet_address=agent_wallet_address,
+                decision_hashes=decision_hashes,
+                ipfs_cids=ipfs_cids,
+                network=network
+            )
+            results = [bool(tx_success)] * len(decision_hashes)
+        else:
+            results = []
+            for decision_hash, ipfs_cid in zip(decision_hashes, ipfs_cids):
+                results.append(bool(await self.blockchain_service.log_decision(
                     agent_wallet_address=agent_wallet_address,
                     decision_hash=decision_hash,
                     ipfs_cid=ipfs_cid,
                     network=network
-                )
-                
-                if tx_success:
-                    logger.info(f"Decision logged on-chain: {decision_hash}")
-                    return decision_hash, ipfs_cid, True
-                else:
-                    logger.error("Failed to log decision on-chain")
-                    return decision_hash, ipfs_cid, False
+                )))
+        
+        for decision_hash, tx_success in zip(decision_hashes, results):
+            if tx_success:
+                logger.info("Decision logged on-chain: %s", decision_hash)
             else:
-                logger.warning("Blockchain service not available, skipping on-chain logging")
-                return decision_hash, ipfs_cid, False
-                
-        except Exception as e:
-            logger.error(f"Error logging decision: {e}", exc_info=True)
-            return "", "", False
+                logger.error("Failed to log decision on-chain: %s", decision_hash)
+        
+        return results
     
     async def execute_transaction(
         self,
-        context: DecisionContext,
+        context: Optional[DecisionContext],
         plan: ExecutionPlan,
         wallet_address: str
     ) -> ExecutionResult:
@@ -227,88 +629,284 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
         Execute a blockchain transaction
         
         Args:
-            context: Decision context
+            context: Decision context (not used by execution; may be None)
             plan: Execution plan with transaction details
             wallet_address: Agent wallet address
         
         Returns:
             ExecutionResult with transaction receipt
         """
-        logger.info(f"Executing transaction: {plan.transaction_type} on {plan.network}")
+        result, _ = await self._execute_plan(plan, wallet_address)
+        return result
+    
+    async def _execute_plan(
+        self,
+        plan: ExecutionPlan,
+        wallet_address: str
+    ) -> Tuple[ExecutionResult, ExecutionPlan]:
+        """
+        Run the pipeline for a plan.
         
-        start_time = datetime.utcnow()
+        Returns the result together with the filled-in copy of the plan
+        (gas, nonce, cached transaction body) so retries can reuse it.
+        """
+        logger.info("Executing transaction: %s on %s", plan.transaction_type, plan.network)
+        
+        start_time = time.perf_counter()
+        return await self._pipeline[plan.network](plan, wallet_address, start_time)
+    
+    async def execute_batch(
+        self,
+        context: Optional[DecisionContext],
+        plans: List[ExecutionPlan],
+        wallet_address: str,
+        only_wait_for_last: bool = True
+    ) -> List[ExecutionResult]:
+        """
+        Execute a sequence of dependent transactions (e.g. approve + swap).
+        
+        Reserves contiguous nonces, signs and broadcasts every transaction
+        back-to-back, then waits for confirmation. Sequential nonces make
+        the chain apply them in order, so by default only the last receipt
+        is awaited; earlier transactions are reported as SUBMITTED.
+        
+        Args:
+            context: Decision context (not used by execution; may be None)
+            plans: Execution plans, in execution order, all on one network
+            wallet_address: Agent wallet address
+            only_wait_for_last: Set False to wait for every receipt
+        
+        Returns:
+            One ExecutionResult per plan, in the same order
+        """
+        if not plans:
+            return []
+        
+        network = plans[0].network
+        logger.info("Executing batch of %d transactions on %s", len(plans), network)
+        start_time = time.perf_counter()
+        
+        def failed(error: str) -> ExecutionResult:
+            return ExecutionResult.failure(error, execution_time=time.perf_counter() - start_time)
         
         try:
-            # Step 1: Validate inputs
-            self._validate_execution_plan(plan)
+            if any(plan.network != network for plan in plans):
+                raise ValueError("All plans in a batch must target the same network")
+            for plan in plans:
+                self._validate_execution_plan(plan)
             
-            # Step 2: Estimate gas
-            gas_estimate = await self._estimate_gas(plan, wallet_address)
-            if plan.gas_limit is None:
-                plan.gas_limit = int(gas_estimate * 1.2)  # 20% buffer
+            # Gas for every plan; no ordering constraint, so outside the lock
+            plans = list(await asyncio.gather(*(
+                self._prefetch_tx_params(plan, wallet_address, reserve_nonce=False) for plan in plans
+            )))
             
-            # Step 3: Get optimal gas price
-            if plan.gas_price is None:
-                plan.gas_price = await self._get_optimal_gas_price(plan.network)
-            
-            # Step 4: Get current nonce
-            if plan.nonce is None:
-                plan.nonce = await self._get_nonce(wallet_address, plan.network)
-            
-            # Step 5: Construct transaction
-            tx_data = self._construct_transaction(plan, wallet_address)
-            
-            # Step 6: Sign transaction
-            signed_tx = await self._sign_transaction(tx_data, wallet_address)
-            
-            # Step 7: Submit to network
-            tx_hash = await self._submit_transaction(signed_tx, plan.network)
-            logger.info(f"Transaction submitted: {tx_hash}")
-            
-            # Step 8: Wait for confirmation
-            receipt = await self._wait_for_confirmation(
-                tx_hash,
-                plan.network,
-                timeout=plan.timeout
-            )
-            
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
-            
-            if receipt and receipt.get("status") == 1:
-                return ExecutionResult(
+            async with self._sender_lock(wallet_address, network):
+                # Contiguous nonces, in plan order
+                for i, plan in enumerate(plans):
+                    if plan.nonce is None:
+                        nonce = await self._reserve_nonce(wallet_address, network)
+                        plans[i] = plan.model_copy(update={"nonce": nonce})
+                
+                chain_id = self._chain_ids[network]
+                tx_bodies = [
+                    self._construct_transaction(plan, wallet_address, chain_id) for plan in plans
+                ]
+                
+                signed_txs = await asyncio.gather(
+                    *(self._sign_transaction(tx_data, wallet_address) for tx_data in tx_bodies)
+                )
+                tx_hashes = await self._submit_transactions(list(signed_txs), network)
+        
+        except Exception as e:
+            logger.error("Batch execution failed: %s", e, exc_info=True)
+            self._invalidate_nonce(wallet_address, network)
+            return [failed(str(e)) for _ in plans]
+        
+        if any(isinstance(tx_hash, BaseException) for tx_hash in tx_hashes):
+            # A gap in the nonce sequence blocks everything after it
+            self._invalidate_nonce(wallet_address, network)
+        
+        results: List[Optional[ExecutionResult]] = [None] * len(plans)
+        to_confirm = []
+        for i, tx_hash in enumerate(tx_hashes):
+            if isinstance(tx_hash, BaseException):
+                results[i] = failed(str(tx_hash))
+            elif only_wait_for_last and i < len(plans) - 1:
+                results[i] = ExecutionResult.model_construct(
                     success=True,
                     transaction_hash=tx_hash,
-                    block_number=receipt.get("blockNumber"),
-                    gas_used=receipt.get("gasUsed"),
-                    effective_gas_price=receipt.get("effectiveGasPrice"),
-                    status=TransactionStatus.CONFIRMED,
-                    receipt=receipt,
-                    execution_time=execution_time
+                    status=TransactionStatus.SUBMITTED,
+                    execution_time=time.perf_counter() - start_time
                 )
             else:
-                return ExecutionResult(
-                    success=False,
-                    transaction_hash=tx_hash,
-                    status=TransactionStatus.FAILED,
-                    error="Transaction reverted on-chain",
-                    receipt=receipt,
-                    execution_time=execution_time
-                )
+                to_confirm.append(i)
+        
+        confirmed = await asyncio.gather(
+            *(self._confirm(tx_hashes[i], plans[i], start_time) for i in to_confirm),
+            return_exceptions=True
+        )
+        for i, result in zip(to_confirm, confirmed):
+            results[i] = failed(str(result)) if isinstance(result, BaseException) else result
+        
+        return results
+    
+    async def _run_pipeline(
+        self,
+        chain_id: int,
+        plan: ExecutionPlan,
+        wallet_address: str,
+        start_time: float
+    ) -> Tuple[ExecutionResult, ExecutionPlan]:
+        """Steps 1-8 of execute_transaction for a network with known chain ID"""
+        try:
+            # Step 1: Validate inputs
+            self._validate_execution_plan(plan)
+            
+            # Steps 2-3: Estimate gas and get optimal gas price, concurrently
+            plan = await self._prefetch_tx_params(plan, wallet_address, reserve_nonce=False)
+            
+            # Steps 4-7 run under the sender lock so nonces are submitted in order
+            async with self._sender_lock(wallet_address, plan.network):
+                # Step 4: Reserve nonce
+                if plan.nonce is None:
+                    nonce = await self._reserve_nonce(wallet_address, plan.network)
+                    plan = plan.model_copy(update={"nonce": nonce})
                 
+                # Step 5: Construct transaction
+                tx_data = self._construct_transaction(plan, wallet_address, chain_id)
+                plan._tx_body = tx_data
+                
+                # Steps 6-7: Sign and submit
+                tx_hash = await self._sign_and_submit(tx_data, plan, wallet_address)
+            
+            # Step 8: Wait for confirmation (outside the lock)
+            return await self._confirm(tx_hash, plan, start_time), plan
+        
         except Exception as e:
-            logger.error(f"Transaction execution failed: {str(e)}", exc_info=True)
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
+            logger.error("Transaction execution failed: %s", e, exc_info=True)
+            execution_time = time.perf_counter() - start_time
+            
+            # The reserved nonce may not have been used; resync on next call
+            self._invalidate_nonce(wallet_address, plan.network)
             
-            return ExecutionResult(
-                success=False,
-                status=TransactionStatus.FAILED,
-                error=str(e),
+            return ExecutionResult.failure(str(e), execution_time=execution_time), plan
+        
+        except BaseException:
+            # Cancelled (e.g. a caller's timeout), possibly between reserve
+            # and submit: don't leave a gap in the nonce sequence
+            self._invalidate_nonce(wallet_address, plan.network)
+            raise
+    
+    @asynccontextmanager
+    async def _sender_lock(self, wallet_address: str, network: NetworkType):
+        """
+        Serialize nonce reservation through submission per sender.
+        
+        Different wallets stay fully concurrent. When a distributed_lock
+        factory is configured it is held as well, for multi-process
+        deployments sharing a wallet.
+        """
+        key = (wallet_address.lower(), network)
+        async with self._sender_locks.setdefault(key, asyncio.Lock()):
+            if self.distributed_lock is None:
+                yield
+            else:
+                async with self.distributed_lock(f"walletmind:sender:{key[0]}:{network.value}"):
+                    yield
+    
+    async def _sign_and_submit(
+        self,
+        tx_data: Dict[str, Any],
+        plan: ExecutionPlan,
+        wallet_address: str
+    ) -> str:
+        """Sign a constructed transaction and submit it"""
+        # Step 6: Sign transaction
+        signed_tx = await self._sign_transaction(tx_data, wallet_address)
+        
+        # Step 7: Submit to network
+        tx_hash = await self._submit_transaction(signed_tx, plan.network)
+        plan._submitted_hashes.append(tx_hash)
+        logger.info("Transaction submitted: %s", tx_hash)
+        return tx_hash
+    
+    async def _confirm(
+        self,
+        tx_hash: str,
+        plan: ExecutionPlan,
+        start_time: float
+    ) -> ExecutionResult:
+        """Wait for the receipt of a submitted transaction"""
+        receipt = await self._wait_for_confirmation(
+            tx_hash,
+            plan.network,
+            timeout=plan.timeout,
+            confirmations=plan.required_confirmations
+        )
+        
+        return self._result_from_receipt(tx_hash, receipt, start_time)
+    
+    def _result_from_receipt(
+        self,
+        tx_hash: str,
+        receipt: Optional[Dict[str, Any]],
+        start_time: float
+    ) -> ExecutionResult:
+        """Build the execution result for a submitted transaction"""
+        execution_time = time.perf_counter() - start_time
+        
+        if receipt and receipt.get("status") == 1:
+            return ExecutionResult.model_construct(
+                success=True,
+                transaction_hash=tx_hash,
+                block_number=receipt.get("blockNumber"),
+                gas_used=receipt.get("gasUsed"),
+                effective_gas_price=receipt.get("effectiveGasPrice"),
+                status=TransactionStatus.CONFIRMED,
+                receipt=receipt,
                 execution_time=execution_time
             )
+        else:
+            return ExecutionResult.failure(
+                "Transaction reverted on-chain",
+                tx_hash=tx_hash,
+                receipt=receipt,
+                execution_time=execution_time
+            )
+    
+    async def _resign_with_new_fee(
+        self,
+        plan: ExecutionPlan,
+        fee_update: Dict[str, int],
+        wallet_address: str
+    ) -> Tuple[ExecutionResult, ExecutionPlan]:
+        """
+        Resubmit the plan's cached transaction body with new fees.
+        
+        to, value, nonce and data are unchanged, so validation, the
+        pre-flight RPCs and construction are skipped. fee_update holds the
+        plan fields to change (see _bumped_fees). Returns the result and
+        the re-priced copy of the plan.
+        """
+        start_time = time.perf_counter()
+        
+        plan = plan.model_copy(update=fee_update)
+        tx_data = {**plan._tx_body, **self._fee_fields(plan)}
+        plan._tx_body = tx_data
+        
+        try:
+            async with self._sender_lock(wallet_address, plan.network):
+                tx_hash = await self._sign_and_submit(tx_data, plan, wallet_address)
+            return await self._confirm(tx_hash, plan, start_time), plan
+        except Exception as e:
+            logger.error("Fee bump resubmission failed: %s", e, exc_info=True)
+            execution_time = time.perf_counter() - start_time
+            
+            return ExecutionResult.failure(str(e), execution_time=execution_time), plan
     
     async def execute_with_retry(
         self,
-        context: DecisionContext,
+        context: Optional[DecisionContext],
         plan: ExecutionPlan,
         wallet_address: str
     ) -> ExecutionResult:
@@ -316,46 +914,68 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
         Execute transaction with automatic retry logic
         """
         last_error = None
+        backoff_tag = None
+        bumped_fees = None
         
         for attempt in range(plan.max_retries):
             try:
-                logger.info(f"Execution attempt {attempt + 1}/{plan.max_retries}")
+                logger.info("Execution attempt %d/%d", attempt + 1, plan.max_retries)
                 
-                result = await self.execute_transaction(context, plan, wallet_address)
+                if bumped_fees is not None:
+                    result, plan = await self._resign_with_new_fee(plan, bumped_fees, wallet_address)
+                    bumped_fees = None
+                else:
+                    result, plan = await self._execute_plan(plan, wallet_address)
                 
                 if result.success:
+                    if backoff_tag:
+                        self._update_backoff_policy(backoff_tag, committed=True)
                     return result
                 
                 # Handle specific errors
                 last_error = result.error
+                error_class = _classify_error(last_error or "")
                 
-                if "insufficient funds" in (last_error or "").lower():
-                    # Can't retry - not enough balance
-                    break
+                if error_class == "unrecoverable":
+                    # Can't retry - e.g. not enough balance or reverted call
+                    return result
                 
-                if "nonce too low" in (last_error or "").lower():
-                    # Update nonce and retry
-                    plan.nonce = await self._get_nonce(wallet_address, plan.network)
+                if error_class == "nonce":
+                    # Local nonce state is stale: resync and retry. The next
+                    # attempt reserves a fresh nonce under the sender lock,
+                    # so none is consumed if it never gets that far
+                    self._invalidate_nonce(wallet_address, plan.network)
+                    plan = plan.model_copy(update={"nonce": None})
+                    plan._tx_body = None
                     continue
                 
-                if "underpriced" in (last_error or "").lower():
-                    # Increase gas price by 20% and retry
-                    plan.gas_price = int((plan.gas_price or 0) * 1.2)
+                if error_class == "underpriced":
+                    # Increase the fees by 20% and retry
+                    self._gas_price_cache.pop(plan.network, None)
+                    self._fee_cache.pop(plan.network, None)
+                    fee_update = self._bumped_fees(plan, 1.2)
+                    if plan._tx_body is not None:
+                        # Only the fee changes: re-sign the cached body
+                        bumped_fees = fee_update
+                    else:
+                        plan = plan.model_copy(update=fee_update)
                     continue
                 
-                # Generic retry with backoff
-                await self._backoff(attempt)
+                # Generic retry with backoff (rate_limit or transient)
+                backoff_tag = error_class
+                self._update_backoff_policy(backoff_tag, committed=False)
+                await self._backoff(attempt, backoff_tag)
                 
             except Exception as e:
-                logger.warning(f"Retry attempt {attempt + 1} failed: {e}")
+                logger.warning("Retry attempt %d failed: %s", attempt + 1, e)
                 last_error = str(e)
-                await self._backoff(attempt)
+                backoff_tag = "transient"
+                self._update_backoff_policy(backoff_tag, committed=False)
+                await self._backoff(attempt, backoff_tag)
         
         # All retries exhausted
-        return ExecutionResult(
-            success=False,
-            status=TransactionStatus.FAILED,
-            error=f"Max retries ({plan.max_retries}) reached. Last error: {last_error}"
+        return ExecutionResult.failure(
+            f"Max retries ({plan.max_retries}) reached. Last error: {last_error}"
         )
     
     async def cancel_transaction(
@@ -367,37 +987,42 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
         """
         Cancel a pending transaction by replacing it with 0 ETH tx
         """
-        logger.info(f"Attempting to cancel transaction: {transaction_hash}")
+        results = await self.cancel_transactions([transaction_hash], wallet_address, network)
+        return results[0]
+    
+    async def cancel_transactions(
+        self,
+        transaction_hashes: List[str],
+        wallet_address: str,
+        network: NetworkType
+    ) -> List[ExecutionResult]:
+        """
+        Cancel several pending transactions.
         
-        # Get original transaction
-        original_tx = await self._get_transaction(transaction_hash, network)
+        Originals are fetched in one batched read, replacements are
+        submitted concurrently (each reuses its original nonce).
+        """
+        logger.info("Attempting to cancel %d transaction(s): %s", len(transaction_hashes), transaction_hashes)
         
-        if not original_tx:
-            return ExecutionResult(
-                success=False,
-                status=TransactionStatus.FAILED,
-                error="Transaction not found"
-            )
+        original_txs = await self._get_transactions(transaction_hashes, network)
         
-        # Create cancellation transaction with same nonce
-        cancel_plan = ExecutionPlan(
-            transaction_type="cancel",
-            to_address=wallet_address,  # Send to self
-            amount=0.0,
-            network=network,
-            nonce=original_tx.get("nonce"),
-            gas_price=int(original_tx.get("gasPrice", 0) * 1.1)  # 10% higher
-        )
+        plans: List[Optional[ExecutionPlan]] = []
+        for original_tx in original_txs:
+            if not original_tx:
+                plans.append(None)
+                continue
+            
+            # Create cancellation transaction with same nonce, 10% higher fees
+            plans.append(ExecutionPlan(
+                transaction_type="cancel",
+                to_address=wallet_address,  # Send to self
+                amount=0.0,
+                network=network,
+                nonce=original_tx.get("nonce"),
+                **self._replacement_fees(original_tx, 1.1)
+            ))
         
-        return await self.execute_transaction(
-            DecisionContext(
-                user_id="system",
-                wallet_address=wallet_address,
-                request="Cancel pending transaction"
-            ),
-            cancel_plan,
-            wallet_address
-        )
+        return await self._execute_replacements(plans, wallet_address, network)
     
     async def speed_up_transaction(
         self,
@@ -409,48 +1034,305 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
         """
         Speed up a pending transaction by resubmitting with higher gas
         """
-        logger.info(f"Attempting to speed up transaction: {transaction_hash}")
+        results = await self.speed_up_transactions(
+            [transaction_hash], wallet_address, network, gas_price_multiplier
+        )
+        return results[0]
+    
+    async def speed_up_transactions(
+        self,
+        transaction_hashes: List[str],
+        wallet_address: str,
+        network: NetworkType,
+        gas_price_multiplier: float = 1.5
+    ) -> List[ExecutionResult]:
+        """
+        Speed up several pending transactions.
         
-        original_tx = await self._get_transaction(transaction_hash, network)
+        Originals are fetched in one batched read, replacements are
+        submitted concurrently with higher fees (EIP-1559 originals get
+        both the max fee and the tip multiplied).
+        """
+        logger.info("Attempting to speed up %d transaction(s): %s", len(transaction_hashes), transaction_hashes)
         
-        if not original_tx:
-            return ExecutionResult(
-                success=False,
-                status=TransactionStatus.FAILED,
-                error="Transaction not found"
-            )
+        original_txs = await self._get_transactions(transaction_hashes, network)
         
-        # Resubmit with higher gas price
-        speedup_plan = ExecutionPlan(
-            transaction_type="speedup",
-            to_address=original_tx.get("to"),
-            amount=float(original_tx.get("value", 0)) / 1e18,  # Wei to ETH
-            network=network,
-            nonce=original_tx.get("nonce"),
-            gas_price=int(original_tx.get("gasPrice", 0) * gas_price_multiplier),
-            data=original_tx.get("input")
-        )
+        plans: List[Optional[ExecutionPlan]] = []
+        for original_tx in original_txs:
+            if not original_tx:
+                plans.append(None)
+                continue
+            
+            input_data = original_tx.get("input")
+            if isinstance(input_data, (bytes, bytearray)):
+                input_data = "0x" + bytes(input_data).hex()
+            
+            # Resubmit with higher gas price
+            value_wei = int(original_tx.get("value", 0))
+            plans.append(ExecutionPlan(
+                transaction_type="speedup",
+                to_address=original_tx.get("to"),
+                amount=value_wei / 1e18,  # Informational only, amount_wei is what gets sent
+                amount_wei=value_wei,  # Resend the exact original value
+                network=network,
+                nonce=original_tx.get("nonce"),
+                gas_limit=original_tx.get("gas"),  # Same call, no re-estimate needed
+                data=input_data,
+                **self._replacement_fees(original_tx, gas_price_multiplier)
+            ))
+        
+        return await self._execute_replacements(plans, wallet_address, network)
+    
+    async def _execute_replacements(
+        self,
+        plans: List[Optional[ExecutionPlan]],
+        wallet_address: str,
+        network: NetworkType
+    ) -> List[ExecutionResult]:
+        """
+        Sign replacement plans concurrently and submit them in one batch.
         
-        return await self.execute_transaction(
-            DecisionContext(
-                user_id="system",
-                wallet_address=wallet_address,
-                request="Speed up pending transaction"
-            ),
-            speedup_plan,
-            wallet_address
+        None marks a missing original. Each plan reuses its original nonce,
+        so the replacements are independent of each other.
+        """
+        start_time = time.perf_counter()
+        results: List[Optional[ExecutionResult]] = [None] * len(plans)
+        
+        def failed(error: str) -> ExecutionResult:
+            return ExecutionResult.failure(error, execution_time=time.perf_counter() - start_time)
+        
+        async def prepare(plan: ExecutionPlan) -> str:
+            self._validate_execution_plan(plan)
+            plan = await self._prefetch_tx_params(plan, wallet_address)
+            tx_data = self._construct_transaction(plan, wallet_address)
+            return await self._sign_transaction(tx_data, wallet_address)
+        
+        pending = []
+        for i, plan in enumerate(plans):
+            if plan is None:
+                results[i] = failed("Transaction not found")
+            else:
+                pending.append(i)
+        
+        # Sign all replacements in parallel
+        signed = await asyncio.gather(*(prepare(plans[i]) for i in pending), return_exceptions=True)
+        to_submit = []
+        for i, signed_tx in zip(pending, signed):
+            if isinstance(signed_tx, BaseException):
+                results[i] = failed(str(signed_tx))
+            else:
+                to_submit.append((i, signed_tx))
+        
+        # Submit all signed replacements together
+        tx_hashes = await self._submit_transactions([tx for _, tx in to_submit], network)
+        submitted = []
+        for (i, _), tx_hash in zip(to_submit, tx_hashes):
+            if isinstance(tx_hash, BaseException):
+                results[i] = failed(str(tx_hash))
+            else:
+                logger.info("Replacement transaction submitted: %s", tx_hash)
+                submitted.append((i, tx_hash))
+        
+        receipts = await asyncio.gather(
+            *(self._wait_for_confirmation(
+                tx_hash, network,
+                timeout=plans[i].timeout,
+                confirmations=plans[i].required_confirmations
+            ) for i, tx_hash in submitted),
+            return_exceptions=True
         )
+        for (i, tx_hash), receipt in zip(submitted, receipts):
+            if isinstance(receipt, BaseException):
+                results[i] = failed(str(receipt))
+            else:
+                results[i] = self._result_from_receipt(tx_hash, receipt, start_time)
+        
+        return results
     
     # Helper methods (implementations delegated to blockchain service)
     
     def _validate_execution_plan(self, plan: ExecutionPlan):
         """Validate execution plan parameters"""
-        if not plan.to_address.startswith("0x") or len(plan.to_address) != 42:
-            raise ValueError(f"Invalid address: {plan.to_address}")
+        address = plan.to_address
+        if not ADDRESS_RE.fullmatch(address):
+            raise ValueError(f"Invalid address: {address}")
+        
+        # Mixed-case addresses carry an EIP-55 checksum
+        body = address[2:]
+        if body != body.lower() and body != body.upper() and not is_checksum_address(address):
+            raise ValueError(f"Invalid address checksum: {address}")
         
-        if plan.amount < 0:
+        # _value_wei honours amount_wei, so wei-native plans are checked exactly
+        if plan._value_wei < 0:
             raise ValueError("Amount cannot be negative")
     
+    async def _prefetch_tx_params(
+        self,
+        plan: ExecutionPlan,
+        wallet_address: str,
+        reserve_nonce: bool = True
+    ) -> ExecutionPlan:
+        """
+        Return a copy of the plan with gas limit, gas price and (optionally)
+        nonce filled in.
+        
+        Uses a single JSON-RPC batch (eth_estimateGas, eth_gasPrice) when
+        the blockchain service provides prefetch_tx_params(plan,
+        from_address, network) or batch_call. Nonces always come from
+        _reserve_nonce; pass reserve_nonce=False when the caller reserves
+        it under the sender lock.
+        
+        Plans without any fee also get EIP-1559 fees on networks that
+        support them; gas_price stays as the legacy fallback.
+        """
+        fees_task = None
+        if plan.gas_price is None and plan.max_fee_per_gas is None:
+            fees_task = asyncio.ensure_future(self._get_eip1559_fees(plan.network))
+        
+        prefetch = getattr(self.blockchain_service, "prefetch_tx_params", None)
+        if prefetch is None and getattr(self.blockchain_service, "batch_call", None) is not None:
+            prefetch = self._prefetch_via_batch_call
+        if prefetch is not None:
+            # The pending count in the batch is ignored: nonces only come
+            # from _reserve_nonce, under the contingent's lock
+            gas_estimate, gas_price, _ = await prefetch(plan, wallet_address, plan.network)
+            update = {}
+            if plan.gas_limit is None:
+                update["gas_limit"] = int(gas_estimate * 1.2)  # 20% buffer
+            self._store_gas_price(plan.network, gas_price)
+            if plan.gas_price is None:
+                update["gas_price"] = gas_price
+            if plan.nonce is None and reserve_nonce:
+                update["nonce"] = await self._reserve_nonce(wallet_address, plan.network)
+            if fees_task is not None:
+                self._apply_eip1559_fees(update, await fees_task)
+            return plan.model_copy(update=update) if update else plan
+        
+        # No batching: run the independent lookups concurrently, only for
+        # the fields the plan is still missing
+        need_gas = plan.gas_limit is None
+        need_price = plan.gas_price is None
+        need_nonce = reserve_nonce and plan.nonce is None
+        
+        tasks = []
+        if need_gas:
+            tasks.append(self._estimate_gas(plan, wallet_address))
+        if need_price:
+            tasks.append(self._get_optimal_gas_price(plan.network))
+        if need_nonce:
+            tasks.append(self._reserve_nonce(wallet_address, plan.network))
+        
+        if fees_task is not None:
+            tasks.append(fees_task)
+        
+        if not tasks:
+            return plan
+        
+        results = iter(await asyncio.gather(*tasks))
+        update = {}
+        if need_gas:
+            update["gas_limit"] = int(next(results) * 1.2)  # 20% buffer
+        if need_price:
+            update["gas_price"] = next(results)
+        if need_nonce:
+            update["nonce"] = next(results)
+        if fees_task is not None:
+            self._apply_eip1559_fees(update, next(results))
+        return plan.model_copy(update=update)
+    
+    def _apply_eip1559_fees(self, update: Dict[str, Any], fees: Optional[tuple[int, int]]):
+        """Add fetched (max_fee, tip) to a plan update, if any"""
+        if fees is not None:
+            update["max_fee_per_gas"], update["max_priority_fee_per_gas"] = fees
+    
+    async def _get_eip1559_fees(self, network: NetworkType) -> Optional[tuple[int, int]]:
+        """
+        (maxFeePerGas, maxPriorityFeePerGas) from eth_feeHistory, cached
+        for about half a block.
+        
+        Uses get_fee_history(block_count, percentiles, network) or a raw
+        batch_call on the blockchain service. Returns None when the network
+        or service has no EIP-1559 support, or the lookup fails, so the
+        caller falls back to a legacy gas price.
+        """
+        if network not in _EIP1559_NETWORKS:
+            return None
+        
+        entry = self._fee_cache.get(network)
+        if entry and entry[1] > time.monotonic():
+            return entry[0]
+        
+        try:
+            fee_history = getattr(self.blockchain_service, "get_fee_history", None)
+            if fee_history is not None:
+                history = await fee_history(_FEE_HISTORY_BLOCKS, list(_FEE_HISTORY_PERCENTILES), network)
+            elif getattr(self.blockchain_service, "batch_call", None) is not None:
+                (history,) = await self.blockchain_service.batch_call([
+                    ("eth_feeHistory", [hex(_FEE_HISTORY_BLOCKS), "latest", list(_FEE_HISTORY_PERCENTILES)]),
+                ], network)
+            else:
+                return None
+            fees = _fees_from_history(history)
+        except Exception as e:
+            logger.debug("Fee history lookup failed on %s: %s", network.value, e)
+            return None
+        
+        ttl = _GAS_PRICE_TTLS.get(network, _GAS_PRICE_DEFAULT_TTL)
+        self._fee_cache[network] = (fees, time.monotonic() + ttl)
+        return fees
+    
+    def _fee_fields(self, plan: ExecutionPlan) -> Dict[str, int]:
+        """Transaction fee fields: EIP-1559 when the plan has a max fee, else legacy"""
+        if plan.max_fee_per_gas is not None:
+            return {
+                "maxFeePerGas": plan.max_fee_per_gas,
+                "maxPriorityFeePerGas": plan.max_priority_fee_per_gas or 0
+            }
+        return {"gasPrice": plan.gas_price}
+    
+    def _bumped_fees(self, plan: ExecutionPlan, factor: float) -> Dict[str, int]:
+        """Plan update raising the fees by factor (tip and max fee for EIP-1559)"""
+        if plan.max_fee_per_gas is not None:
+            return {
+                "max_fee_per_gas": int(plan.max_fee_per_gas * factor),
+                "max_priority_fee_per_gas": int((plan.max_priority_fee_per_gas or 0) * factor)
+            }
+        return {"gas_price": int((plan.gas_price or 0) * factor)}
+    
+    def _replacement_fees(self, original_tx: Dict[str, Any], factor: float) -> Dict[str, int]:
+        """ExecutionPlan fee fields outbidding an original transaction by factor"""
+        if original_tx.get("maxFeePerGas") is not None:
+            return {
+                "max_fee_per_gas": int(original_tx["maxFeePerGas"] * factor),
+                "max_priority_fee_per_gas": int(original_tx.get("maxPriorityFeePerGas", 0) * factor)
+            }
+        return {"gas_price": int(original_tx.get("gasPrice", 0) * factor)}
+    
+    async def _prefetch_via_batch_call(
+        self,
+        plan: ExecutionPlan,
+        wallet_address: str,
+        network: NetworkType
+    ) -> tuple[int, int, None]:
+        """
+        Fetch gas estimate and gas price in one JSON-RPC batch.
+        
+        Used when the blockchain service exposes batch_call(calls, network)
+        but not prefetch_tx_params. The nonce slot is always None: nonces
+        are reserved under the sender lock.
+        """
+        call = {
+            "from": wallet_address,
+            "to": plan.to_address,
+            "value": hex(plan._value_wei),
+            "data": "0x" + plan._data_bytes.hex()
+        }
+        gas_estimate, gas_price = await self.blockchain_service.batch_call([
+            ("eth_estimateGas", [call]),
+            ("eth_gasPrice", []),
+        ], network)
+        return int(gas_estimate, 16), int(gas_price, 16), None
+    
     async def _estimate_gas(self, plan: ExecutionPlan, from_address: str) -> int:
         """Estimate gas for transaction"""
         if self.blockchain_service:
@@ -458,28 +1340,123 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
         return 21000  # Default for simple transfer
     
     async def _get_optimal_gas_price(self, network: NetworkType) -> int:
-        """Get optimal gas price for network"""
+        """Get optimal gas price for network (cached for about half a block)"""
         if self.blockchain_service:
-            return await self.blockchain_service.get_gas_price(network)
+            self._recent_tx_count[network] = self._recent_tx_count.get(network, 0) + 1
+            self._ensure_gas_refresher(network)
+            
+            entry = self._gas_price_cache.get(network)
+            if entry and entry[1] > time.monotonic():
+                return entry[0]
+            
+            price = await self.blockchain_service.get_gas_price(network)
+            self._store_gas_price(network, price)
+            return price
         return 1000000000  # Default 1 gwei
     
-    async def _get_nonce(self, address: str, network: NetworkType) -> int:
+    def _store_gas_price(self, network: NetworkType, price: int):
+        """Cache a gas price for the network's TTL"""
+        ttl = _GAS_PRICE_TTLS.get(network, _GAS_PRICE_DEFAULT_TTL)
+        self._gas_price_cache[network] = (price, time.monotonic() + ttl)
+    
+    def _ensure_gas_refresher(self, network: NetworkType):
+        """Start the background gas price refresher for network if idle"""
+        task = self._gas_refresh_tasks.get(network)
+        if task is None or task.done():
+            self._gas_refresh_tasks[network] = asyncio.create_task(self._refresh_gas_price_loop(network))
+    
+    async def _refresh_gas_price_loop(self, network: NetworkType):
+        """
+        Keep the gas price cache warm every TTL/2 while transactions arrive.
+        
+        Exits after an interval with no lookups; the next lookup restarts it.
+        If the blockchain service exposes get_block_number(network), the price
+        is only refetched when a new block has arrived.
+        """
+        interval = _GAS_PRICE_TTLS.get(network, _GAS_PRICE_DEFAULT_TTL) / 2
+        get_block_number = getattr(self.blockchain_service, "get_block_number", None)
+        
+        while True:
+            await asyncio.sleep(interval)
+            if not self._recent_tx_count.get(network):
+                return
+            self._recent_tx_count[network] = 0
+            
+            try:
+                if get_block_number is not None:
+                    block = await get_block_number(network)
+                    if block == self._gas_price_blocks.get(network):
+                        # Same block: the cached price is still current
+                        price, _ = self._gas_price_cache.get(network, (None, 0.0))
+                        if price is not None:
+                            self._store_gas_price(network, price)
+                        continue
+                    self._gas_price_blocks[network] = block
+                
+                price = await self.blockchain_service.get_gas_price(network)
+                self._store_gas_price(network, price)
+            except Exception as e:
+                logger.warning("Gas price refresh failed on %s: %s", network.value, e)
+    
+    async def _reserve_nonce(self, address: str, network: NetworkType) -> int:
+        """
+        Reserve the next nonce for address from its contingent.
+        
+        The chain is only queried when the contingent is exhausted (every
+        _NONCE_CONTINGENT_SIZE reservations) or after _invalidate_nonce.
+        """
+        pool = self._nonce_pool(address, network)
+        async with pool.lock:
+            if pool.next >= pool.end:
+                chain_nonce = await self._fetch_nonce(address, network)
+                pool.refill(chain_nonce)
+            nonce = pool.next
+            pool.next += 1
+            return nonce
+    
+    def _nonce_pool(self, address: str, network: NetworkType) -> NonceContingent:
+        """Get or create the nonce contingent for (address, network)"""
+        key = (address.lower(), network)
+        pool = self._nonce_pools.get(key)
+        if pool is None:
+            pool = self._nonce_pools[key] = NonceContingent()
+        return pool
+    
+    async def _fetch_nonce(self, address: str, network: NetworkType) -> int:
         """Get current nonce for address"""
         if self.blockchain_service:
             return await self.blockchain_service.get_nonce(address, network)
         return 0
     
-    def _construct_transaction(self, plan: ExecutionPlan, from_address: str) -> Dict[str, Any]:
-        """Construct transaction dictionary"""
-        return {
-            "from": from_address,
-            "to": plan.to_address,
-            "value": int(plan.amount * 1e18),  # ETH to Wei
-            "gas": plan.gas_limit,
-            "gasPrice": plan.gas_price,
-            "nonce": plan.nonce,
-            "data": plan.data or "0x"
-        }
+    def _invalidate_nonce(self, address: str, network: NetworkType):
+        """Discard the contingent so the next reservation resyncs from the chain"""
+        pool = self._nonce_pools.get((address.lower(), network))
+        if pool is not None:
+            pool.next = pool.end = 0
+    
+    def _construct_transaction(
+        self,
+        plan: ExecutionPlan,
+        from_address: str,
+        chain_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Construct transaction dictionary.
+        
+        The retry-invariant fields are built once per plan and merged
+        with the per-attempt gas, nonce and fee fields.
+        """
+        base = plan._tx_base
+        if base is None or base["from"] != from_address:
+            base = {
+                "from": from_address,
+                "to": plan.to_address,
+                "value": plan._value_wei,
+                "data": plan._data_bytes,
+                "chainId": chain_id if chain_id is not None else self._chain_ids[plan.network]
+            }
+            plan._tx_base = base
+        return {**base, "gas": plan.gas_limit, "nonce": plan.nonce, **self._fee_fields(plan)}
     
     async def _sign_transaction(self, tx_data: Dict[str, Any], wallet_address: str) -> str:
         """Sign transaction with agent wallet"""
@@ -493,6 +1470,31 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
             return await self.blockchain_service.submit_transaction(signed_tx, network)
         raise NotImplementedError("Blockchain service required for submission")
     
+    async def _submit_transactions(
+        self,
+        signed_txs: List[str],
+        network: NetworkType
+    ) -> List[Any]:
+        """
+        Submit several signed transactions.
+        
+        Uses one JSON-RPC batch when the blockchain service provides
+        send_raw_transactions(signed_txs, network), else concurrent
+        single submissions. Entries are tx hashes or the exception raised.
+        """
+        if not signed_txs:
+            return []
+        submit_many = getattr(self.blockchain_service, "send_raw_transactions", None)
+        if submit_many is not None:
+            try:
+                return await submit_many(signed_txs, network)
+            except Exception as e:
+                return [e] * len(signed_txs)
+        return list(await asyncio.gather(
+            *(self._submit_transaction(tx, network) for tx in signed_txs),
+            return_exceptions=True
+        ))
+    
     async def _wait_for_confirmation(
         self,
         tx_hash: str,
@@ -502,20 +1504,116 @@ Be precise, secure, and use ONLY real blockchain data from the tools."""
     ) -> Optional[Dict[str, Any]]:
         """Wait for transaction confirmation"""
         if self.blockchain_service:
-            return await self.blockchain_service.wait_for_confirmation(
+            service = self.blockchain_service
+            can_check_receipts = getattr(service, "get_transaction_receipt", None) is not None
+            can_track_heads = (
+                getattr(service, "subscribe_newheads", None) is not None
+                or getattr(service, "get_block_number", None) is not None
+            )
+            if can_check_receipts and (confirmations <= 1 or can_track_heads):
+                try:
+                    return await asyncio.wait_for(
+                        self._wait_for_confirmation_adaptive(tx_hash, network, confirmations),
+                        timeout=timeout
+                    )
+                except asyncio.TimeoutError:
+                    logger.warning("Transaction %s not confirmed within %ss", tx_hash, timeout)
+                    return None
+            
+            return await service.wait_for_confirmation(
                 tx_hash, network, timeout, confirmations
             )
         return None
     
+    async def _wait_for_confirmation_adaptive(
+        self,
+        tx_hash: str,
+        network: NetworkType,
+        confirmations: int
+    ) -> Dict[str, Any]:
+        """
+        Check the receipt on new blocks, or on an adaptive polling schedule.
+        
+        With subscribe_newheads(network) (an async iterator of block
+        numbers) the receipt is checked once per block. Otherwise polling
+        starts fast (_CONFIRMATION_POLL_SCHEDULE) and settles at the
+        network's block time.
+        """
+        service = self.blockchain_service
+        block_time = _BLOCK_TIMES.get(network, _DEFAULT_BLOCK_TIME)
+        
+        async def confirmed(head: Optional[int]) -> Optional[Dict[str, Any]]:
+            try:
+                receipt = await service.get_transaction_receipt(tx_hash, network)
+            except Exception as e:
+                logger.debug("Receipt check for %s failed: %s", tx_hash, e)
+                return None
+            if not receipt:
+                return None
+            if confirmations > 1:
+                if head is None:
+                    head = await service.get_block_number(network)
+                if head - receipt.get("blockNumber", head) + 1 < confirmations:
+                    return None
+            return receipt
+        
+        subscribe = getattr(service, "subscribe_newheads", None)
+        if subscribe is not None:
+            async for head in subscribe(network):
+                receipt = await confirmed(head)
+                if receipt:
+                    return receipt
+        
+        attempt = 0
+        while True:
+            receipt = await confirmed(None)
+            if receipt:
+                return receipt
+            if attempt < len(_CONFIRMATION_POLL_SCHEDULE):
+                interval = min(_CONFIRMATION_POLL_SCHEDULE[attempt], block_time)
+            else:
+                interval = block_time
+            attempt += 1
+            await asyncio.sleep(interval)
+    
     async def _get_transaction(self, tx_hash: str, network: NetworkType) -> Optional[Dict[str, Any]]:
         """Get transaction details"""
         if self.blockchain_service:
             return await self.blockchain_service.get_transaction(tx_hash, network)
         return None
     
-    async def _backoff(self, attempt: int):
-        """Exponential backoff between retries"""
-        import asyncio
-        wait_time = min(2 ** attempt, 30)  # Max 30 seconds
-        logger.info(f"Waiting {wait_time}s before retry...")
-        await asyncio.sleep(wait_time)
\ No newline at end of file
+    async def _get_transactions(
+        self,
+        tx_hashes: List[str],
+        network: NetworkType
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get details for several transactions.
+        
+        Uses one batched read when the blockchain service provides
+        get_transactions(tx_hashes, network), else concurrent single reads.
+        """
+        get_many = getattr(self.blockchain_service, "get_transactions", None)
+        if get_many is not None:
+            return await get_many(tx_hashes, network)
+        return list(await asyncio.gather(
+            *(self._get_transaction(tx_hash, network) for tx_hash in tx_hashes)
+        ))
+    
+    async def _backoff(self, attempt: int, tag: str = "transient"):
+        """Exponential backoff with full jitter between retries"""
+        scale = self._backoff_state.get(tag, _BACKOFF_BASE_DELAY) / _BACKOFF_BASE_DELAY
+        ceiling = _BACKOFF_SCHEDULE[min(attempt, len(_BACKOFF_SCHEDULE) - 1)] * scale
+        wait_time = random.uniform(0, min(ceiling, _BACKOFF_MAX_DELAY))
+        logger.info("Waiting %.2fs before retry (%s)...", wait_time, tag)
+        await asyncio.sleep(wait_time)
+    
+    def _update_backoff_policy(self, tag: str, committed: bool):
+        """Shrink the base delay for an error class on success, grow it on abort"""
+        alpha_commit, alpha_abort = _BACKOFF_POLICY.get(tag, _BACKOFF_POLICY["transient"])
+        base = self._backoff_state.get(tag, _BACKOFF_BASE_DELAY)
+        if committed:
+            base /= (1 + alpha_commit)
+        else:
+            base *= (1 + alpha_abort)
+        self._backoff_state[tag] = max(_BACKOFF_MIN_DELAY, min(base, _BACKOFF_MAX_DELAY))
\ No newline at end of file
@@ -12,23 +12,229 @@ Uses LangGraph to coordinate:
 - Communicator Agent
 """
 
-from typing import Dict, Any, List, Optional, TypedDict, Annotated
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Awaitable, Dict, Any, List, Optional, Tuple, TypedDict, Annotated
 from typing_extensions import TypedDict
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
+try:
+    # Per-step spans when OpenTelemetry is installed
+    from opentelemetry import trace
+    _tracer = trace.get_tracer(__name__)
+except ImportError:
+    _tracer = None
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-import operator
+from langchain_core.runnables import RunnableConfig
+import aiohttp
+import asyncio
+import contextlib
+import functools
+import heapq
+import inspect
 import logging
-from datetime import datetime
+import operator
+import re
+import threading
+import time
+from datetime import datetime, timezone
 
 from .base import DecisionContext, AgentResponse
 from .planner import PlannerAgent, TransactionPlan
-from .executor import ExecutorAgent, ExecutionPlan, ExecutionResult
+from .executor import ExecutorAgent, ExecutionPlan, ExecutionResult, TransactionStatus
 from .evaluator import EvaluatorAgent, TransactionOutcome
 from .communicator import CommunicatorAgent
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    logger.info("orjson not installed - decision memory uses the default serializer")
+    orjson = None  # type: ignore
+
+_CACHE_POLICIES = ("read_write", "bypass", "refresh")
+
+
+class WorkflowStep(str, Enum):
+    """Workflow node names; also the values of AgentState["current_step"]"""
+    START = "start"
+    ANALYZE_AND_BALANCE = "analyze_and_balance"
+    CALCULATE_GAS = "calculate_gas"
+    EVALUATE_RISK = "evaluate_risk"
+    EXECUTE_TRANSACTION = "execute_transaction"
+    EVALUATE_OUTCOME = "evaluate_outcome"
+    REJECT_TRANSACTION = "reject_transaction"
+    LOG_DECISION = "log_decision"
+
+
+class WorkflowEvent(str, Enum):
+    """Event types broadcast to the agents WebSocket channel"""
+    APPROVAL_REQUIRED = "approval_required"
+    APPROVAL_RESPONSE = "approval_response"
+    CLARIFICATION_REQUIRED = "clarification_required"
+    WORKFLOW_STEP = "workflow_step"
+    RISK_EVALUATION = "risk_evaluation"
+    RISK_EVALUATED = "risk_evaluated"
+    INSUFFICIENT_FUNDS = "insufficient_funds"
+    EXECUTION_STARTED = "execution_started"
+    DECISION_LOGGED = "decision_logged"
+    TRANSACTION_CONFIRMED = "transaction_confirmed"
+    TRANSACTION_FAILED = "transaction_failed"
+    EXECUTION_ERROR = "execution_error"
+
+# Requests rejected before the workflow runs: asks for wallet secrets
+_DENYLIST_RE = re.compile(
+    r"\b(private\s+keys?|seed\s+phrases?|mnemonics?|recovery\s+phrases?|secret\s+keys?)\b",
+    re.IGNORECASE
+)
+
+# Workflow updates are coalesced into one {"type": "multi"} WebSocket frame
+# per flush interval; a full buffer flushes immediately
+_BROADCAST_FLUSH_INTERVAL = 0.05
+_BROADCAST_MAX_BUFFER = 140
+
+# Approvals/clarifications the user never answers are dropped after this
+_APPROVAL_TTL_SECONDS = 900
+
+# Upper bound on executing and evaluating a manually approved transaction:
+# every retry's receipt wait, plus decision logging (IPFS pin with retry,
+# logDecision), prefetch and retry backoff
+_APPROVED_EXECUTION_TIMEOUT = (
+    ExecutionPlan.model_fields["timeout"].default * ExecutionPlan.model_fields["max_retries"].default
+    + 180
+)
+
+# Decision memory is written off the request path by one writer task,
+# up to _MEMORY_BATCH_SIZE records per write, waiting at most
+# _MEMORY_BATCH_WINDOW seconds for a batch to fill
+_MEMORY_BATCH_SIZE = 32
+_MEMORY_BATCH_WINDOW = 0.05
+
+# Shared outbound HTTP pool (sub-agents and services reuse its connections)
+_HTTP_POOL_LIMIT = 100
+_HTTP_DNS_CACHE_TTL = 300
+_HTTP_KEEPALIVE_TIMEOUT = 60
+
+# Workflow messages kept in state (older steps are dropped)
+_MAX_MESSAGES = 64
+
+# How long an intent analysis is shared with identical requests (client retries)
+_INTENT_CACHE_TTL = 300
+
+# Shorthand expanded before keying the plan cache
+_REQUEST_ABBREVIATIONS = {
+    "amt": "amount",
+    "addr": "address",
+    "tx": "transaction",
+    "txn": "transaction",
+    "pls": "please",
+    "plz": "please",
+}
+_REQUEST_TOKEN_RE = re.compile(r"[^\s,;!?]+")
+
+
+def normalize_request(user_request: str) -> str:
+    """Canonical form of a request: lowercase, single-spaced, shorthand expanded"""
+    words = (word.rstrip(".") for word in _REQUEST_TOKEN_RE.findall(user_request.lower()))
+    return " ".join(_REQUEST_ABBREVIATIONS.get(word, word) for word in words if word)
+
+
+class PlanCache:
+    """
+    In-process cache of planner output for repeated requests.
+    
+    Keyed on the normalized request, wallet, network and spending limit.
+    Only the planning steps are skipped on a hit: the balance check, risk
+    evaluation and execution still run for every request.
+    """
+    
+    def __init__(self, ttl_seconds: int = 300, max_entries: int = 1024):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (entry, monotonic expiry), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def make_key(
+        user_request: str,
+        wallet_address: str,
+        network: str,
+        spending_limit: Optional[float]
+    ) -> Tuple[str, str, str, Optional[float]]:
+        """Cache key for a request"""
+        return (normalize_request(user_request), wallet_address.lower(), network, spending_limit)
+    
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Get a cached entry if not expired"""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        entry, expires_at = cached
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def put(self, key: Tuple, entry: Dict[str, Any]):
+        """Store an entry, evicting the least recently used beyond max_entries"""
+        self._entries[key] = (entry, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def discard(self, key: Tuple):
+        """Drop one entry if present"""
+        self._entries.pop(key, None)
+    
+    def clear(self):
+        """Drop all cached plans"""
+        self._entries.clear()
+
+
+def _append_messages(left: List[BaseMessage], right: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    Messages reducer: append in place and keep the last _MAX_MESSAGES.
+    
+    Steps return only their new messages; the identity check covers a
+    caller handing back the existing list.
+    """
+    if right is not left:
+        left.extend(right)
+    if len(left) > _MAX_MESSAGES:
+        del left[:-_MAX_MESSAGES]
+    return left
+
+
+# Execution statuses evaluated locally, without calling the evaluator
+_LOCAL_EVAL_STATUSES = frozenset({"failed", "cancelled"})
+_FAILED_EXECUTION_EVALUATION: Dict[str, Any] = {
+    "criteria": "failure",
+    "success": False,
+    "gas_efficiency": None,
+}
+_FAILED_EXECUTION_MESSAGE = AIMessage(content="Evaluation: failure, transaction did not execute")
+
+_DEFAULT_REJECT_REASON = "Risk too high or insufficient funds"
+_ZERO_BALANCE_REASON = "Insufficient funds: wallet balance is 0 ETH"
+
+# Requests that move value out of the wallet; with a zero balance these are
+# rejected without asking the Planner for a gas plan
+_OUTGOING_RE = re.compile(r"\b(send|transfer|pay|swap|mint|bridge|deposit)\b", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _rejection_message(reason: str) -> AIMessage:
+    """
+    Shared "Transaction rejected" message per reason.
+    
+    Messages are never mutated once appended, so one instance can sit in
+    many workflow states. Bounded because plan reasons come from the LLM.
+    """
+    return AIMessage(content=f"Transaction rejected: {reason}")
+
 
 class AgentState(TypedDict):
     """State shared between agents in the workflow"""
@@ -40,26 +246,240 @@ class AgentState(TypedDict):
     
     # Context
     wallet_balance: Optional[float]
+    balance_error: bool  # wallet_balance is a 0.0 fallback, not a real reading
+    _balance_future: Optional["asyncio.Future"]  # balance RPC started on request entry
+    _execution_plan: Optional[ExecutionPlan]  # set by execute_transaction, read if it is cut short
     spending_limit: Optional[float]
     daily_spent: float
     previous_decisions: List[Dict[str, Any]]
     
     # Workflow state
-    current_step: str
-    messages: Annotated[List[BaseMessage], operator.add]
+    context: Optional[DecisionContext]
+    current_step: WorkflowStep
+    messages: Annotated[List[BaseMessage], _append_messages]
     
-    # Agent outputs
-    plan: Optional[Dict[str, Any]]
+    # Agent outputs (the plan stays a model; dumped once at the boundaries)
+    plan: Optional[TransactionPlan]
+    plan_cached: bool
+    intent_cache_key: Optional[Tuple[str, str, str]]
     execution_result: Optional[Dict[str, Any]]
     evaluation: Optional[Dict[str, Any]]
     api_responses: List[Dict[str, Any]]
     
     # Decision
     approved: bool
+    requires_manual_approval: bool
+    approval_reason: Optional[str]
     final_result: Optional[Dict[str, Any]]
     error: Optional[str]
 
 
+def _plan_dict(plan: Optional[TransactionPlan]) -> Optional[Dict[str, Any]]:
+    """JSON-ready form of a workflow plan, for results and broadcasts"""
+    return plan.as_dict() if plan is not None else None
+
+
+def _interrupted_execution(state: AgentState) -> Dict[str, Any]:
+    """execution_result for an execute step cut short, keeping any broadcast tx"""
+    exec_plan = state.get("_execution_plan")
+    tx_hash = exec_plan._submitted_hashes[-1] if exec_plan is not None and exec_plan._submitted_hashes else None
+    return {
+        "success": False,
+        "transaction_hash": tx_hash,
+        "gas_used": None,
+        # A broadcast transaction may still confirm
+        "status": TransactionStatus.SUBMITTED.value if tx_hash else TransactionStatus.FAILED.value,
+        "error": "Timed out waiting for confirmation" if tx_hash else "Execution timed out",
+        "decision_hash": None,
+        "ipfs_cid": None
+    }
+
+
+def _execution_action(execution_result: Optional[Dict[str, Any]]) -> str:
+    """final_result action for an execution outcome"""
+    execution_result = execution_result or {}
+    if execution_result.get("success"):
+        return "executed"
+    if execution_result.get("status") == TransactionStatus.SUBMITTED.value:
+        return "submitted"
+    return "failed"
+
+
+def _memory_response(result: Dict[str, Any]) -> Any:
+    """Result for a memory record: orjson bytes when possible, else the dict itself"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(result)
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. ints beyond 64 bits)
+            pass
+    return result
+
+
+def _utc_from_ns(timestamp_ns: int) -> datetime:
+    """Timezone-aware UTC datetime from a time.time_ns() stamp"""
+    return datetime.fromtimestamp(timestamp_ns / 1e9, tz=timezone.utc)
+
+
+_iso_ms_cache: Tuple[int, str] = (0, "")
+
+
+def _iso_now_ms() -> str:
+    """
+    Current UTC time as ISO 8601 with millisecond precision.
+    
+    Broadcasts come in bursts, so the string is only rebuilt when the
+    millisecond changes.
+    """
+    global _iso_ms_cache
+    now_ms = time.time_ns() // 1_000_000
+    cached_ms, cached = _iso_ms_cache
+    if now_ms != cached_ms:
+        cached = datetime.fromtimestamp(now_ms / 1000, tz=timezone.utc).isoformat(timespec="milliseconds")
+        _iso_ms_cache = (now_ms, cached)
+    return cached
+
+
+def _format_result_timestamp(final_result: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Fill in a final result's ISO timestamp from its ns stamp (done once, on the way out)"""
+    if final_result and final_result.get("timestamp") is None and final_result.get("timestamp_ns"):
+        final_result["timestamp"] = _utc_from_ns(final_result["timestamp_ns"]).isoformat()
+    return final_result
+
+
+# Every AgentState field at its default; _build_initial_state copies it and
+# fills in the request (copying a dict skips rehashing the keys)
+_EMPTY_STATE: Dict[str, Any] = {
+    "user_request": "",
+    "user_id": "",
+    "wallet_address": "",
+    "network": "sepolia",
+    "wallet_balance": None,
+    "balance_error": False,
+    "_balance_future": None,
+    "_execution_plan": None,
+    "spending_limit": None,
+    "daily_spent": 0.0,
+    "previous_decisions": None,
+    "context": None,
+    "current_step": WorkflowStep.START,
+    "messages": None,
+    "plan": None,
+    "plan_cached": False,
+    "intent_cache_key": None,
+    "execution_result": None,
+    "evaluation": None,
+    "api_responses": None,
+    "approved": False,
+    "requires_manual_approval": False,
+    "approval_reason": None,
+    "final_result": None,
+    "error": None,
+}
+
+
+@dataclass(slots=True)
+class _PendingRequest:
+    """An approval or clarification waiting on the user"""
+    state: AgentState
+    wallet_address: str
+    user_id: str
+    expires_at: float  # time.monotonic()
+
+
+# State keys copied into "workflow_step" broadcasts (all JSON-safe)
+_STEP_EVENT_KEYS = ("approved", "requires_manual_approval", "approval_reason", "error")
+
+
+def _route_after_analysis(state: AgentState) -> str:
+    """Skip gas planning for an outgoing request the wallet cannot fund"""
+    # A failed balance lookup also reads 0.0; that wallet may well be funded
+    if (
+        state["wallet_balance"] == 0
+        and not state["balance_error"]
+        and _OUTGOING_RE.search(state["user_request"])
+    ):
+        return WorkflowStep.REJECT_TRANSACTION.value
+    return WorkflowStep.CALCULATE_GAS.value
+
+
+def _step_event(step: str, update: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-safe summary of a step's state update for the WebSocket stream"""
+    event: Dict[str, Any] = {"step": step}
+    for key in _STEP_EVENT_KEYS:
+        if key in update:
+            event[key] = update[key]
+    messages = update.get("messages")
+    if messages:
+        event["messages"] = [message.content for message in messages]
+    return event
+
+
+def _apply_update(state: AgentState, update: Dict[str, Any]) -> AgentState:
+    """Merge a step's partial update into state outside the graph (same reducers)"""
+    for key, value in update.items():
+        if key == "messages":
+            state["messages"] = _append_messages(state["messages"], value)
+        else:
+            state[key] = value
+    return state
+
+
+def _orchestrator_node(cls: type, method_name: str, takes_config: bool = False):
+    """
+    Graph node that runs a method of the orchestrator passed in the run config.
+    
+    The function is looked up on the class once, when the graph is built,
+    so no bound method is created per call.
+    """
+    func = getattr(cls, method_name)
+    
+    if takes_config:
+        async def node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+            return await func(config["configurable"]["orchestrator"], state, config)
+    else:
+        async def node(state: AgentState, config: RunnableConfig) -> Dict[str, Any]:
+            return await func(config["configurable"]["orchestrator"], state)
+    
+    node.__name__ = method_name.lstrip("_")
+    return node
+
+
+def _debug_tracebacks() -> bool:
+    """Attach tracebacks to error logs only when DEBUG logging is on"""
+    return logger.isEnabledFor(logging.DEBUG)
+
+
+def _workflow_step(step: WorkflowStep, on_error: Optional[str] = None):
+    """
+    Wrap a workflow node method with a tracing span and uniform error handling.
+    
+    Steps return partial state updates. A failure is logged (with the
+    traceback at DEBUG) and, by default, becomes {"error": ...}. Steps
+    that need a different failure update name an orchestrator method
+    (self, state, exc) -> update via on_error. Either way current_step is
+    set to the step name.
+    """
+    step_name = step.value
+    
+    def wrap(fn):
+        @functools.wraps(fn)
+        async def inner(self, state: AgentState, *args):
+            span = _tracer.start_as_current_span(step_name) if _tracer else contextlib.nullcontext()
+            with span:
+                try:
+                    return await fn(self, state, *args)
+                except Exception as e:
+                    logger.error("%s failed: %s", step_name, e, exc_info=_debug_tracebacks())
+                    if on_error is not None:
+                        update = await getattr(self, on_error)(state, e)
+                    else:
+                        update = {"error": str(e)}
+                    return {"current_step": step, **update}
+        return inner
+    return wrap
+
+
 class OrchestratorAgent:
     """
     Orchestrates multi-agent workflow using LangGraph.
@@ -74,6 +494,10 @@ class OrchestratorAgent:
     7. Log to memory
     """
     
+    # Compiled workflow shared by all instances (see _get_compiled_app)
+    _compiled_app: Optional[Any] = None
+    _compile_lock = threading.Lock()
+    
     def __init__(
         self,
         planner: PlannerAgent,
@@ -82,7 +506,9 @@ class OrchestratorAgent:
         communicator: CommunicatorAgent,
         blockchain_service: Any,
         memory_service: Any,
-        websocket_manager: Optional[Any] = None
+        websocket_manager: Optional[Any] = None,
+        plan_cache: Optional[PlanCache] = None,
+        approval_ttl_seconds: float = _APPROVAL_TTL_SECONDS
     ):
         self.planner = planner
         self.executor = executor
@@ -91,70 +517,137 @@ class OrchestratorAgent:
         self.blockchain_service = blockchain_service
         self.memory_service = memory_service
         self.websocket_manager = websocket_manager
+        self.plan_cache = plan_cache or PlanCache()
+        # Intent analysis tasks by (normalized request, wallet, network)
+        self.intent_cache = PlanCache(ttl_seconds=_INTENT_CACHE_TTL)
+        
+        # Track pending approvals/clarifications (expired ones evicted via the heap)
+        self.pending_approvals: Dict[str, _PendingRequest] = {}
+        self._pending_expiry: List[Tuple[float, str]] = []
+        # Plain lock: held only for dict/heap operations, never across an await
+        self._pending_lock = threading.Lock()
+        self.approval_ttl_seconds = approval_ttl_seconds
+        
+        # Queued memory writes, drained by _memory_writer (FIFO, so per-wallet
+        # order is kept) and flushed on close()
+        self._memory_queue: asyncio.Queue = asyncio.Queue()
+        self._memory_writer_task: Optional[asyncio.Task] = None
         
-        # Track pending approvals
-        self.pending_approvals: Dict[str, AgentState] = {}
+        # Buffered WebSocket updates, sent by _broadcast_flusher
+        self._broadcast_buf: List[Dict[str, Any]] = []
+        self._broadcast_wakeup = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
         
-        # Build LangGraph workflow
-        self.workflow = self._build_workflow()
-        self.app = self.workflow.compile()
+        # Pooled HTTP session, opened on first request or by __aenter__
+        self._http_session: Optional[aiohttp.ClientSession] = None
+        
+        # Shared compiled LangGraph workflow, bound to this instance
+        self.app = self._get_compiled_app().with_config(configurable={"orchestrator": self})
+    
+    @classmethod
+    def _get_compiled_app(cls) -> Any:
+        """Compile the workflow once per class (instance-independent)"""
+        # Looked up in the class's own namespace: a subclass with overridden
+        # steps compiles its own graph instead of reusing its parent's
+        if cls.__dict__.get("_compiled_app") is None:
+            with cls._compile_lock:
+                if cls.__dict__.get("_compiled_app") is None:
+                    cls._compiled_app = cls._build_workflow().compile()
+        return cls._compiled_app
     
-    def _build_workflow(self) -> StateGraph:
+    @classmethod
+    def _build_workflow(cls) -> StateGraph:
         """
         Build LangGraph workflow with decision tree logic.
         
         Workflow:
-        START → analyze_intent → check_balance → calculate_gas → 
+        START → analyze_and_balance → calculate_gas → 
         evaluate_risk → [approve/reject] → execute_transaction → 
         evaluate_outcome → log_decision → END
+        
+        Nodes look the orchestrator up in config["configurable"], so one
+        compiled graph serves every instance.
         """
         workflow = StateGraph(AgentState)
         
         # Add nodes for each step
-        workflow.add_node("analyze_intent", self._analyze_intent)
-        workflow.add_node("check_balance", self._check_balance)
-        workflow.add_node("calculate_gas", self._calculate_gas)
-        workflow.add_node("evaluate_risk", self._evaluate_risk)
-        workflow.add_node("execute_transaction", self._execute_transaction)
-        workflow.add_node("evaluate_outcome", self._evaluate_outcome)
-        workflow.add_node("log_decision", self._log_decision)
-        workflow.add_node("reject_transaction", self._reject_transaction)
+        workflow.add_node(WorkflowStep.ANALYZE_AND_BALANCE.value, _orchestrator_node(cls, "_analyze_and_balance", takes_config=True))
+        workflow.add_node(WorkflowStep.CALCULATE_GAS.value, _orchestrator_node(cls, "_calculate_gas", takes_config=True))
+        workflow.add_node(WorkflowStep.EVALUATE_RISK.value, _orchestrator_node(cls, "_evaluate_risk"))
+        workflow.add_node(WorkflowStep.EXECUTE_TRANSACTION.value, _orchestrator_node(cls, "_execute_transaction"))
+        workflow.add_node(WorkflowStep.EVALUATE_OUTCOME.value, _orchestrator_node(cls, "_evaluate_outcome", takes_config=True))
+        workflow.add_node(WorkflowStep.LOG_DECISION.value, _orchestrator_node(cls, "_log_decision"))
+        workflow.add_node(WorkflowStep.REJECT_TRANSACTION.value, _orchestrator_node(cls, "_reject_transaction"))
         
         # Define edges (workflow flow)
-        workflow.set_entry_point("analyze_intent")
+        workflow.set_entry_point(WorkflowStep.ANALYZE_AND_BALANCE.value)
         
-        workflow.add_edge("analyze_intent", "check_balance")
-        workflow.add_edge("check_balance", "calculate_gas")
-        workflow.add_edge("calculate_gas", "evaluate_risk")
+        workflow.add_conditional_edges(
+            WorkflowStep.ANALYZE_AND_BALANCE.value,
+            _route_after_analysis,
+            {
+                WorkflowStep.CALCULATE_GAS.value: WorkflowStep.CALCULATE_GAS.value,
+                WorkflowStep.REJECT_TRANSACTION.value: WorkflowStep.REJECT_TRANSACTION.value
+            }
+        )
+        workflow.add_edge(WorkflowStep.CALCULATE_GAS.value, WorkflowStep.EVALUATE_RISK.value)
         
         # Conditional edge: approve or reject
         workflow.add_conditional_edges(
-            "evaluate_risk",
-            self._should_approve,
+            WorkflowStep.EVALUATE_RISK.value,
+            # "approved" is always present (see _EMPTY_STATE) and a bool
+            operator.itemgetter("approved"),
             {
-                "approve": "execute_transaction",
-                "reject": "reject_transaction"
+                True: WorkflowStep.EXECUTE_TRANSACTION.value,
+                False: WorkflowStep.REJECT_TRANSACTION.value
             }
         )
         
-        workflow.add_edge("execute_transaction", "evaluate_outcome")
-        workflow.add_edge("evaluate_outcome", "log_decision")
-        workflow.add_edge("reject_transaction", "log_decision")
-        workflow.add_edge("log_decision", END)
+        workflow.add_edge(WorkflowStep.EXECUTE_TRANSACTION.value, WorkflowStep.EVALUATE_OUTCOME.value)
+        workflow.add_edge(WorkflowStep.EVALUATE_OUTCOME.value, WorkflowStep.LOG_DECISION.value)
+        workflow.add_edge(WorkflowStep.REJECT_TRANSACTION.value, WorkflowStep.LOG_DECISION.value)
+        workflow.add_edge(WorkflowStep.LOG_DECISION.value, END)
         
         return workflow
     
-    async def _broadcast_update(self, event_type: str, data: Dict[str, Any]):
-        """Broadcast workflow updates via WebSocket"""
-        if self.websocket_manager:
+    async def _broadcast_update(self, event_type: WorkflowEvent, data: Dict[str, Any]):
+        """Queue a workflow update for the next WebSocket broadcast"""
+        if not self.websocket_manager:
+            return
+        
+        self._broadcast_buf.append({
+            "type": event_type,
+            "data": data,
+            "timestamp": _iso_now_ms()
+        })
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._broadcast_flusher())
+        if len(self._broadcast_buf) >= _BROADCAST_MAX_BUFFER:
+            self._broadcast_wakeup.set()
+    
+    async def _broadcast_flusher(self):
+        """Send buffered updates every _BROADCAST_FLUSH_INTERVAL until none are left"""
+        while self._broadcast_buf:
             try:
-                await self.websocket_manager.broadcast({
-                    "type": event_type,
-                    "data": data,
-                    "timestamp": datetime.now().isoformat()
-                }, channel="agents")
-            except Exception as e:
-                logger.warning(f"Failed to broadcast update: {e}")
+                await asyncio.wait_for(self._broadcast_wakeup.wait(), _BROADCAST_FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._broadcast_wakeup.clear()
+            await self._flush_broadcasts()
+    
+    async def _flush_broadcasts(self):
+        """Send everything buffered as one frame per client"""
+        events, self._broadcast_buf = self._broadcast_buf, []
+        if not events:
+            return
+        try:
+            await self.websocket_manager.broadcast({
+                "type": "multi",
+                "events": events,
+                "timestamp": _iso_now_ms()
+            }, channel="agents")
+        except Exception as e:
+            logger.warning("Failed to broadcast %s updates: %s", len(events), e)
     
     async def request_manual_approval(
         self,
@@ -179,19 +672,19 @@ class OrchestratorAgent:
         approval_id = f"approval_{request_id}_{int(datetime.now().timestamp())}"
         
         # Store pending approval
-        self.pending_approvals[approval_id] = state
+        self._hold_pending(approval_id, state)
         
         # Broadcast approval request via WebSocket
-        await self._broadcast_update("approval_required", {
+        await self._broadcast_update(WorkflowEvent.APPROVAL_REQUIRED, {
             "approval_id": approval_id,
             "request_id": request_id,
             "user_request": state.get("user_request"),
-            "plan": state.get("plan"),
+            "plan": _plan_dict(state.get("plan")),
             "reason": reason,
             "wallet_address": state.get("wallet_address")
         })
         
-        logger.info(f"Manual approval requested: {approval_id}")
+        logger.info("Manual approval requested: %s", approval_id)
         return approval_id
     
     async def handle_approval_response(
@@ -211,51 +704,66 @@ class OrchestratorAgent:
         Returns:
             Result of continuing workflow or rejection
         """
-        if approval_id not in self.pending_approvals:
+        # Taken up front so a repeated response cannot execute twice
+        state = self._take_pending(approval_id)
+        if state is None:
             return {
                 "success": False,
                 "error": "Approval request not found or expired"
             }
         
-        state = self.pending_approvals[approval_id]
-        
         # Broadcast approval response
-        await self._broadcast_update("approval_response", {
+        await self._broadcast_update(WorkflowEvent.APPROVAL_RESPONSE, {
             "approval_id": approval_id,
             "approved": approved,
             "user_id": user_id
         })
         
         if approved:
-            logger.info(f"Transaction approved by user: {approval_id}")
+            logger.info("Transaction approved by user: %s", approval_id)
             # Update state and continue workflow
             state["approved"] = True
             
-            # Continue from execution step
-            state = await self._execute_transaction(state)
-            state = await self._evaluate_outcome(state)
-            state = await self._log_decision(state)
+            # Continue from execution step. The decision is logged even if
+            # execution times out or the caller goes away mid-way
+            timed_out = False
+            try:
+                async with asyncio.timeout(_APPROVED_EXECUTION_TIMEOUT):
+                    for step in (self._execute_transaction, self._evaluate_outcome):
+                        _apply_update(state, await step(state))
+            except TimeoutError:
+                timed_out = True
+                if state.get("execution_result") is None:
+                    logger.error("Approved execution timed out: %s", approval_id)
+                    state["execution_result"] = _interrupted_execution(state)
+                    state["error"] = state["execution_result"]["error"]
+                else:
+                    logger.error("Outcome evaluation timed out: %s", approval_id)
+                    state["error"] = "Outcome evaluation timed out"
+            finally:
+                _apply_update(state, await asyncio.shield(self._log_decision(state)))
             
-            # Clean up
-            del self.pending_approvals[approval_id]
+            if timed_out:
+                return {
+                    "success": bool(state["execution_result"].get("success")),
+                    "error": state["error"],
+                    "execution": state.get("execution_result")
+                }
             
             return {
                 "success": True,
-                "result": state.get("final_result"),
+                "result": _format_result_timestamp(state.get("final_result")),
                 "execution": state.get("execution_result")
             }
         else:
-            logger.info(f"Transaction rejected by user: {approval_id}")
+            logger.info("Transaction rejected by user: %s", approval_id)
             state["approved"] = False
-            state = await self._reject_transaction(state)
-            state = await self._log_decision(state)
-            
-            # Clean up
-            del self.pending_approvals[approval_id]
+            for step in (self._reject_transaction, self._log_decision):
+                _apply_update(state, await step(state))
             
             return {
                 "success": False,
-                "result": state.get("final_result"),
+                "result": _format_result_timestamp(state.get("final_result")),
                 "reason": "Rejected by user"
             }
     
@@ -282,17 +790,17 @@ class OrchestratorAgent:
         clarification_id = f"clarify_{request_id}_{int(datetime.now().timestamp())}"
         
         # Store pending clarification
-        self.pending_approvals[clarification_id] = state
+        self._hold_pending(clarification_id, state)
         
         # Broadcast clarification request
-        await self._broadcast_update("clarification_required", {
+        await self._broadcast_update(WorkflowEvent.CLARIFICATION_REQUIRED, {
             "clarification_id": clarification_id,
             "request_id": request_id,
             "question": question,
             "original_request": state.get("user_request")
         })
         
-        logger.info(f"Clarification requested: {clarification_id}")
+        logger.info("Clarification requested: %s", clarification_id)
         return clarification_id
     
     async def handle_clarification_response(
@@ -312,21 +820,17 @@ class OrchestratorAgent:
         Returns:
             Result of restarting workflow with clarified request
         """
-        if clarification_id not in self.pending_approvals:
+        state = self._take_pending(clarification_id)
+        if state is None:
             return {
                 "success": False,
                 "error": "Clarification request not found or expired"
             }
         
-        state = self.pending_approvals[clarification_id]
-        
         # Update request with clarification
         original_request = state.get("user_request", "")
         clarified_request = f"{original_request}. {answer}"
         
-        # Clean up
-        del self.pending_approvals[clarification_id]
-        
         # Restart workflow with clarified request
         return await self.process_request(
             user_request=clarified_request,
@@ -336,13 +840,46 @@ class OrchestratorAgent:
             spending_limit=state.get("spending_limit")
         )
     
+    def _hold_pending(self, pending_id: str, state: AgentState):
+        """Keep a workflow state until the user responds or the TTL runs out"""
+        expires_at = time.monotonic() + self.approval_ttl_seconds
+        pending = _PendingRequest(
+            state=state,
+            wallet_address=state.get("wallet_address", ""),
+            user_id=state.get("user_id", ""),
+            expires_at=expires_at
+        )
+        with self._pending_lock:
+            self._evict_expired_pending()
+            self.pending_approvals[pending_id] = pending
+            heapq.heappush(self._pending_expiry, (expires_at, pending_id))
+    
+    def _take_pending(self, pending_id: str) -> Optional[AgentState]:
+        """Remove and return a pending state (None if unknown or expired)"""
+        with self._pending_lock:
+            self._evict_expired_pending()
+            pending = self.pending_approvals.pop(pending_id, None)
+        return pending.state if pending else None
+    
+    def _evict_expired_pending(self):
+        """Drop expired entries from the front of the expiry heap (caller holds _pending_lock)"""
+        now = time.monotonic()
+        heap = self._pending_expiry
+        while heap and heap[0][0] <= now:
+            expires_at, pending_id = heapq.heappop(heap)
+            pending = self.pending_approvals.get(pending_id)
+            # Skip heap entries for ids answered or re-registered since
+            if pending is not None and pending.expires_at == expires_at:
+                del self.pending_approvals[pending_id]
+    
     async def process_request(
         self,
         user_request: str,
         user_id: str,
         wallet_address: str,
         network: str = "sepolia",
-        spending_limit: Optional[float] = None
+        spending_limit: Optional[float] = None,
+        cache_policy: str = "read_write"
     ) -> Dict[str, Any]:
         """
         Process user request through multi-agent workflow.
@@ -353,446 +890,750 @@ class OrchestratorAgent:
             wallet_address: Agent wallet address
             network: Target blockchain network
             spending_limit: Optional spending limit
+            cache_policy: "read_write" reuses and stores planner output,
+                "refresh" replans and stores, "bypass" skips the plan cache
         
         Returns:
             Final result with transaction outcome or rejection reason
         """
-        logger.info(f"Orchestrating request: {user_request[:100]}...")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Orchestrating request: %s...", user_request[:100])
+        
+        reason = self._fast_reject(user_request, spending_limit)
+        if reason:
+            return self._policy_rejection(reason)
+        
+        await self.open_session()
+        initial_state, cache_key = self._build_initial_state(
+            user_request, user_id, wallet_address, network, spending_limit, cache_policy
+        )
+        
+        # Run workflow, broadcasting each step's update as it completes
+        try:
+            final_state = None
+            async for mode, chunk in self.app.astream(initial_state, stream_mode=["updates", "values"]):
+                if mode == "values":
+                    final_state = chunk
+                else:
+                    for step, update in chunk.items():
+                        await self._broadcast_update(WorkflowEvent.WORKFLOW_STEP, _step_event(step, update or {}))
+            return self._finish_request(final_state, cache_key)
+            
+        except Exception as e:
+            logger.error("Orchestration failed: %s", e, exc_info=_debug_tracebacks())
+            return {
+                "success": False,
+                "error": str(e),
+                "result": None
+            }
+    
+    async def process_requests_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        max_concurrency: int = 8,
+        rate_limit: Optional[Any] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several requests through the workflow with LangGraph's abatch.
+        
+        Args:
+            requests: process_request keyword arguments, one dict per request
+            max_concurrency: Maximum workflows running at once
+            rate_limit: Optional async context manager (e.g. aiolimiter.AsyncLimiter
+                or asyncio.Semaphore) entered around every planner/evaluator LLM call
+        
+        Returns:
+            One result per request, in order, shaped like process_request's
+        """
+        if not requests:
+            return []
+        
+        logger.info("Orchestrating batch of %s requests", len(requests))
+        
+        await self.open_session()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(requests)
+        pending = []
+        for i, request in enumerate(requests):
+            reason = self._fast_reject(request["user_request"], request.get("spending_limit"))
+            if reason:
+                results[i] = self._policy_rejection(reason)
+            else:
+                pending.append((i, *self._build_initial_state(**request)))
+        
+        if not pending:
+            return results
+        
+        config: Dict[str, Any] = {"max_concurrency": max_concurrency, "recursion_limit": 50}
+        if rate_limit is not None:
+            config["configurable"] = {"rate_limit": rate_limit}
+        
+        final_states = await self.app.abatch(
+            [state for _, state, _ in pending],
+            config=config,
+            return_exceptions=True
+        )
+        
+        for (i, _, cache_key), final_state in zip(pending, final_states):
+            if isinstance(final_state, BaseException):
+                logger.error("Orchestration failed: %s", final_state)
+                results[i] = {"success": False, "error": str(final_state), "result": None}
+            else:
+                results[i] = self._finish_request(final_state, cache_key)
+        return results
+    
+    def _fast_reject(self, user_request: str, spending_limit: Optional[float]) -> Optional[str]:
+        """Rejection reason for requests that need no planning at all, else None"""
+        if spending_limit is not None and spending_limit <= 0:
+            return "Spending limit is zero"
+        if _DENYLIST_RE.search(user_request):
+            return "Request asks for wallet secrets"
+        return None
+    
+    def _policy_rejection(self, reason: str) -> Dict[str, Any]:
+        """Result for a request rejected before the workflow ran"""
+        logger.info("Request rejected by policy: %s", reason)
+        return {
+            "success": False,
+            "error": "policy_reject",
+            "result": {"action": "rejected", "reason": reason},
+            "plan": None,
+            "execution": None,
+            "evaluation": None,
+            "steps": []
+        }
+    
+    def _build_initial_state(
+        self,
+        user_request: str,
+        user_id: str,
+        wallet_address: str,
+        network: str = "sepolia",
+        spending_limit: Optional[float] = None,
+        cache_policy: str = "read_write"
+    ) -> Tuple[AgentState, Optional[Tuple]]:
+        """
+        Initial workflow state for a request, seeded from the plan cache.
         
-        # Initialize state
-        initial_state: AgentState = {
+        Returns the state and the plan cache key (None when bypassed).
+        """
+        if cache_policy not in _CACHE_POLICIES:
+            raise ValueError(f"Invalid cache_policy: {cache_policy}")
+        
+        initial_state: AgentState = _EMPTY_STATE.copy()
+        initial_state.update({
             "user_request": user_request,
             "user_id": user_id,
             "wallet_address": wallet_address,
             "network": network,
-            "wallet_balance": None,
+            # Speculative: the balance RPC runs while the graph starts up
+            "_balance_future": self._start_balance_fetch(wallet_address, network),
             "spending_limit": spending_limit,
-            "daily_spent": 0.0,
+            # Fresh lists: the template's must never be shared between requests
             "previous_decisions": [],
-            "current_step": "start",
             "messages": [],
-            "plan": None,
-            "execution_result": None,
-            "evaluation": None,
             "api_responses": [],
-            "approved": False,
-            "final_result": None,
-            "error": None
+        })
+        
+        cache_key = None
+        if cache_policy != "bypass":
+            cache_key = PlanCache.make_key(user_request, wallet_address, network, spending_limit)
+            cached = self.plan_cache.get(cache_key) if cache_policy == "read_write" else None
+            if cached:
+                initial_state["plan"] = cached["plan"]
+                initial_state["plan_cached"] = True
+                logger.info("Plan cache hit, skipping planner calls (~%s tokens saved)", cached['tokens'])
+            elif cache_policy == "read_write":
+                # Intent does not depend on the spending limit
+                initial_state["intent_cache_key"] = cache_key[:3]
+        
+        return initial_state, cache_key
+    
+    def _finish_request(self, final_state: AgentState, cache_key: Optional[Tuple]) -> Dict[str, Any]:
+        """Cache a fresh plan and shape the final state into the request result"""
+        if cache_key and not final_state.get("plan_cached"):
+            self._cache_plan(cache_key, final_state)
+        
+        return {
+            "success": final_state.get("approved", False),
+            "result": _format_result_timestamp(final_state.get("final_result")),
+            "plan": _plan_dict(final_state.get("plan")),
+            "execution": final_state.get("execution_result"),
+            "evaluation": final_state.get("evaluation"),
+            "error": final_state.get("error"),
+            "steps": [msg.content for msg in final_state.get("messages", [])]
         }
+    
+    def _cache_plan(self, cache_key: Tuple, state: AgentState):
+        """Store a freshly generated plan (not fallbacks or failed runs)"""
+        plan = state.get("plan")
+        if not plan or state.get("error") or plan.action == "reject":
+            return
         
-        # Run workflow
-        try:
-            final_state = await self.app.ainvoke(initial_state)
-            
-            return {
-                "success": final_state.get("approved", False),
-                "result": final_state.get("final_result"),
-                "plan": final_state.get("plan"),
-                "execution": final_state.get("execution_result"),
-                "evaluation": final_state.get("evaluation"),
-                "error": final_state.get("error"),
-                "steps": [msg.content for msg in final_state.get("messages", [])]
-            }
-            
-        except Exception as e:
-            logger.error(f"Orchestration failed: {str(e)}", exc_info=True)
-            return {
-                "success": False,
-                "error": str(e),
-                "result": None
-            }
+        # Rough estimate (~4 chars/token) of the two planner calls a hit skips
+        prompt_chars = len(self.planner.get_system_prompt()) + len(state["user_request"])
+        tokens = (2 * prompt_chars + len(str(plan))) // 4
+        self.plan_cache.put(cache_key, {"plan": plan, "tokens": tokens})
     
     # Workflow node implementations
     
-    async def _analyze_intent(self, state: AgentState) -> AgentState:
-        """Step 1: Analyze user intent with Planner"""
-        logger.info("Step 1: Analyzing intent...")
-        
-        state["current_step"] = "analyze_intent"
-        state["messages"].append(HumanMessage(content=f"Analyzing: {state['user_request']}"))
+    def _start_balance_fetch(self, wallet_address: str, network: str) -> "asyncio.Future":
+        """
+        Start the wallet balance lookup; never raises.
         
+        A missing service or an incompatible get_balance (sync, or with a
+        different signature) fails the returned future instead, which
+        _analyze_and_balance turns into a 0.0 balance.
+        """
         try:
-            context = DecisionContext(
+            get_balance = self.blockchain_service.get_balance
+            if inspect.iscoroutinefunction(get_balance):
+                return asyncio.ensure_future(get_balance(wallet_address, network))
+            return asyncio.ensure_future(asyncio.to_thread(get_balance, wallet_address, network))
+        except Exception as e:
+            future = asyncio.get_running_loop().create_future()
+            future.set_exception(e)
+            return future
+    
+    def _decision_context(self, state: AgentState) -> DecisionContext:
+        """The request's DecisionContext, built once and kept in state"""
+        context = state.get("context")
+        if context is None:
+            # Built from already-validated request fields, so validation is skipped
+            context = DecisionContext.model_construct(
                 user_id=state["user_id"],
                 wallet_address=state["wallet_address"],
                 request=state["user_request"],
                 network=state["network"],
                 wallet_balance=state.get("wallet_balance")
             )
-            
-            response = await self.planner.process(context)
-            
-            state["messages"].append(AIMessage(content=f"Intent analyzed: {response.reasoning}"))
-            
-            return state
-            
-        except Exception as e:
-            logger.error(f"Intent analysis failed: {e}")
-            state["error"] = str(e)
-            return state
+            state["context"] = context
+        return context
+    
+    async def _rate_limited(self, config: Optional[RunnableConfig], call: Awaitable) -> Any:
+        """Await an LLM-backed call under the batch rate limit, if one is configured"""
+        limiter = ((config or {}).get("configurable") or {}).get("rate_limit")
+        if limiter is None:
+            return await call
+        async with limiter:
+            return await call
+    
+    def _intent_task(
+        self,
+        key: Optional[Tuple[str, str, str]],
+        config: Optional[RunnableConfig],
+        context: DecisionContext
+    ) -> "asyncio.Future":
+        """
+        Planner intent analysis, shared between identical requests.
+        
+        A retry within _INTENT_CACHE_TTL, even one arriving while the first
+        call is still running, awaits the same task instead of calling the
+        LLM again. Failed analyses are dropped so the next request retries.
+        """
+        if key is None:
+            return asyncio.create_task(self._rate_limited(config, self.planner.process(context)))
+        
+        cached = self.intent_cache.get(key)
+        if cached is None:
+            task = asyncio.create_task(self._rate_limited(config, self.planner.process(context)))
+            task.add_done_callback(functools.partial(self._drop_failed_intent, key))
+            cached = {"task": task}
+            self.intent_cache.put(key, cached)
+        # Shielded: one request being cancelled must not cancel the shared call
+        return asyncio.shield(cached["task"])
     
-    async def _check_balance(self, state: AgentState) -> AgentState:
-        """Step 2: Check wallet balance"""
-        logger.info("Step 2: Checking balance...")
+    def _drop_failed_intent(self, key: Tuple[str, str, str], task: "asyncio.Task"):
+        if task.cancelled() or task.exception() is not None or not task.result().success:
+            cached = self.intent_cache.get(key)
+            if cached is not None and cached["task"] is task:
+                self.intent_cache.discard(key)
+    
+    @_workflow_step(WorkflowStep.ANALYZE_AND_BALANCE)
+    async def _analyze_and_balance(
+        self,
+        state: AgentState,
+        config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
+        """Steps 1-2: Analyze user intent with Planner and check wallet balance, concurrently"""
+        logger.info("Steps 1-2: Analyzing intent and checking balance...")
         
-        state["current_step"] = "check_balance"
+        messages: List[BaseMessage] = [HumanMessage(content=f"Analyzing: {state['user_request']}")]
+        update: Dict[str, Any] = {"current_step": WorkflowStep.ANALYZE_AND_BALANCE, "messages": messages}
         
-        try:
-            balance = await self.blockchain_service.get_balance(
-                state["wallet_address"],
-                state["network"]
-            )
-            
-            state["wallet_balance"] = balance
-            state["messages"].append(AIMessage(content=f"Balance: {balance} ETH"))
-            
-            logger.info(f"Wallet balance: {balance} ETH")
-            
-        except Exception as e:
-            logger.warning(f"Balance check failed: {e}")
-            state["wallet_balance"] = 0.0
+        balance_task = state.get("_balance_future") or self._start_balance_fetch(
+            state["wallet_address"], state["network"]
+        )
+        context = self._decision_context(state)
+        if state.get("plan_cached"):
+            intent_task = None
+        else:
+            intent_task = self._intent_task(state.get("intent_cache_key"), config, context)
+        
+        # Independent calls: one failing must not cancel the other
+        tasks = [balance_task] if intent_task is None else [balance_task, intent_task]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        balance = results[0]
+        
+        if intent_task is None:
+            messages.append(AIMessage(content="Intent analyzed: reusing cached plan"))
+        elif isinstance(results[1], BaseException):
+            logger.error("Intent analysis failed: %s", results[1])
+            update["error"] = str(results[1])
+        else:
+            messages.append(AIMessage(content=f"Intent analyzed: {results[1].reasoning}"))
         
-        return state
+        if isinstance(balance, BaseException):
+            logger.warning("Balance check failed: %s", balance)
+            balance = 0.0
+            update["balance_error"] = True
+        else:
+            messages.append(AIMessage(content=f"Balance: {balance} ETH"))
+            logger.info("Wallet balance: %s ETH", balance)
+        
+        update["wallet_balance"] = balance
+        update["context"] = context.model_copy(update={"wallet_balance": balance})
+        return update
     
-    async def _calculate_gas(self, state: AgentState) -> AgentState:
-        """Step 3: Calculate gas costs with Planner"""
+    @_workflow_step(WorkflowStep.CALCULATE_GAS, on_error="_gas_failed")
+    async def _calculate_gas(
+        self,
+        state: AgentState,
+        config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
+        """
+        Step 3: Calculate gas costs with Planner.
+        
+        A plan taken from the PlanCache is reported without calling the
+        Planner again.
+        """
         logger.info("Step 3: Calculating gas...")
         
-        state["current_step"] = "calculate_gas"
+        if state.get("plan_cached"):
+            plan = state["plan"]
+            return {
+                "current_step": WorkflowStep.CALCULATE_GAS,
+                "messages": [
+                    AIMessage(content=f"Plan (cached): {plan.action}, Gas: {plan.estimated_gas} ETH, Risk: {plan.risk_level}")
+                ]
+            }
         
-        try:
-            context = DecisionContext(
-                user_id=state["user_id"],
-                wallet_address=state["wallet_address"],
-                request=state["user_request"],
-                network=state["network"],
-                wallet_balance=state["wallet_balance"]
-            )
-            
-            plan = await self.planner.plan_transaction(
-                context,
-                wallet_balance=state["wallet_balance"],
-                spending_limit=state.get("spending_limit")
-            )
-            
-            state["plan"] = plan.dict()
-            state["messages"].append(
-                AIMessage(content=f"Plan: {plan.action}, Gas: {plan.estimated_gas} ETH, Risk: {plan.risk_level}")
-            )
-            
-            logger.info(f"Transaction plan: {plan.action} with {plan.risk_level} risk")
-            
-        except Exception as e:
-            logger.error(f"Gas calculation failed: {e}")
-            state["error"] = str(e)
+        context = self._decision_context(state)
+        
+        plan = await self._rate_limited(config, self.planner.plan_transaction(
+            context,
+            wallet_balance=state["wallet_balance"],
+            spending_limit=state.get("spending_limit")
+        ))
+        
+        logger.info("Transaction plan: %s with %s risk", plan.action, plan.risk_level)
         
-        return state
+        return {
+            "current_step": WorkflowStep.CALCULATE_GAS,
+            "plan": plan,
+            "messages": [
+                AIMessage(content=f"Plan: {plan.action}, Gas: {plan.estimated_gas} ETH, Risk: {plan.risk_level}")
+            ]
+        }
     
-    async def _evaluate_risk(self, state: AgentState) -> AgentState:
+    @_workflow_step(WorkflowStep.EVALUATE_RISK, on_error="_risk_failed")
+    async def _evaluate_risk(self, state: AgentState) -> Dict[str, Any]:
         """Step 4: Evaluate risk with Planner"""
         logger.info("Step 4: Evaluating risk...")
         
-        state["current_step"] = "evaluate_risk"
-        
         if not state.get("plan"):
-            state["approved"] = False
-            state["error"] = "No plan available for risk evaluation"
-            return state
+            return {
+                "current_step": WorkflowStep.EVALUATE_RISK,
+                "approved": False,
+                "error": "No plan available for risk evaluation"
+            }
         
-        try:
-            plan_dict = state["plan"]
-            if not isinstance(plan_dict, dict):
-                state["approved"] = False
-                state["error"] = "Invalid plan format"
-                return state
-            
-            plan = TransactionPlan(**plan_dict)
-            
-            # Broadcast risk evaluation update
-            await self._broadcast_update("risk_evaluation", {
-                "request": state["user_request"],
-                "risk_level": plan.risk_level,
-                "amount": plan.amount,
-                "requires_approval": plan.requires_approval
+        plan = state["plan"]
+        
+        # Broadcast risk evaluation update
+        await self._broadcast_update(WorkflowEvent.RISK_EVALUATION, {
+            "request": state["user_request"],
+            "risk_level": plan.risk_level,
+            "amount": plan.amount,
+            "requires_approval": plan.requires_approval
+        })
+        
+        # Analyze financial feasibility
+        wallet_balance = state.get("wallet_balance") or 0.0
+        analysis = await self.planner.analyze_financial_feasibility(
+            plan,
+            wallet_balance=wallet_balance,
+            spending_limit=state.get("spending_limit"),
+            daily_spent=state.get("daily_spent") or 0.0
+        )
+        
+        # Check for insufficient funds
+        if not analysis.balance_sufficient:
+            required = (plan.amount or 0.0) + (plan.estimated_gas or 0.0)
+            await self._broadcast_update(WorkflowEvent.INSUFFICIENT_FUNDS, {
+                "required": required,
+                "available": wallet_balance,
+                "deficit": required - wallet_balance
             })
-            
-            # Analyze financial feasibility
-            analysis = await self.planner.analyze_financial_feasibility(
-                plan,
-                wallet_balance=state.get("wallet_balance") or 0.0,
-                spending_limit=state.get("spending_limit"),
-                daily_spent=state.get("daily_spent", 0.0)
-            )
-            
-            # Check for insufficient funds
-            if not analysis.balance_sufficient:
-                await self._broadcast_update("insufficient_funds", {
-                    "required": (plan.amount or 0) + (plan.estimated_gas or 0),
-                    "available": state.get("wallet_balance", 0),
-                    "deficit": (plan.amount or 0) + (plan.estimated_gas or 0) - (state.get("wallet_balance") or 0)
-                })
-                state["approved"] = False
-                state["error"] = f"Insufficient funds: need {(plan.amount or 0) + (plan.estimated_gas or 0)} ETH, have {state.get('wallet_balance', 0)} ETH"
-                return state
-            
-            # Check if manual approval required (high-risk transaction)
-            if plan.requires_approval or plan.risk_level == "high":
-                reason = f"High-risk transaction: {plan.risk_level} risk level"
-                if analysis.warnings:
-                    reason += f". Warnings: {', '.join(analysis.warnings)}"
-                
-                # Don't auto-approve, let the API handler deal with manual approval
-                state["approved"] = False
-                state["requires_manual_approval"] = True
-                state["approval_reason"] = reason
-                
-                state["messages"].append(AIMessage(content=f"Manual approval required: {reason}"))
-                logger.info(f"Manual approval required: {reason}")
-                return state
-            
-            # Auto-approve low-risk transactions
-            state["approved"] = analysis.can_execute
-            
-            reasoning = f"Risk: {plan.risk_level}, Can execute: {analysis.can_execute}"
+            return {
+                "current_step": WorkflowStep.EVALUATE_RISK,
+                "approved": False,
+                "error": f"Insufficient funds: need {required} ETH, have {wallet_balance} ETH"
+            }
+        
+        # Check if manual approval required (high-risk transaction)
+        if plan.requires_approval or plan.risk_level == "high":
+            reason = f"High-risk transaction: {plan.risk_level} risk level"
             if analysis.warnings:
-                reasoning += f", Warnings: {', '.join(analysis.warnings)}"
-            
-            state["messages"].append(AIMessage(content=reasoning))
-            
-            await self._broadcast_update("risk_evaluated", {
-                "approved": state["approved"],
-                "risk_level": plan.risk_level,
-                "reasoning": reasoning
-            })
+                reason += f". Warnings: {', '.join(analysis.warnings)}"
             
-            logger.info(f"Risk evaluation: {'Approved' if state['approved'] else 'Rejected'}")
-            
-        except Exception as e:
-            logger.error(f"Risk evaluation failed: {e}")
-            state["approved"] = False
-            state["error"] = str(e)
+            # Don't auto-approve, let the API handler deal with manual approval
+            logger.info("Manual approval required: %s", reason)
+            return {
+                "current_step": WorkflowStep.EVALUATE_RISK,
+                "approved": False,
+                "requires_manual_approval": True,
+                "approval_reason": reason,
+                "messages": [AIMessage(content=f"Manual approval required: {reason}")]
+            }
         
-        return state
-    
-    def _should_approve(self, state: AgentState) -> str:
-        """Conditional edge: determine if transaction should be approved"""
-        return "approve" if state.get("approved", False) else "reject"
+        # Auto-approve low-risk transactions
+        approved = analysis.can_execute
+        
+        reasoning = f"Risk: {plan.risk_level}, Can execute: {analysis.can_execute}"
+        if analysis.warnings:
+            reasoning += f", Warnings: {', '.join(analysis.warnings)}"
+        
+        await self._broadcast_update(WorkflowEvent.RISK_EVALUATED, {
+            "approved": approved,
+            "risk_level": plan.risk_level,
+            "reasoning": reasoning
+        })
+        
+        logger.info("Risk evaluation: %s", 'Approved' if approved else 'Rejected')
+        
+        return {
+            "current_step": WorkflowStep.EVALUATE_RISK,
+            "approved": approved,
+            "messages": [AIMessage(content=reasoning)]
+        }
     
-    async def _execute_transaction(self, state: AgentState) -> AgentState:
+    @_workflow_step(WorkflowStep.EXECUTE_TRANSACTION, on_error="_execution_failed")
+    async def _execute_transaction(self, state: AgentState) -> Dict[str, Any]:
         """Step 5: Execute transaction with Executor"""
         logger.info("Step 5: Executing transaction...")
         
-        state["current_step"] = "execute_transaction"
-        
         if not state.get("plan"):
-            state["error"] = "No plan available for execution"
-            return state
+            return {"current_step": WorkflowStep.EXECUTE_TRANSACTION, "error": "No plan available for execution"}
         
-        try:
-            plan_dict = state["plan"]
-            if not isinstance(plan_dict, dict):
-                state["error"] = "Invalid plan format"
-                return state
-                
-            plan = TransactionPlan(**plan_dict)
-            
-            # Broadcast execution start
-            await self._broadcast_update("execution_started", {
-                "action": plan.action,
-                "to_address": plan.to_address,
-                "amount": plan.amount
+        plan = state["plan"]
+        
+        # Broadcast execution start
+        await self._broadcast_update(WorkflowEvent.EXECUTION_STARTED, {
+            "action": plan.action,
+            "to_address": plan.to_address,
+            "amount": plan.amount
+        })
+        
+        # Step 1: Log decision to IPFS and blockchain (FR-007)
+        logger.info("Logging decision to IPFS and blockchain...")
+        decision_data = {
+            "transaction_plan": plan.as_json_fragment(),
+            "risk_analysis": {
+                "risk_level": plan.risk_level,
+                "reasoning": plan.reasoning,
+                "estimated_gas": plan.estimated_gas
+            },
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "wallet_address": state["wallet_address"],
+            "user_request": state["user_request"]
+        }
+        
+        decision_hash, ipfs_cid, log_success = await self.executor.log_decision_on_chain(
+            decision_data=decision_data,
+            agent_wallet_address=state["wallet_address"],
+            network=plan.network
+        )
+        
+        if log_success:
+            await self._broadcast_update(WorkflowEvent.DECISION_LOGGED, {
+                "decision_hash": decision_hash,
+                "ipfs_cid": ipfs_cid
             })
-            
-            # Step 1: Log decision to IPFS and blockchain (FR-007)
-            logger.info("Logging decision to IPFS and blockchain...")
-            decision_data = {
-                "transaction_plan": plan_dict,
-                "risk_analysis": {
-                    "risk_level": plan.risk_level,
-                    "reasoning": plan.reasoning,
-                    "estimated_gas": plan.estimated_gas
-                },
-                "timestamp": datetime.utcnow().isoformat(),
-                "wallet_address": state["wallet_address"],
-                "user_request": state["user_request"]
-            }
-            
-            decision_hash, ipfs_cid, log_success = await self.executor.log_decision_on_chain(
-                decision_data=decision_data,
-                agent_wallet_address=state["wallet_address"],
-                network=plan.network
-            )
-            
-            if log_success:
-                await self._broadcast_update("decision_logged", {
-                    "decision_hash": decision_hash,
-                    "ipfs_cid": ipfs_cid
-                })
-                logger.info(f"Decision logged: hash={decision_hash}, ipfs={ipfs_cid}")
-            else:
-                logger.warning("Decision logging failed, continuing anyway")
-            
-            # Step 2: Execute transaction
-            exec_plan = ExecutionPlan(
-                transaction_type=plan.action,
-                to_address=plan.to_address or "0x0000000000000000000000000000000000000000",
-                amount=plan.amount or 0.0,
-                network=plan.network,
-                gas_limit=int((plan.estimated_gas or 0.001) * 1e9)  # Convert to gas units
-            )
-            
-            context = DecisionContext(
-                user_id=state["user_id"],
-                wallet_address=state["wallet_address"],
-                request=state["user_request"],
-                network=state["network"]
-            )
-            
-            result = await self.executor.execute_with_retry(
-                context,
-                exec_plan,
-                state["wallet_address"]
-            )
-            
-            state["execution_result"] = {
-                "success": result.success,
+            logger.info("Decision logged: hash=%s, ipfs=%s", decision_hash, ipfs_cid)
+        else:
+            logger.warning("Decision logging failed, continuing anyway")
+        
+        # Step 2: Execute transaction
+        exec_plan = ExecutionPlan(
+            transaction_type=plan.action,
+            to_address=plan.to_address or "0x0000000000000000000000000000000000000000",
+            amount=plan.amount or 0.0,
+            network=plan.network,
+            gas_limit=int((plan.estimated_gas or 0.001) * 1e9)  # Convert to gas units
+        )
+        state["_execution_plan"] = exec_plan
+        
+        context = self._decision_context(state)
+        
+        result = await self.executor.execute_with_retry(
+            context,
+            exec_plan,
+            state["wallet_address"]
+        )
+        
+        execution_result = {
+            "success": result.success,
+            "transaction_hash": result.transaction_hash,
+            "gas_used": result.gas_used,
+            "status": result.status.value,
+            "error": result.error,
+            "decision_hash": decision_hash if log_success else None,
+            "ipfs_cid": ipfs_cid if log_success else None
+        }
+        
+        if result.success:
+            await self._broadcast_update(WorkflowEvent.TRANSACTION_CONFIRMED, {
                 "transaction_hash": result.transaction_hash,
                 "gas_used": result.gas_used,
-                "status": result.status.value,
+                "decision_hash": decision_hash,
+                "ipfs_cid": ipfs_cid
+            })
+            message = AIMessage(content=f"Transaction executed: {result.transaction_hash}")
+            logger.info("Transaction successful: %s", result.transaction_hash)
+        else:
+            await self._broadcast_update(WorkflowEvent.TRANSACTION_FAILED, {
                 "error": result.error,
-                "decision_hash": decision_hash if log_success else None,
-                "ipfs_cid": ipfs_cid if log_success else None
-            }
-            
-            if result.success:
-                await self._broadcast_update("transaction_confirmed", {
-                    "transaction_hash": result.transaction_hash,
-                    "gas_used": result.gas_used,
-                    "decision_hash": decision_hash,
-                    "ipfs_cid": ipfs_cid
-                })
-                state["messages"].append(
-                    AIMessage(content=f"Transaction executed: {result.transaction_hash}")
-                )
-                logger.info(f"Transaction successful: {result.transaction_hash}")
-            else:
-                await self._broadcast_update("transaction_failed", {
-                    "error": result.error,
-                    "status": result.status.value
-                })
-                state["messages"].append(
-                    AIMessage(content=f"Transaction failed: {result.error}")
-                )
-                logger.warning(f"Transaction failed: {result.error}")
-            
-        except Exception as e:
-            logger.error(f"Execution failed: {e}", exc_info=True)
-            await self._broadcast_update("execution_error", {
-                "error": str(e)
+                "status": result.status.value
             })
-            state["execution_result"] = {
-                "success": False,
-                "error": str(e)
-            }
+            message = AIMessage(content=f"Transaction failed: {result.error}")
+            logger.warning("Transaction failed: %s", result.error)
         
-        return state
+        return {
+            "current_step": WorkflowStep.EXECUTE_TRANSACTION,
+            "execution_result": execution_result,
+            "messages": [message]
+        }
     
-    async def _evaluate_outcome(self, state: AgentState) -> AgentState:
+    @_workflow_step(WorkflowStep.EVALUATE_OUTCOME, on_error="_evaluation_failed")
+    async def _evaluate_outcome(
+        self,
+        state: AgentState,
+        config: Optional[RunnableConfig] = None
+    ) -> Dict[str, Any]:
         """Step 6: Evaluate outcome with Evaluator"""
         logger.info("Step 6: Evaluating outcome...")
         
-        state["current_step"] = "evaluate_outcome"
-        
-        if not state.get("execution_result") or not state.get("plan"):
-            return state
+        execution_result = state.get("execution_result")
+        if not execution_result or not state.get("plan"):
+            return {"current_step": WorkflowStep.EVALUATE_OUTCOME}
         
-        try:
-            context = DecisionContext(
-                user_id=state["user_id"],
-                wallet_address=state["wallet_address"],
-                request=state["user_request"],
-                network=state["network"]
-            )
-            
-            outcome = await self.evaluator.evaluate_transaction(
-                context,
-                state["execution_result"],
-                state["plan"]
-            )
-            
-            state["evaluation"] = {
-                "criteria": outcome.criteria.value,
-                "success": outcome.success,
-                "gas_efficiency": outcome.gas_efficiency,
-                "lessons_learned": outcome.lessons_learned,
-                "recommendation": outcome.recommendation
+        # A transaction that failed needs no evaluator (LLM) round-trip
+        if not execution_result.get("success") and execution_result.get("status") in _LOCAL_EVAL_STATUSES:
+            logger.info("Evaluation: failure (not sent to evaluator)")
+            return {
+                "current_step": WorkflowStep.EVALUATE_OUTCOME,
+                "evaluation": {
+                    **_FAILED_EXECUTION_EVALUATION,
+                    "lessons_learned": [],
+                    "recommendation": f"Not executed: {execution_result.get('error') or 'unknown error'}"
+                },
+                "messages": [_FAILED_EXECUTION_MESSAGE]
             }
-            
-            state["messages"].append(
-                AIMessage(content=f"Evaluation: {outcome.criteria.value}, {outcome.recommendation}")
-            )
-            
-            logger.info(f"Evaluation: {outcome.criteria.value}")
-            
-        except Exception as e:
-            logger.error(f"Evaluation failed: {e}")
-            state["evaluation"] = {"error": str(e)}
         
-        return state
+        context = self._decision_context(state)
+        
+        outcome = await self._rate_limited(config, self.evaluator.evaluate_transaction(
+            context,
+            state["execution_result"],
+            state["plan"].as_dict()
+        ))
+        
+        evaluation = {
+            "criteria": outcome.criteria.value,
+            "success": outcome.success,
+            "gas_efficiency": outcome.gas_efficiency,
+            "lessons_learned": outcome.lessons_learned,
+            "recommendation": outcome.recommendation
+        }
+        
+        logger.info("Evaluation: %s", outcome.criteria.value)
+        
+        return {
+            "current_step": WorkflowStep.EVALUATE_OUTCOME,
+            "evaluation": evaluation,
+            "messages": [
+                AIMessage(content=f"Evaluation: {outcome.criteria.value}, {outcome.recommendation}")
+            ]
+        }
     
-    async def _reject_transaction(self, state: AgentState) -> AgentState:
+    @_workflow_step(WorkflowStep.REJECT_TRANSACTION)
+    async def _reject_transaction(self, state: AgentState) -> Dict[str, Any]:
         """Handle transaction rejection"""
         logger.info("Transaction rejected")
         
-        state["current_step"] = "reject_transaction"
-        
-        plan = state.get("plan", {})
-        reason = plan.get("reasoning", "Risk too high or insufficient funds")
+        plan = state.get("plan")
+        if plan:
+            reason = plan.reasoning
+        elif state.get("wallet_balance") == 0 and not state.get("balance_error"):
+            reason = _ZERO_BALANCE_REASON
+        else:
+            reason = _DEFAULT_REJECT_REASON
         
-        state["final_result"] = {
-            "action": "rejected",
-            "reason": reason,
-            "plan": plan
+        return {
+            "current_step": WorkflowStep.REJECT_TRANSACTION,
+            "final_result": {
+                "action": "rejected",
+                "reason": reason,
+                "plan": _plan_dict(plan) or {}
+            },
+            "messages": [_rejection_message(reason)]
         }
+    
+    # Failure updates for _workflow_step (the error is already logged)
+    
+    async def _gas_failed(self, state: AgentState, error: Exception) -> Dict[str, Any]:
+        return {"error": str(error)}
+    
+    async def _risk_failed(self, state: AgentState, error: Exception) -> Dict[str, Any]:
+        return {"approved": False, "error": str(error)}
+    
+    async def _execution_failed(self, state: AgentState, error: Exception) -> Dict[str, Any]:
+        await self._broadcast_update(WorkflowEvent.EXECUTION_ERROR, {
+            "error": str(error)
+        })
+        return {"execution_result": {"success": False, "error": str(error)}}
+    
+    async def _evaluation_failed(self, state: AgentState, error: Exception) -> Dict[str, Any]:
+        return {"evaluation": {"error": str(error)}}
+    
+    async def _logging_failed(self, state: AgentState, error: Exception) -> Dict[str, Any]:
+        # Logging is best-effort; the request result stands
+        return {}
+    
+    def _queue_memory_write(self, record: Dict[str, Any]):
+        """Hand a memory record to the background writer (starting it if needed)"""
+        self._memory_queue.put_nowait(record)
+        if self._memory_writer_task is None or self._memory_writer_task.done():
+            self._memory_writer_task = asyncio.create_task(self._memory_writer())
+    
+    async def _memory_writer(self):
+        """Drain the memory queue in batches; failures are logged (nobody awaits this)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._memory_queue.get()]
+            deadline = loop.time() + _MEMORY_BATCH_WINDOW
+            while len(batch) < _MEMORY_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._memory_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            try:
+                await self._store_memory_batch(batch)
+            except Exception as e:
+                logger.error("Memory store failed for %s records: %s", len(batch), e, exc_info=_debug_tracebacks())
+            finally:
+                for _ in batch:
+                    self._memory_queue.task_done()
+    
+    async def _store_memory_batch(self, batch: List[Dict[str, Any]]):
+        """One store_batch() call when the memory service has it, else one write per record"""
+        store_batch = getattr(self.memory_service, "store_batch", None)
+        store_bytes = getattr(self.memory_service, "store_bytes", None)
+        if store_batch is None and store_bytes is None:
+            # Plain store() takes the response dict
+            for record in batch:
+                await self.memory_service.store(**record)
+            return
         
-        state["messages"].append(
-            AIMessage(content=f"Transaction rejected: {reason}")
-        )
-        
-        return state
+        # Only store_batch/store_bytes accept pre-encoded responses
+        for record in batch:
+            record["response"] = _memory_response(record["response"])
+        if store_batch is not None:
+            await store_batch(batch)
+            return
+        for record in batch:
+            if isinstance(record["response"], bytes):
+                await store_bytes(**record)
+            else:
+                await self.memory_service.store(**record)
+    
+    async def open_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session and hand it to the sub-agents/services"""
+        if self._http_session is None or self._http_session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=_HTTP_POOL_LIMIT,
+                ttl_dns_cache=_HTTP_DNS_CACHE_TTL,
+                keepalive_timeout=_HTTP_KEEPALIVE_TIMEOUT
+            )
+            self._http_session = aiohttp.ClientSession(connector=connector)
+            self._inject_session(self._http_session)
+        return self._http_session
+    
+    def _inject_session(self, session: Optional[aiohttp.ClientSession]):
+        """Pass the session to every collaborator that accepts one"""
+        for target in (self.blockchain_service, self.executor, self.communicator):
+            set_session = getattr(target, "set_session", None)
+            if callable(set_session):
+                set_session(session)
+    
+    async def __aenter__(self):
+        await self.open_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+    
+    async def close(self):
+        """Flush buffered updates, wait for background memory writes and release the HTTP pool (call on shutdown)"""
+        # Buffered on-chain decision logs and gas refreshers
+        await self.executor.close()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._broadcast_wakeup.set()
+            await self._flush_task
+        if self._memory_writer_task is not None:
+            await self._memory_queue.join()
+            self._memory_writer_task.cancel()
+            self._memory_writer_task = None
+        if self._http_session is not None:
+            self._inject_session(None)
+            await self._http_session.close()
+            self._http_session = None
     
-    async def _log_decision(self, state: AgentState) -> AgentState:
+    @_workflow_step(WorkflowStep.LOG_DECISION, on_error="_logging_failed")
+    async def _log_decision(self, state: AgentState) -> Dict[str, Any]:
         """Step 7: Log decision to memory and blockchain"""
         logger.info("Step 7: Logging decision...")
         
-        state["current_step"] = "log_decision"
+        update: Dict[str, Any] = {"current_step": WorkflowStep.LOG_DECISION}
+        logged_ns = time.time_ns()
         
-        try:
-            # Compile final result
-            if not state.get("final_result"):
-                state["final_result"] = {
-                    "action": "executed" if state.get("execution_result", {}).get("success") else "failed",
-                    "plan": state.get("plan"),
-                    "execution": state.get("execution_result"),
-                    "evaluation": state.get("evaluation"),
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            
-            # Store in memory
-            if self.memory_service:
-                await self.memory_service.store(
-                    wallet_address=state["wallet_address"],
-                    agent_type="orchestrator",
-                    request=state["user_request"],
-                    response=state["final_result"],
-                    reasoning="\n".join([msg.content for msg in state["messages"]]),
-                    timestamp=datetime.utcnow()
-                )
-            
-            state["messages"].append(AIMessage(content="Decision logged"))
-            logger.info("Decision logged successfully")
-            
-        except Exception as e:
-            logger.error(f"Logging failed: {e}")
+        # Compile final result (ISO timestamp is formatted when returned)
+        final_result = state.get("final_result")
+        if not final_result:
+            final_result = update["final_result"] = {
+                "action": _execution_action(state.get("execution_result")),
+                "plan": _plan_dict(state.get("plan")),
+                "execution": state.get("execution_result"),
+                "evaluation": state.get("evaluation"),
+                "timestamp": None,
+                "timestamp_ns": logged_ns
+            }
+        
+        # Store in memory, off the critical path
+        if self.memory_service:
+            self._queue_memory_write({
+                "wallet_address": state["wallet_address"],
+                "agent_type": "orchestrator",
+                "request": state["user_request"],
+                "response": final_result,
+                "reasoning": "\n".join(msg.content for msg in state["messages"]),
+                "timestamp": _utc_from_ns(logged_ns)
+            })
+        
+        logger.info("Decision logged successfully")
         
-        return state
\ No newline at end of file
+        update["messages"] = [AIMessage(content="Decision logged")]
+        return update
\ No newline at end of file
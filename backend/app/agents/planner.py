@@ -9,75 +9,39 @@ Responsibilities:
 - Check wallet balance and spending limits
 """
 
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
 from langchain_core.language_models import BaseChatModel
 from langchain_core.tools import BaseTool
 from langchain_core.output_parsers import PydanticOutputParser
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
+import hashlib
+import json
 import logging
+import time
 
-from .base import BaseAgent, AgentConfig, DecisionContext, AgentResponse
+from .base import ADDRESS_RE, BaseAgent, AgentConfig, DecisionContext, AgentResponse
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    logger.info("orjson not installed - plans are not pre-encoded")
+    orjson = None  # type: ignore
 
-class TransactionPlan(BaseModel):
-    """Structured output for planned transactions"""
-    action: str = Field(..., description="Action to take (transfer, contract_call, api_payment, data_purchase)")
-    to_address: Optional[str] = Field(None, description="Recipient address if applicable")
-    amount: Optional[float] = Field(None, description="Amount in ETH/tokens")
-    token: str = Field(default="ETH", description="Token symbol")
-    network: str = Field(default="sepolia", description="Target network")
-    risk_level: str = Field(..., description="Risk assessment (low, medium, high)")
-    estimated_gas: Optional[float] = Field(None, description="Estimated gas cost in ETH")
-    reasoning: str = Field(..., description="Explanation of decision")
-    requires_approval: bool = Field(default=False, description="Whether user approval needed")
-    contingencies: List[str] = Field(default_factory=list, description="Fallback plans")
-    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional context")
+# Fixed feasibility warnings/recommendations
+_HIGH_SHARE_WARNING = "Transaction uses >50% of wallet balance - high risk"
+_ADD_FUNDS_RECOMMENDATION = "Add funds to wallet or reduce transaction amount"
+_LIMIT_RECOMMENDATION = "Wait for daily limit to reset or increase spending limit"
+_APPROVAL_RECOMMENDATION = "Consider requesting human approval for high-risk transaction"
+_NETWORK_RECOMMENDATION = "Consider switching to a cheaper network (Polygon/Base)"
 
+# Plans are only reused when the planner samples (near-)deterministically
+_CACHEABLE_TEMPERATURE = 0.1
 
-class FinancialAnalysis(BaseModel):
-    """Analysis of financial feasibility"""
-    can_execute: bool
-    balance_sufficient: bool
-    within_spending_limit: bool
-    estimated_total_cost: float
-    warnings: List[str] = Field(default_factory=list)
-    recommendations: List[str] = Field(default_factory=list)
 
-
-class PlannerAgent(BaseAgent):
-    """
-    Planner Agent for high-level financial decision-making.
-    
-    Uses LangChain with Groq/Gemini to:
-    1. Understand natural language requests
-    2. Analyze financial feasibility
-    3. Assess risks
-    4. Generate structured transaction plans
-    5. Check balances and limits
-    """
-    
-    def __init__(
-        self,
-        llm: BaseChatModel,
-        tools: List[BaseTool],
-        config: Optional[AgentConfig] = None,
-        memory_service: Optional[Any] = None
-    ):
-        if config is None:
-            config = AgentConfig(
-                agent_type="planner",
-                temperature=0.3,  # Lower temperature for more deterministic financial decisions
-                max_iterations=8
-            )
-        
-        super().__init__(llm, tools, config, memory_service)
-        self.output_parser = PydanticOutputParser(pydantic_object=TransactionPlan)
-    
-    def get_system_prompt(self) -> str:
-        """System prompt for the Planner agent"""
-        return """You are the Planner Agent in the WalletMind AI Autonomous Wallet System.
+_PLANNER_SYSTEM_PROMPT = """You are the Planner Agent in the WalletMind AI Autonomous Wallet System.
 
 Your role is to make HIGH-LEVEL FINANCIAL DECISIONS based on user requests.
 
@@ -130,6 +94,158 @@ IMPORTANT:
 Available tools: {tool_names}
 
 Think step-by-step and make well-reasoned financial decisions."""
+
+
+class TransactionPlan(BaseModel):
+    """Structured output for planned transactions"""
+    action: str = Field(..., description="Action to take (transfer, contract_call, api_payment, data_purchase)")
+    to_address: Optional[str] = Field(None, description="Recipient address if applicable")
+    amount: Optional[float] = Field(None, description="Amount in ETH/tokens")
+    token: str = Field(default="ETH", description="Token symbol")
+    network: str = Field(default="sepolia", description="Target network")
+    risk_level: str = Field(..., description="Risk assessment (low, medium, high)")
+    estimated_gas: Optional[float] = Field(None, description="Estimated gas cost in ETH")
+    reasoning: str = Field(..., description="Explanation of decision")
+    requires_approval: bool = Field(default=False, description="Whether user approval needed")
+    contingencies: List[str] = Field(default_factory=list, description="Fallback plans")
+    metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional context")
+    
+    # model_dump() from the first as_dict(); plans are not mutated once built
+    _dump: Optional[Dict[str, Any]] = PrivateAttr(default=None)
+    
+    # Canonical JSON (sorted keys, compact) of the same dump
+    _json: Optional[bytes] = PrivateAttr(default=None)
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """Serialized plan, computed once (treat the result as read-only)"""
+        if self._dump is None:
+            self._dump = self.model_dump()
+        return self._dump
+    
+    def as_json_fragment(self) -> Any:
+        """
+        The plan for embedding in a canonically encoded document.
+        
+        With orjson this is an orjson.Fragment over bytes encoded once, with
+        the same options as storage.ipfs.canonical_json, so the enclosing
+        document's bytes (and hash) are unchanged. Otherwise it is
+        as_dict().
+        """
+        if orjson is None or not hasattr(orjson, "Fragment"):  # Fragment: orjson >= 3.9.16
+            return self.as_dict()
+        if self._json is None:
+            try:
+                self._json = orjson.dumps(self.as_dict(), option=orjson.OPT_SORT_KEYS)
+            except TypeError:
+                # orjson.JSONEncodeError (e.g. ints beyond 64 bits in metadata)
+                return self.as_dict()
+        return orjson.Fragment(self._json)
+
+
+class FinancialAnalysis(BaseModel):
+    """Analysis of financial feasibility"""
+    can_execute: bool
+    balance_sufficient: bool
+    within_spending_limit: bool
+    estimated_total_cost: float
+    warnings: List[str] = Field(default_factory=list)
+    recommendations: List[str] = Field(default_factory=list)
+
+
+class PlanResponseCache:
+    """
+    In-memory LRU of plans returned by plan_transaction.
+    
+    Keyed on everything the planning prompt is built from, with the
+    balance rounded to 0.01 ETH so tiny balance changes still hit.
+    """
+    
+    def __init__(self, ttl_seconds: int = 3600, max_entries: int = 512):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        # key -> (plan, monotonic expiry), least recently used first
+        self._entries: OrderedDict = OrderedDict()
+    
+    @staticmethod
+    def make_key(
+        context: DecisionContext,
+        wallet_balance: Optional[float],
+        spending_limit: Optional[float]
+    ) -> str:
+        """Hash of the planning inputs"""
+        payload = json.dumps({
+            "req": context.request,
+            "wallet": (context.wallet_address or "").lower(),
+            "bal_bucket": round(wallet_balance or 0.0, 2),
+            "limit": spending_limit,
+            "net": context.network,
+            "history": len(context.previous_decisions),
+        }, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def get(self, key: str) -> Optional[TransactionPlan]:
+        """Get a cached plan if not expired"""
+        cached = self._entries.get(key)
+        if cached is None:
+            return None
+        plan, expires_at = cached
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return plan
+    
+    def put(self, key: str, plan: TransactionPlan):
+        """Store a plan, evicting the least recently used beyond max_entries"""
+        self._entries[key] = (plan, time.monotonic() + self.ttl_seconds)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+    
+    def clear(self):
+        """Drop all cached plans"""
+        self._entries.clear()
+
+
+class PlannerAgent(BaseAgent):
+    """
+    Planner Agent for high-level financial decision-making.
+    
+    Uses LangChain with Groq/Gemini to:
+    1. Understand natural language requests
+    2. Analyze financial feasibility
+    3. Assess risks
+    4. Generate structured transaction plans
+    5. Check balances and limits
+    """
+    
+    def __init__(
+        self,
+        llm: BaseChatModel,
+        tools: List[BaseTool],
+        config: Optional[AgentConfig] = None,
+        memory_service: Optional[Any] = None,
+        response_cache: Optional[PlanResponseCache] = None
+    ):
+        if config is None:
+            config = AgentConfig(
+                agent_type="planner",
+                temperature=0.3,  # Lower temperature for more deterministic financial decisions
+                max_iterations=8
+            )
+        
+        super().__init__(llm, tools, config, memory_service)
+        self.output_parser = PydanticOutputParser(pydantic_object=TransactionPlan)
+        
+        # Sampled plans differ run to run, so only deterministic ones are reused
+        if config.temperature <= _CACHEABLE_TEMPERATURE:
+            self.response_cache = response_cache or PlanResponseCache()
+        else:
+            self.response_cache = None
+    
+    def get_system_prompt(self) -> str:
+        """System prompt for the Planner agent"""
+        return _PLANNER_SYSTEM_PROMPT
     
     async def plan_transaction(
         self,
@@ -150,6 +266,14 @@ Think step-by-step and make well-reasoned financial decisions."""
         """
         logger.info(f"Planning transaction for request: {context.request}")
         
+        cache_key = None
+        if self.response_cache is not None:
+            cache_key = PlanResponseCache.make_key(context, wallet_balance, spending_limit)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                logger.info("Plan response cache hit")
+                return cached
+        
         # Add financial context to the request
         enhanced_input = f"""User Request: {context.request}
 
@@ -161,16 +285,11 @@ Financial Context:
 
 Analyze this request and generate a structured transaction plan."""
         
-        # Create new context with enhanced input
-        planning_context = DecisionContext(
-            user_id=context.user_id,
-            wallet_address=context.wallet_address,
-            request=enhanced_input,
-            wallet_balance=wallet_balance,
-            network=context.network,
-            previous_decisions=context.previous_decisions,
-            metadata=context.metadata
-        )
+        # Derive a context with the enhanced input (no re-validation)
+        planning_context = context.model_copy(update={
+            "request": enhanced_input,
+            "wallet_balance": wallet_balance
+        })
         
         # Process with agent
         response = await self.process(planning_context)
@@ -187,6 +306,8 @@ Analyze this request and generate a structured transaction plan."""
                 # Try to parse from output text
                 plan = self.output_parser.parse(str(result))
             
+            if cache_key is not None and plan.action != "reject":
+                self.response_cache.put(cache_key, plan)
             return plan
             
         except Exception as e:
@@ -222,10 +343,9 @@ Analyze this request and generate a structured transaction plan."""
         
         balance_sufficient = wallet_balance >= total_cost
         
-        within_limit = True
-        if spending_limit:
-            remaining_limit = spending_limit - daily_spent
-            within_limit = total_cost <= remaining_limit
+        # Remaining budget, computed once for the check and the warning
+        remaining_limit = spending_limit - daily_spent if spending_limit else None
+        within_limit = remaining_limit is None or total_cost <= remaining_limit
         
         warnings = []
         recommendations = []
@@ -235,24 +355,24 @@ Analyze this request and generate a structured transaction plan."""
             warnings.append(f"Insufficient balance: {wallet_balance} ETH < {total_cost} ETH required")
         
         if not within_limit:
-            warnings.append(f"Exceeds daily spending limit: {total_cost} ETH > {spending_limit - daily_spent} ETH remaining")
+            warnings.append(f"Exceeds daily spending limit: {total_cost} ETH > {remaining_limit} ETH remaining")
         
         if total_cost > wallet_balance * 0.5:
-            warnings.append("Transaction uses >50% of wallet balance - high risk")
+            warnings.append(_HIGH_SHARE_WARNING)
         
         # Generate recommendations
         if not balance_sufficient:
-            recommendations.append("Add funds to wallet or reduce transaction amount")
+            recommendations.append(_ADD_FUNDS_RECOMMENDATION)
         
         if not within_limit:
-            recommendations.append("Wait for daily limit to reset or increase spending limit")
+            recommendations.append(_LIMIT_RECOMMENDATION)
         
         if plan.risk_level == "high":
-            recommendations.append("Consider requesting human approval for high-risk transaction")
+            recommendations.append(_APPROVAL_RECOMMENDATION)
         
         # Suggest network switching if gas is high
         if plan.estimated_gas and plan.estimated_gas > 0.01:
-            recommendations.append("Consider switching to a cheaper network (Polygon/Base)")
+            recommendations.append(_NETWORK_RECOMMENDATION)
         
         can_execute = balance_sufficient and within_limit and plan.risk_level != "high"
         
@@ -281,22 +401,21 @@ Analyze this request and generate a structured transaction plan."""
         
         # Amount-based risk
         if amount and context.wallet_balance:
-            percentage = (amount / context.wallet_balance) * 100
-            if percentage > 50:
+            share = amount / context.wallet_balance
+            if share > 0.5:
                 risk_factors.append("High percentage of balance (>50%)")
                 risk_score += 0.4
-            elif percentage > 10:
+            elif share > 0.1:
                 risk_factors.append("Significant percentage of balance (>10%)")
                 risk_score += 0.2
         
         # Address-based risk
         if to_address:
-            # Registry lookup for known addresses
-            known_addresses = context.metadata.get("known_addresses", [])
-            if not to_address.startswith("0x") or len(to_address) != 42:
+            if not ADDRESS_RE.fullmatch(to_address):
                 risk_factors.append("Invalid address format")
                 risk_score += 0.5
-            elif to_address not in known_addresses:
+            # Registry lookup for known addresses (well-formed ones only)
+            elif to_address not in context.metadata.get("known_addresses", ()):
                 risk_factors.append("Unknown recipient address")
                 risk_score += 0.2
         
@@ -253,6 +253,17 @@ def get_orchestrator() -> OrchestratorAgent:
     return _orchestrator
 
 
+def warm_orchestrator_workflow():
+    """Compile the shared workflow graph now instead of on the first request"""
+    OrchestratorAgent._get_compiled_app()
+
+
+async def close_orchestrator():
+    """Flush the orchestrator's background work, if it was created"""
+    if _orchestrator is not None:
+        await _orchestrator.close()
+
+
 def get_memory_service() -> MemoryService:
     """Get or create memory service instance"""
     global _memory_service
@@ -508,7 +519,7 @@ The Planner agent has analyzed your request and provided the response above."""
                 wallet_address=decision_context.wallet_address or "default",
                 agent_type="planner",
                 request=request.request,
-                response=agent_decision.dict(),
+                response=agent_decision.model_dump(),
                 reasoning=agent_decision.reasoning,
                 timestamp=datetime.now()
             )
@@ -7,9 +7,25 @@ import json
 import asyncio
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 router = APIRouter(tags=["websocket"])
 
 
+def _dumps(message: dict) -> str:
+    """Encode a message as JSON text, with orjson when it can handle the payload"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(message).decode()
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. ints beyond 64 bits)
+            pass
+    return json.dumps(message)
+
+
 class ConnectionManager:
     """Manages WebSocket connections for real-time updates"""
     
@@ -37,7 +53,7 @@ class ConnectionManager:
         if channel not in self.active_connections:
             return
         
-        message_json = json.dumps(message)
+        message_json = _dumps(message)
         dead_connections = set()
         
         for connection in set(self.active_connections[channel]):
@@ -52,7 +68,7 @@ class ConnectionManager:
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """Send message to a specific connection"""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(_dumps(message))
         except Exception:
             pass
 
@@ -5,7 +5,7 @@ Provides NetworkConfig dataclass and pre-configured network settings.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from enum import Enum
 
 
@@ -32,6 +32,8 @@ class NetworkConfig:
         max_gas_price_gwei: Maximum gas price in Gwei
         confirmation_blocks: Number of blocks for confirmation
         block_time_seconds: Average block time
+        ws_url: Optional WebSocket RPC endpoint (enables newHeads subscriptions)
+        fallback_rpc_urls: Ordered HTTP RPC endpoints tried when rpc_url fails
     """
     name: str
     chain_id: int
@@ -43,6 +45,8 @@ class NetworkConfig:
     max_gas_price_gwei: int = 50
     confirmation_blocks: int = 3
     block_time_seconds: int = 12
+    ws_url: Optional[str] = None
+    fallback_rpc_urls: Tuple[str, ...] = ()
 
 
 # Ethereum Sepolia Testnet
@@ -57,7 +61,8 @@ SEPOLIA_CONFIG = NetworkConfig(
     gas_price_multiplier=1.1,
     max_gas_price_gwei=50,
     confirmation_blocks=3,
-    block_time_seconds=12
+    block_time_seconds=12,
+    fallback_rpc_urls=("https://ethereum-sepolia-rpc.publicnode.com",)
 )
 
 # Polygon Amoy Testnet
@@ -71,7 +76,8 @@ POLYGON_AMOY_CONFIG = NetworkConfig(
     gas_price_multiplier=1.2,
     max_gas_price_gwei=200,
     confirmation_blocks=5,
-    block_time_seconds=2
+    block_time_seconds=2,
+    fallback_rpc_urls=("https://polygon-amoy-bor-rpc.publicnode.com",)
 )
 
 # Base Goerli Testnet
@@ -127,7 +133,9 @@ def get_network_config(network: NetworkType, rpc_url: Optional[str] = None) -> N
             gas_price_multiplier=config.gas_price_multiplier,
             max_gas_price_gwei=config.max_gas_price_gwei,
             confirmation_blocks=config.confirmation_blocks,
-            block_time_seconds=config.block_time_seconds
+            block_time_seconds=config.block_time_seconds,
+            ws_url=config.ws_url,
+            fallback_rpc_urls=config.fallback_rpc_urls
         )
     
     return config
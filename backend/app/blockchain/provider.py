@@ -4,10 +4,13 @@ Web3 provider management and connection pooling for multiple networks
 Handles Web3 connections with automatic retry, health checks, and network switching.
 """
 
+import asyncio
 import logging
-from typing import Dict, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from web3 import Web3
 from web3.providers import HTTPProvider
+import requests
+from requests.adapters import HTTPAdapter
 try:
     # web3.py v7+ uses ExtraDataToPOAMiddleware
     from web3.middleware import ExtraDataToPOAMiddleware as geth_poa_middleware
@@ -22,6 +25,43 @@ from .networks import NetworkType, NetworkConfig, get_network_config
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool per RPC endpoint; sized for concurrent agent RPCs
+# (gas estimate, gas price, nonce, submit, receipt polling per transaction)
+_HTTP_POOL_CONNECTIONS = 4
+_HTTP_POOL_MAXSIZE = 32
+
+# How long an RPC endpoint is skipped after a transient broadcast failure
+_RPC_FAILOVER_COOLDOWN = 60.0
+
+_ALREADY_KNOWN_ERRORS = ("already known", "known transaction", "already imported", "alreadyknown")
+_TRANSIENT_ERRORS = (
+    "rate limit", "too many requests", "timeout", "timed out",
+    "header not found", "service unavailable", "bad gateway"
+)
+
+
+def _classify_broadcast_error(error: Exception) -> str:
+    """
+    Classify a failed eth_sendRawTransaction.
+    
+    Returns:
+        "already_known" if the node already has the transaction,
+        "transient" if another endpoint may succeed (429, 5xx, network
+        errors), otherwise "definitive" (the transaction itself was rejected)
+    """
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return "transient"
+    if isinstance(error, requests.HTTPError):
+        status = error.response.status_code if error.response is not None else None
+        return "transient" if status is None or status == 429 or status >= 500 else "definitive"
+    
+    message = str(error).lower()
+    if any(pattern in message for pattern in _ALREADY_KNOWN_ERRORS):
+        return "already_known"
+    if any(pattern in message for pattern in _TRANSIENT_ERRORS):
+        return "transient"
+    return "definitive"
+
 
 @dataclass
 class ConnectionStats:
@@ -51,7 +91,10 @@ class Web3Provider:
     def __init__(self):
         """Initialize Web3Provider with empty connection pool"""
         self._connections: Dict[NetworkType, Web3] = {}
+        self._sessions: Dict[NetworkType, requests.Session] = {}
         self._stats: Dict[NetworkType, ConnectionStats] = {}
+        # RPC URL -> monotonic time until which it is skipped for broadcasts
+        self._endpoint_cooldowns: Dict[str, float] = {}
         self._current_network: Optional[NetworkType] = None
         logger.info("Web3Provider initialized")
     
@@ -108,10 +151,11 @@ class Web3Provider:
             try:
                 logger.info(f"Connecting to {config.name} (attempt {attempt + 1}/{max_retries})...")
                 
-                # Create HTTP provider with timeout
+                # Create HTTP provider with timeout over a persistent keep-alive pool
                 provider = HTTPProvider(
                     config.rpc_url,
-                    request_kwargs={'timeout': timeout}
+                    request_kwargs={'timeout': timeout},
+                    session=self._get_session(network)
                 )
                 
                 # Create Web3 instance
@@ -163,6 +207,20 @@ class Web3Provider:
         logger.error(error_msg)
         raise ConnectionError(error_msg)
     
+    def _get_session(self, network: NetworkType) -> requests.Session:
+        """Get the pooled HTTP session for a network, reused across reconnects"""
+        session = self._sessions.get(network)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=_HTTP_POOL_CONNECTIONS,
+                pool_maxsize=_HTTP_POOL_MAXSIZE
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._sessions[network] = session
+        return session
+    
     def get_web3(self, network: Optional[NetworkType] = None) -> Web3:
         """
         Get Web3 instance for network.
@@ -298,6 +356,71 @@ class Web3Provider:
         web3 = self.get_web3(network)
         return web3.eth.estimate_gas(transaction)
     
+    async def batch_call(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        network: Optional[NetworkType] = None
+    ) -> List[Any]:
+        """
+        Send raw JSON-RPC calls as one batch request (one HTTP round-trip).
+        
+        Args:
+            calls: (method, params) pairs, e.g. ("eth_gasPrice", [])
+            network: Network to query (defaults to current)
+            
+        Returns:
+            Raw results in the same order as calls
+            
+        Raises:
+            ValueError: If any call in the batch returned an error
+        """
+        return await asyncio.to_thread(self._batch_call_sync, calls, network)
+    
+    def _batch_call_sync(
+        self,
+        calls: List[Tuple[str, List[Any]]],
+        network: Optional[NetworkType]
+    ) -> List[Any]:
+        web3 = self.get_web3(network)
+        responses = web3.provider.make_batch_request(calls)
+        
+        results = []
+        for (method, _), response in zip(calls, responses):
+            if response.get("error"):
+                raise ValueError(f"{method} failed: {response['error']}")
+            results.append(response.get("result"))
+        return results
+    
+    async def get_transactions(
+        self,
+        tx_hashes: List[str],
+        network: Optional[NetworkType] = None
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Fetch several transactions in a single JSON-RPC batch.
+        
+        Args:
+            tx_hashes: Transaction hashes
+            network: Network to query (defaults to current)
+            
+        Returns:
+            Transaction dicts in the same order (None for unknown hashes)
+        """
+        return await asyncio.to_thread(self._get_transactions_sync, tx_hashes, network)
+    
+    def _get_transactions_sync(
+        self,
+        tx_hashes: List[str],
+        network: Optional[NetworkType]
+    ) -> List[Optional[Dict[str, Any]]]:
+        web3 = self.get_web3(network)
+        with web3.batch_requests() as batch:
+            for tx_hash in tx_hashes:
+                batch.add(web3.eth.get_transaction(tx_hash))
+            responses = batch.execute()
+        
+        return [dict(tx) if tx else None for tx in responses]
+    
     def wait_for_transaction(
         self,
         tx_hash: str,
@@ -346,6 +469,194 @@ class Web3Provider:
             
             raise
     
+    def send_raw_transaction(
+        self,
+        signed_tx: str,
+        network: Optional[NetworkType] = None,
+        timeout: int = 30
+    ) -> str:
+        """
+        Broadcast a signed transaction, failing over across RPC endpoints.
+        
+        Endpoints are tried in order (connected URL, then the network's
+        fallback_rpc_urls). A transient failure (429, 5xx, network error)
+        parks the endpoint for 60s and moves on to the next one; a
+        definitive rejection is raised immediately.
+        
+        Args:
+            signed_tx: Raw signed transaction (hex)
+            network: Network to use (defaults to current)
+            timeout: Per-endpoint request timeout in seconds
+            
+        Returns:
+            Transaction hash
+            
+        Raises:
+            ConnectionError: If every endpoint failed transiently
+        """
+        target_network = network or self._current_network
+        web3 = self.get_web3(target_network)
+        config = get_network_config(target_network)
+        
+        endpoints = [getattr(web3.provider, "endpoint_uri", None) or config.rpc_url]
+        endpoints += [url for url in config.fallback_rpc_urls if url not in endpoints]
+        
+        # Skip endpoints that are cooling down, unless all of them are
+        now = time.monotonic()
+        available = [url for url in endpoints if self._endpoint_cooldowns.get(url, 0.0) <= now] or endpoints
+        
+        session = self._get_session(target_network)
+        payload = {"jsonrpc": "2.0", "id": 1, "method": "eth_sendRawTransaction", "params": [signed_tx]}
+        last_error: Optional[Exception] = None
+        
+        for url in available:
+            try:
+                response = session.post(url, json=payload, timeout=timeout)
+                response.raise_for_status()
+                body = response.json()
+                if body.get("error"):
+                    raise ValueError(f"eth_sendRawTransaction failed: {body['error']}")
+                return body["result"]
+                
+            except Exception as e:
+                kind = _classify_broadcast_error(e)
+                if kind == "already_known":
+                    # Already in the mempool: the hash is the keccak of the raw tx
+                    return Web3.to_hex(Web3.keccak(hexstr=signed_tx))
+                if kind == "definitive":
+                    raise
+                
+                logger.warning(f"Broadcast via {url} failed ({e}), trying next endpoint")
+                self._endpoint_cooldowns[url] = time.monotonic() + _RPC_FAILOVER_COOLDOWN
+                last_error = e
+        
+        raise ConnectionError(f"All RPC endpoints failed for {target_network.value}: {last_error}")
+    
+    async def send_raw_transactions(
+        self,
+        signed_txs: List[str],
+        network: Optional[NetworkType] = None
+    ) -> List[Any]:
+        """
+        Broadcast several signed transactions in a single JSON-RPC batch.
+        
+        Args:
+            signed_txs: Raw signed transactions (hex)
+            network: Network to use (defaults to current)
+            
+        Returns:
+            Per transaction, in order: its hash, or the exception it was
+            rejected with
+        """
+        return await asyncio.to_thread(self._send_raw_transactions_sync, signed_txs, network)
+    
+    def _send_raw_transactions_sync(
+        self,
+        signed_txs: List[str],
+        network: Optional[NetworkType]
+    ) -> List[Any]:
+        web3 = self.get_web3(network)
+        responses = web3.provider.make_batch_request(
+            [("eth_sendRawTransaction", [signed_tx]) for signed_tx in signed_txs]
+        )
+        
+        results: List[Any] = []
+        for signed_tx, response in zip(signed_txs, responses):
+            if not response.get("error"):
+                results.append(response.get("result"))
+                continue
+            error = ValueError(f"eth_sendRawTransaction failed: {response['error']}")
+            if _classify_broadcast_error(error) == "already_known":
+                # Already in the mempool: the hash is the keccak of the raw tx
+                results.append(Web3.to_hex(Web3.keccak(hexstr=signed_tx)))
+            else:
+                results.append(error)
+        return results
+    
+    async def wait_for_confirmation(
+        self,
+        tx_hash: str,
+        network: NetworkType,
+        timeout: int = 120,
+        confirmations: int = 1
+    ) -> Dict[str, Any]:
+        """
+        Wait until a transaction has the required number of confirmations.
+        
+        With a WebSocket endpoint configured the receipt is only queried
+        when a new head arrives; otherwise the receipt, then the block
+        number, are polled.
+        
+        Args:
+            tx_hash: Transaction hash
+            network: Network to use
+            timeout: Maximum wait time in seconds
+            confirmations: Blocks required on top of the inclusion block (1 = mined)
+            
+        Returns:
+            Transaction receipt
+            
+        Raises:
+            TimeoutError: If not confirmed within timeout
+        """
+        config = get_network_config(network)
+        if not config.ws_url:
+            return await asyncio.to_thread(
+                self._poll_for_confirmation, tx_hash, network, timeout,
+                min(1.0, config.block_time_seconds / 4), confirmations
+            )
+        
+        try:
+            return await asyncio.wait_for(
+                self._wait_for_confirmation_ws(config.ws_url, tx_hash, confirmations),
+                timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise TimeoutError(f"Transaction {tx_hash} not confirmed within {timeout}s")
+    
+    async def _wait_for_confirmation_ws(
+        self,
+        ws_url: str,
+        tx_hash: str,
+        confirmations: int
+    ) -> Dict[str, Any]:
+        """Consume newHeads and check the receipt once per block"""
+        from web3 import AsyncWeb3, WebSocketProvider
+        from web3.exceptions import TransactionNotFound
+        
+        async with AsyncWeb3(WebSocketProvider(ws_url)) as web3:
+            await web3.eth.subscribe("newHeads")
+            async for message in web3.socket.process_subscriptions():
+                head_number = message["result"]["number"]
+                try:
+                    receipt = await web3.eth.get_transaction_receipt(tx_hash)
+                except TransactionNotFound:
+                    continue
+                
+                if head_number - receipt["blockNumber"] + 1 >= confirmations:
+                    return receipt
+        
+        raise ConnectionError("newHeads subscription closed")
+    
+    def _poll_for_confirmation(
+        self,
+        tx_hash: str,
+        network: NetworkType,
+        timeout: int,
+        poll_latency: float,
+        confirmations: int
+    ) -> Dict[str, Any]:
+        """Polling fallback: wait for the receipt, then for enough blocks on top of it"""
+        deadline = time.monotonic() + timeout
+        receipt = self.wait_for_transaction(tx_hash, network, timeout, poll_latency)
+        
+        web3 = self.get_web3(network)
+        while web3.eth.block_number - receipt["blockNumber"] + 1 < confirmations:
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"Transaction {tx_hash} not confirmed within {timeout}s")
+            time.sleep(poll_latency)
+        return receipt
+    
     def get_stats(self, network: Optional[NetworkType] = None) -> Optional[ConnectionStats]:
         """
         Get connection statistics.
@@ -374,6 +685,9 @@ class Web3Provider:
             if network in self._connections:
                 del self._connections[network]
                 del self._stats[network]
+                session = self._sessions.pop(network, None)
+                if session is not None:
+                    session.close()
                 logger.info(f"Disconnected from {network.value}")
                 
                 if self._current_network == network:
@@ -381,6 +695,9 @@ class Web3Provider:
         else:
             # Disconnect all
             self._connections.clear()
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
             self._stats.clear()
             self._current_network = None
             logger.info("Disconnected from all networks")
@@ -24,6 +24,9 @@ from app.services import (
     get_oracle_service
 )
 
+# Import storage
+from app.storage.ipfs import get_ipfs_service
+
 # Import security
 from app.security import (
     get_key_manager,
@@ -108,6 +111,9 @@ async def lifespan(app: FastAPI):
         logger.error(f"❌ Error initializing infrastructure services: {e}")
         raise
     
+    # Agent workflow graph (compiled once per process, shared by all orchestrators)
+    agents.warm_orchestrator_workflow()
+    
     # TODO: Initialize other services
     # - ChromaDB connection (Memory services)
     # - Blockchain provider connections
@@ -150,6 +156,14 @@ async def lifespan(app: FastAPI):
             services["oracle"].clear_cache()
             logger.info("✅ OracleService cache cleared")
         
+        # Let pending decision logs and memory writes finish (they may still use IPFS)
+        await agents.close_orchestrator()
+        logger.info("✅ Orchestrator background tasks flushed")
+        
+        # Close the IPFS keep-alive HTTP session
+        await get_ipfs_service().close()
+        logger.info("✅ IPFSService session closed")
+        
         logger.info("✅ Infrastructure services cleanup complete")
         
     except Exception as e:
@@ -14,6 +14,7 @@ from chromadb.config import Settings
 from langchain_chroma import Chroma
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_core.documents import Document
+import asyncio
 import logging
 from datetime import datetime
 import json
@@ -107,27 +108,133 @@ class MemoryService:
             ID of the stored memory
         """
         try:
-            # Prepare response for serialization (handle datetime objects)
-            if isinstance(response, dict):
-                # Convert datetime objects to ISO format strings
-                serializable_response = {}
-                for key, value in response.items():
-                    if isinstance(value, datetime):
-                        serializable_response[key] = value.isoformat()
-                    elif isinstance(value, dict):
-                        # Recursively handle nested dicts
-                        serializable_response[key] = {
-                            k: v.isoformat() if isinstance(v, datetime) else v
-                            for k, v in value.items()
-                        }
-                    else:
-                        serializable_response[key] = value
-                response_str = json.dumps(serializable_response)
-            else:
-                response_str = str(response)
+            return self._add_memory(
+                wallet_address, agent_type, request, self._serialize_response(response),
+                reasoning, timestamp, metadata
+            )
             
-            # Prepare document content
-            content = f"""
+        except Exception as e:
+            logger.error(f"Failed to store memory: {e}", exc_info=True)
+            raise
+    
+    async def store_bytes(
+        self,
+        wallet_address: str,
+        agent_type: str,
+        request: str,
+        response: bytes,
+        reasoning: str,
+        timestamp: datetime,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Store an agent interaction whose response is already JSON-encoded
+        
+        Same as store(), but skips response serialization for callers that
+        produce UTF-8 JSON bytes themselves (e.g. with orjson).
+        
+        Returns:
+            ID of the stored memory
+        """
+        try:
+            return self._add_memory(
+                wallet_address, agent_type, request, response.decode("utf-8"),
+                reasoning, timestamp, metadata
+            )
+        except Exception as e:
+            logger.error(f"Failed to store memory: {e}", exc_info=True)
+            raise
+    
+    async def store_batch(self, records: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store several agent interactions with a single vector store write
+        
+        Embeddings for the whole batch are computed together, which is much
+        cheaper than one store() call per record.
+        
+        Args:
+            records: store() keyword arguments, one dict per interaction;
+                a bytes response is taken as pre-encoded JSON (as in store_bytes)
+        
+        Returns:
+            IDs of the stored memories, in order
+        """
+        if not records:
+            return []
+        try:
+            docs = [
+                self._build_document(
+                    record["wallet_address"], record["agent_type"], record["request"],
+                    self._serialize_response(record["response"]),
+                    record["reasoning"], record["timestamp"], record.get("metadata")
+                )
+                for record in records
+            ]
+            # Embedding runs on the CPU; keep it off the event loop
+            ids = await asyncio.to_thread(self.vector_store.add_documents, docs)
+            logger.info(f"Stored {len(ids)} memories in one batch")
+            return ids
+        except Exception as e:
+            logger.error(f"Failed to store memory batch: {e}", exc_info=True)
+            raise
+    
+    @staticmethod
+    def _serialize_response(response: Any) -> str:
+        """Response as stored in the document: JSON for dicts, decoded for bytes"""
+        if isinstance(response, bytes):
+            return response.decode("utf-8")
+        if isinstance(response, dict):
+            # Convert datetime objects to ISO format strings
+            serializable_response = {}
+            for key, value in response.items():
+                if isinstance(value, datetime):
+                    serializable_response[key] = value.isoformat()
+                elif isinstance(value, dict):
+                    # Recursively handle nested dicts
+                    serializable_response[key] = {
+                        k: v.isoformat() if isinstance(v, datetime) else v
+                        for k, v in value.items()
+                    }
+                else:
+                    serializable_response[key] = value
+            return json.dumps(serializable_response)
+        return str(response)
+    
+    def _add_memory(
+        self,
+        wallet_address: str,
+        agent_type: str,
+        request: str,
+        response_str: str,
+        reasoning: str,
+        timestamp: datetime,
+        metadata: Optional[Dict[str, Any]]
+    ) -> str:
+        """Build the memory document and add it to the vector store"""
+        doc = self._build_document(
+            wallet_address, agent_type, request, response_str,
+            reasoning, timestamp, metadata
+        )
+        
+        # Add to vector store
+        ids = self.vector_store.add_documents([doc])
+        
+        logger.info(f"Stored memory for {agent_type} agent: {ids[0]}")
+        return ids[0]
+    
+    @staticmethod
+    def _build_document(
+        wallet_address: str,
+        agent_type: str,
+        request: str,
+        response_str: str,
+        reasoning: str,
+        timestamp: datetime,
+        metadata: Optional[Dict[str, Any]]
+    ) -> Document:
+        """Memory document for one interaction"""
+        # Prepare document content
+        content = f"""
 Agent: {agent_type}
 Wallet: {wallet_address}
 Request: {request}
@@ -135,31 +242,20 @@ Response: {response_str}
 Reasoning: {reasoning}
 Timestamp: {timestamp.isoformat()}
 """
-            
-            # Prepare metadata
-            doc_metadata = {
-                "wallet_address": wallet_address,
-                "agent_type": agent_type,
-                "timestamp": timestamp.isoformat(),
-                "request": request[:200],  # Truncate for metadata
-                **(metadata or {})
-            }
-            
-            # Create document
-            doc = Document(
-                page_content=content,
-                metadata=doc_metadata
-            )
-            
-            # Add to vector store
-            ids = self.vector_store.add_documents([doc])
-            
-            logger.info(f"Stored memory for {agent_type} agent: {ids[0]}")
-            return ids[0]
-            
-        except Exception as e:
-            logger.error(f"Failed to store memory: {e}", exc_info=True)
-            raise
+        
+        # Prepare metadata
+        doc_metadata = {
+            "wallet_address": wallet_address,
+            "agent_type": agent_type,
+            "timestamp": timestamp.isoformat(),
+            "request": request[:200],  # Truncate for metadata
+            **(metadata or {})
+        }
+        
+        return Document(
+            page_content=content,
+            metadata=doc_metadata
+        )
     
     async def query(
         self,
@@ -2,14 +2,47 @@
 
 import os
 import json
+import base64
+import asyncio
 import hashlib
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 import aiohttp
 from datetime import datetime
+from Crypto.Hash import keccak
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    logger.info("orjson not installed - decision payloads use the json module")
+    orjson = None  # type: ignore
+
+# Default IPFS chunk size; files up to this size are stored as a single block
+MAX_RAW_BLOCK_SIZE = 256 * 1024
+
+
+def _fragment_default(obj: Any) -> Any:
+    """json fallback for values only orjson can encode (pre-encoded fragments)"""
+    contents = getattr(obj, "contents", None)
+    if orjson is not None and isinstance(obj, getattr(orjson, "Fragment", ())) and contents is not None:
+        return json.loads(contents)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def canonical_json(data: Dict[str, Any]) -> bytes:
+    """Serialize decision data to compact JSON with sorted keys"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. ints beyond 64 bits, such as wei amounts)
+            pass
+    return json.dumps(
+        data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=_fragment_default
+    ).encode()
+
 
 class IPFSService:
     """
@@ -29,6 +62,12 @@ class IPFSService:
             self.mock_mode = True
         else:
             self.mock_mode = False
+        
+        # Shared HTTP session, created on first use (needs a running loop)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Keep references to background pin tasks until they finish
+        self._background_pins: Set[asyncio.Task] = set()
     
     def compute_hash(self, data: Dict[str, Any]) -> str:
         """
@@ -40,13 +79,19 @@ class IPFSService:
         Returns:
             Hex string of the hash (with 0x prefix)
         """
-        # Convert to JSON string with sorted keys for consistency
-        json_str = json.dumps(data, sort_keys=True, separators=(',', ':'))
+        return self.compute_payload_hash(canonical_json(data))
+    
+    def compute_payload_hash(self, payload: bytes) -> str:
+        """
+        Compute Keccak-256 hash of an already encoded decision payload.
         
-        # Compute SHA-256 (Keccak-256 not available in standard library)
-        # In production, use Web3.keccak for true Keccak-256
-        hash_bytes = hashlib.sha256(json_str.encode()).digest()
-        return "0x" + hash_bytes.hex()
+        Args:
+            payload: Canonical JSON bytes (see canonical_json)
+            
+        Returns:
+            Hex string of the hash (with 0x prefix)
+        """
+        return "0x" + keccak.new(digest_bits=256, data=payload).hexdigest()
     
     async def upload_decision(
         self,
@@ -67,8 +112,9 @@ class IPFSService:
         if "timestamp" not in decision_data:
             decision_data["timestamp"] = datetime.utcnow().isoformat()
         
-        # Compute hash
-        decision_hash = self.compute_hash(decision_data)
+        # Serialize once: the same bytes are hashed and pinned
+        payload = canonical_json(decision_data)
+        decision_hash = self.compute_payload_hash(payload)
         
         if self.mock_mode:
             # Mock mode: return fake CID
@@ -76,54 +122,240 @@ class IPFSService:
             logger.info(f"Mock IPFS upload: CID={mock_cid}")
             return mock_cid, decision_hash
         
-        try:
-            # Prepare data for Pinata
-            pin_data = {
-                "pinataContent": decision_data,
-                "pinataMetadata": metadata or {
-                    "name": f"decision_{decision_hash[:10]}",
-                    "keyvalues": {
-                        "type": "agent_decision",
-                        "hash": decision_hash
-                    }
-                }
-            }
-            
-            # Upload to Pinata
-            headers = {
-                "Content-Type": "application/json"
+        ipfs_cid = await self.add_bytes(payload, metadata or {
+            "name": f"decision_{decision_hash[:10]}",
+            "keyvalues": {
+                "type": "agent_decision",
+                "hash": decision_hash
             }
+        })
+        if ipfs_cid is None:
+            # Fallback to mock mode
+            ipfs_cid = f"Qm{decision_hash[2:48]}"
+        return ipfs_cid, decision_hash
+    
+    async def add_bytes(
+        self,
+        payload: bytes,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Pin an already encoded payload to IPFS via Pinata, unchanged.
+        
+        Args:
+            payload: File content (e.g. canonical_json output)
+            metadata: Optional metadata for Pinata
             
-            if self.pinata_jwt:
-                headers["Authorization"] = f"Bearer {self.pinata_jwt}"
-            else:
-                headers["pinata_api_key"] = self.pinata_api_key
-                headers["pinata_secret_api_key"] = self.pinata_secret_key
+        Returns:
+            IPFS CID, or None if the upload failed
+        """
+        try:
+            form = aiohttp.FormData()
+            form.add_field("file", payload, filename="decision.json", content_type="application/json")
+            if metadata:
+                form.add_field("pinataMetadata", json.dumps(metadata))
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.pinata_api_url}/pinning/pinJSONToIPFS",
-                    json=pin_data,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        result = await response.json()
-                        ipfs_cid = result.get("IpfsHash", "")
-                        logger.info(f"Successfully uploaded to IPFS: {ipfs_cid}")
-                        return ipfs_cid, decision_hash
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"Pinata upload failed: {response.status} - {error_text}")
-                        # Fallback to mock mode
-                        mock_cid = f"Qm{decision_hash[2:48]}"
-                        return mock_cid, decision_hash
+            session = self._get_session()
+            async with session.post(
+                f"{self.pinata_api_url}/pinning/pinFileToIPFS",
+                data=form,
+                headers=self._auth_headers(),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    ipfs_cid = result.get("IpfsHash", "")
+                    logger.info(f"Successfully uploaded to IPFS: {ipfs_cid}")
+                    return ipfs_cid or None
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Pinata upload failed: {response.status} - {error_text}")
+                    return None
         
         except Exception as e:
             logger.error(f"Error uploading to IPFS: {e}")
+            return None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Get the shared keep-alive HTTP session"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, limit_per_host=16, keepalive_timeout=75)
+            )
+        return self._session
+    
+    async def close(self):
+        """Close the shared HTTP session"""
+        if self._session and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    def _auth_headers(self) -> Dict[str, str]:
+        """Pinata authentication headers (JWT preferred over API key pair)"""
+        if self.pinata_jwt:
+            return {"Authorization": f"Bearer {self.pinata_jwt}"}
+        return {
+            "pinata_api_key": self.pinata_api_key,
+            "pinata_secret_api_key": self.pinata_secret_key
+        }
+    
+    def compute_cid(self, payload: bytes) -> str:
+        """
+        Compute the CIDv1 (raw codec, sha2-256, base32) of a payload.
+        
+        Matches the CID IPFS assigns to a file added with CID version 1
+        (raw leaves) as long as it fits in a single block, so decisions can
+        be referenced before the upload finishes.
+        
+        Args:
+            payload: File content
+            
+        Returns:
+            CIDv1 string ("bafkrei...")
+        """
+        cid_bytes = bytes([0x01, 0x55, 0x12, 0x20]) + hashlib.sha256(payload).digest()
+        return "b" + base64.b32encode(cid_bytes).decode().lower().rstrip("=")
+    
+    async def upload_decisions(
+        self,
+        decisions: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        wait_for_pin: bool = True
+    ) -> List[Tuple[str, str]]:
+        """
+        Upload a batch of decisions to IPFS as a single directory via Pinata.
+        
+        One request and one DAG build for the whole batch instead of one per
+        decision. Each decision stays individually addressable.
+        
+        Args:
+            decisions: The decision data to upload
+            metadata: Optional metadata for Pinata
+            wait_for_pin: If False, return locally computed CIDs right away and
+                pin in the background (decisions larger than one block are
+                always pinned before returning)
+            
+        Returns:
+            List of (ipfs_cid, decision_hash) in the same order as decisions
+        """
+        encoded = self.encode_decisions(decisions)
+        payloads = [payload for payload, _, _ in encoded]
+        hashes = [decision_hash for _, _, decision_hash in encoded]
+        
+        mock_results = [(f"Qm{decision_hash[2:48]}", decision_hash) for decision_hash in hashes]
+        
+        if self.mock_mode:
+            logger.info(f"Mock IPFS batch upload: {len(decisions)} decisions")
+            return mock_results
+        
+        if not wait_for_pin and all(len(payload) <= MAX_RAW_BLOCK_SIZE for payload in payloads):
+            task = asyncio.create_task(self._pin_directory(payloads, hashes, metadata))
+            self._background_pins.add(task)
+            task.add_done_callback(self._background_pins.discard)
+            return [(ipfs_cid, decision_hash) for _, ipfs_cid, decision_hash in encoded]
+        
+        directory_cid = await self._pin_directory(payloads, hashes, metadata)
+        if not directory_cid:
             # Fallback to mock mode
-            mock_cid = f"Qm{decision_hash[2:48]}"
-            return mock_cid, decision_hash
+            return mock_results
+        
+        return [
+            (f"{directory_cid}/{i}.json", decision_hash)
+            for i, decision_hash in enumerate(hashes)
+        ]
+    
+    def encode_decisions(self, decisions: List[Dict[str, Any]]) -> List[Tuple[bytes, str, str]]:
+        """
+        Canonically encode decisions and derive their CIDs and hashes locally.
+        
+        Args:
+            decisions: The decision data to encode
+            
+        Returns:
+            List of (payload, ipfs_cid, decision_hash); the CID is only valid
+            for payloads up to MAX_RAW_BLOCK_SIZE bytes
+        """
+        encoded = []
+        for decision_data in decisions:
+            if "timestamp" not in decision_data:
+                decision_data["timestamp"] = datetime.utcnow().isoformat()
+            payload = canonical_json(decision_data)
+            decision_hash = self.compute_payload_hash(payload)
+            if self.mock_mode:
+                ipfs_cid = f"Qm{decision_hash[2:48]}"
+            else:
+                ipfs_cid = self.compute_cid(payload)
+            encoded.append((payload, ipfs_cid, decision_hash))
+        return encoded
+    
+    async def pin_decisions(
+        self,
+        payloads: List[bytes],
+        hashes: List[str],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """
+        Pin decisions previously encoded with encode_decisions().
+        
+        Returns:
+            True if pinned (always True in mock mode)
+        """
+        if self.mock_mode:
+            logger.info(f"Mock IPFS pin: {len(payloads)} decisions")
+            return True
+        return await self._pin_directory(payloads, hashes, metadata) is not None
+    
+    async def _pin_directory(
+        self,
+        payloads: List[bytes],
+        hashes: List[str],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
+        """
+        Pin encoded decisions as one directory on Pinata.
+        
+        Returns:
+            Directory CID, or None if the upload failed
+        """
+        try:
+            form = aiohttp.FormData()
+            for i, payload in enumerate(payloads):
+                form.add_field(
+                    "file",
+                    payload,
+                    filename=f"decisions/{i}.json",
+                    content_type="application/json"
+                )
+            form.add_field("pinataMetadata", json.dumps(metadata or {
+                "name": f"decision_batch_{hashes[0][:10]}",
+                "keyvalues": {
+                    "type": "agent_decision_batch",
+                    "count": str(len(payloads))
+                }
+            }))
+            # CIDv1 uses raw leaves, so each file's CID matches compute_cid()
+            form.add_field("pinataOptions", json.dumps({"cidVersion": 1}))
+            
+            session = self._get_session()
+            async with session.post(
+                f"{self.pinata_api_url}/pinning/pinFileToIPFS",
+                data=form,
+                headers=self._auth_headers(),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    result = await response.json()
+                    directory_cid = result.get("IpfsHash", "")
+                    logger.info(f"Successfully uploaded {len(payloads)} decisions to IPFS: {directory_cid}")
+                    return directory_cid or None
+                else:
+                    error_text = await response.text()
+                    logger.error(f"Pinata batch upload failed: {response.status} - {error_text}")
+                    return None
+        
+        except Exception as e:
+            logger.error(f"Error uploading batch to IPFS: {e}")
+            return None
     
     async def retrieve_decision(self, ipfs_cid: str) -> Optional[Dict[str, Any]]:
         """
@@ -140,17 +372,17 @@ class IPFSService:
             return None
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.gateway_url}/{ipfs_cid}",
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data
-                    else:
-                        logger.error(f"Failed to retrieve from IPFS: {response.status}")
-                        return None
+            session = self._get_session()
+            async with session.get(
+                f"{self.gateway_url}/{ipfs_cid}",
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    return data
+                else:
+                    logger.error(f"Failed to retrieve from IPFS: {response.status}")
+                    return None
         
         except Exception as e:
             logger.error(f"Error retrieving from IPFS: {e}")
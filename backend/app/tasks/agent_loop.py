@@ -11,6 +11,7 @@ Runs agents autonomously on a schedule:
 
 from typing import Dict, Any, List, Optional, Callable
 import asyncio
+import time
 from datetime import datetime, timedelta
 from enum import Enum
 import logging
@@ -392,7 +393,7 @@ class AgentLoop:
         """
         logger.info(f"Executing task {task.task_id} for {task.wallet_address}")
         
-        start_time = datetime.utcnow()
+        start_time = time.monotonic()
         
         try:
             # Build request based on task type
@@ -418,7 +419,7 @@ class AgentLoop:
             
             # Record performance
             if self.reputation_updator:
-                response_time = (datetime.utcnow() - start_time).total_seconds()
+                response_time = time.monotonic() - start_time
                 self.reputation_updator.record_decision(
                     agent_id=f"{task.wallet_address}_{task.agent_type}",
                     agent_type=task.agent_type,
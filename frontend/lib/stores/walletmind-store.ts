@@ -330,8 +330,13 @@ export const useWalletMindStore = create<WalletMindState>((set, get) => ({
     socket.onmessage = (event) => {
       try {
         const data = JSON.parse(event.data) as WebsocketEvent;
+        // Agent updates arrive batched as { type: "multi", events: [...] } (oldest first)
+        const events =
+          data.type === "multi" && Array.isArray(data.events)
+            ? (data.events as WebsocketEvent[]).slice().reverse()
+            : [data];
         set((current) => {
-          const nextMessages = [data, ...current.websocketMessages].slice(0, MAX_MESSAGES);
+          const nextMessages = [...events, ...current.websocketMessages].slice(0, MAX_MESSAGES);
           return { websocketMessages: nextMessages };
         });
       } catch (error) {